@@ -11,7 +11,7 @@ from dotenv import load_dotenv
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from ai_doc_orchestrator.models import OutputFormat, UserInput
+from ai_doc_orchestrator.models import FinalOutput, OutputFormat, UserInput
 from ai_doc_orchestrator.orchestrator import DocumentOrchestrator
 
 # Load environment variables
@@ -90,14 +90,55 @@ def get_orchestrator():
     return DocumentOrchestrator()
 
 
-def run_async(coro):
-    """Run async function in Streamlit."""
+def get_event_loop():
+    """Get the event loop used to drive async code in Streamlit."""
     try:
         loop = asyncio.get_event_loop()
     except RuntimeError:
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
+    return loop
+
+
+def run_async(coro):
+    """Run async function in Streamlit."""
+    return get_event_loop().run_until_complete(coro)
+
+
+def iterate_async(agen):
+    """Iterate an async generator from Streamlit, one item at a time.
+
+    The generator is driven by a single task that feeds a queue, so context
+    variables it sets (such as the run's RunStats) persist across items.
+    """
+    loop = get_event_loop()
+    queue = asyncio.Queue()
+    done = object()
+
+    async def pump():
+        try:
+            async for item in agen:
+                await queue.put(item)
+        finally:
+            queue.put_nowait(done)
+
+    task = loop.create_task(pump())
+    try:
+        while True:
+            item = loop.run_until_complete(queue.get())
+            if item is done:
+                break
+            yield item
+        # Re-raise any error from the generator
+        loop.run_until_complete(task)
+    finally:
+        if not task.done():
+            task.cancel()
+            try:
+                loop.run_until_complete(task)
+            except asyncio.CancelledError:
+                pass
+        loop.run_until_complete(agen.aclose())
 
 
 def main():
@@ -195,7 +236,7 @@ def show_document_generator():
     with st.expander("📎 Add Local Files (Optional)"):
         uploaded_files = st.file_uploader(
             "Upload files to include in research",
-            type=["txt", "md", "pdf"],
+            type=["txt", "md", "pdf", "docx", "html", "htm"],
             accept_multiple_files=True,
             help="Upload local files to be included in the research phase"
         )
@@ -219,22 +260,31 @@ def show_document_generator():
             # Progress tracking
             progress_bar = st.progress(0)
             status_text = st.empty()
+            draft_preview = st.empty()
+            phase_progress = {"research": 10, "summary": 30, "writing": 50, "output": 90}
             
-            # Phase 1
-            status_text.text("Phase 1: Gathering information...")
-            progress_bar.progress(10)
-            
-            # Run the orchestrator
+            # Run the orchestrator, rendering progress and draft text as they arrive
             user_input = UserInput(topic=topic, format=OutputFormat(output_format))
-            
-            status_text.text("Phase 2: Processing and summarizing...")
-            progress_bar.progress(30)
-            
-            status_text.text("Phase 3: Writing and quality checking...")
-            progress_bar.progress(60)
-            
-            result = run_async(orchestrator.process(user_input, local_files=local_files))
-            
+            draft_text = ""
+            result = None
+            
+            for event in iterate_async(orchestrator.stream(user_input, local_files=local_files)):
+                if event.type == "phase":
+                    status_text.text(f"{event.data['message']}...")
+                    progress_bar.progress(phase_progress.get(event.phase, 0))
+                elif event.type == "draft_started":
+                    draft_text = ""
+                    status_text.text(f"Writing draft v{event.data['version']}...")
+                elif event.type == "chunk":
+                    draft_text += event.data["text"]
+                    draft_preview.markdown(draft_text)
+                elif event.type == "qc":
+                    status_text.text("Quality checking...")
+                    progress_bar.progress(75)
+                elif event.type == "output":
+                    result = FinalOutput(**event.data["final_output"])
+            
+            draft_preview.empty()
             progress_bar.progress(100)
             status_text.text("✅ Complete!")
             
@@ -336,7 +386,8 @@ def show_summarizer():
                     phase="summary",
                     data={
                         "raw_data": research_result["raw_data"],
-                        "local_files": []
+                        "local_files": [],
+                        "topic": topic,
                     }
                 )
                 summary_result = run_async(orchestrator.summary_agent.process(summary_message))
@@ -488,7 +539,11 @@ def show_blog_writer():
                 from_agent="ResearchAgent",
                 to_agent="SummaryAgent",
                 phase="summary",
-                data={"raw_data": research_result["raw_data"], "local_files": []}
+                data={
+                    "raw_data": research_result["raw_data"],
+                    "local_files": [],
+                    "topic": blog_topic,
+                }
             )
             summary_result = run_async(orchestrator.summary_agent.process(summary_message))
             
@@ -518,7 +573,16 @@ def show_blog_writer():
                     "blog_instructions": blog_instructions
                 }
             )
-            writer_result = run_async(orchestrator.writer_agent.process(writer_message))
+            writer_preview = st.empty()
+            writer_text = ""
+            writer_result = None
+            for event in iterate_async(orchestrator.writer_agent.stream(writer_message)):
+                if event.type == "chunk":
+                    writer_text += event.data["text"]
+                    writer_preview.markdown(writer_text)
+                elif event.type == "result":
+                    writer_result = event.data
+            writer_preview.empty()
             
             status_text.text("✅ Quality checking...")
             progress_bar.progress(80)
@@ -0,0 +1,151 @@
+"""Benchmark: concurrent DocumentOrchestrator runs against a latency-injecting fake model.
+
+Runs one pipeline, then N pipelines concurrently on the same event loop. With a
+non-blocking LLM path the N runs should finish in roughly the time of one.
+
+Usage:
+    python benchmarks/bench_concurrent_runs.py [--runs N] [--latency SECONDS] [--sync-only]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ai_doc_orchestrator import llm_client  # noqa: E402
+from ai_doc_orchestrator.models import OutputFormat, UserInput  # noqa: E402
+from ai_doc_orchestrator.orchestrator import DocumentOrchestrator  # noqa: E402
+
+
+class FakeResponse:
+    """Minimal stand-in for a Gemini response."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeModel:
+    """Fake GenerativeModel that sleeps for a fixed latency per call."""
+
+    latency = 0.2
+    sync_only = False
+
+    def __init__(self, model_name: str, **kwargs):
+        self.model_name = model_name
+
+    @staticmethod
+    def _answer(prompt: str, generation_config=None) -> str:
+        if (generation_config or {}).get("response_mime_type") == "application/json":
+            if '"overall_score"' in prompt:
+                return json.dumps({
+                    "approved": True, "scores": {}, "overall_score": 9,
+                    "issues": [], "feedback": "Looks good.",
+                })
+            return json.dumps({
+                "summary": "Summary of the topic.", "key_points": ["one", "two"],
+                "insights": ["insight"],
+            })
+        if "APPROVED: yes/no" in prompt:
+            return "APPROVED: yes\nISSUES:\nFEEDBACK:\nLooks good."
+        if "Generate search queries" in prompt:
+            return "query one\nquery two\nquery three"
+        # Long enough, with headings and a conclusion, to pass the draft linter
+        body = " ".join(f"Sentence {i} of generated text about the topic." for i in range(30))
+        return f"# Heading\n\n{body}\n\n## Conclusion\n\nDone."
+
+    def generate_content(self, prompt, generation_config=None, stream=False, **kwargs):
+        time.sleep(self.latency)
+        text = self._answer(prompt, generation_config)
+        if stream:
+            return [FakeResponse(part) for part in text.split(" ")]
+        return FakeResponse(text)
+
+    def __getattr__(self, name):
+        if name == "generate_content_async" and not FakeModel.sync_only:
+            return self._generate_content_async
+        raise AttributeError(name)
+
+    async def _generate_content_async(self, prompt, generation_config=None, stream=False, **kwargs):
+        await asyncio.sleep(self.latency)
+        text = self._answer(prompt, generation_config)
+        if stream:
+            return FakeStream(text)
+        return FakeResponse(text)
+
+
+class FakeStream:
+    """Async iterator over response chunks, like a streamed Gemini response."""
+
+    def __init__(self, text: str):
+        self.parts = [part + " " for part in text.split(" ")]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for part in self.parts:
+            await asyncio.sleep(0)
+            yield FakeResponse(part)
+
+
+class FakeSearchTool:
+    """Search tool stub that sleeps for a fixed latency per query."""
+
+    provider = "fake"
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def search(self, query, max_results=5, **kwargs):
+        time.sleep(self.latency)
+        return [
+            {"title": f"{query} result", "url": f"https://example.com/{query}",
+             "content": f"Content about {query}.", "score": 0.5}
+        ]
+
+
+def build_orchestrator(latency: float) -> DocumentOrchestrator:
+    """Build an orchestrator wired to the fake model and search tool."""
+    orchestrator = DocumentOrchestrator(gemini_api_key="fake-key", tavily_api_key="fake-key")
+    orchestrator.research_agent.set_search_tool(FakeSearchTool(latency))
+    return orchestrator
+
+
+async def run_many(orchestrator: DocumentOrchestrator, runs: int) -> float:
+    """Run N pipelines concurrently and return the wall time."""
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        orchestrator.process(UserInput(topic=f"Topic {i}", format=OutputFormat.TEXT))
+        for i in range(runs)
+    ])
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--sync-only", action="store_true",
+                        help="Hide the async generate path to exercise the executor fallback")
+    args = parser.parse_args()
+
+    FakeModel.latency = args.latency
+    FakeModel.sync_only = args.sync_only
+    llm_client.genai = SimpleNamespace(configure=lambda **kwargs: None, GenerativeModel=FakeModel)
+    llm_client._ClientManager = None
+
+    orchestrator = build_orchestrator(args.latency)
+    single = asyncio.run(run_many(orchestrator, 1))
+    concurrent = asyncio.run(run_many(orchestrator, args.runs))
+
+    print(f"\n1 run:          {single:.2f}s")
+    print(f"{args.runs} concurrent runs: {concurrent:.2f}s ({concurrent / single:.2f}x a single run)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Benchmark: local file ingestion, sequential vs. concurrent and cold vs. warm cache.
+
+Generates a directory of markdown and HTML attachments and times:
+  - sequential: the previous one-file-at-a-time read and chunk loop
+  - cold:       LocalFileIngestor with an empty cache
+  - warm:       the same files again (path, mtime and size hit; files are not opened)
+  - touched:    files re-saved with new mtimes (content hash hit; no re-chunking)
+
+--io-latency adds a per-read delay to model network or cloud-synced storage,
+where reading many files concurrently matters most.
+
+Usage:
+    python benchmarks/bench_local_ingest.py [--files N] [--kb N] [--io-latency SECONDS]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ai_doc_orchestrator.cache import SQLiteCache  # noqa: E402
+from ai_doc_orchestrator.context_packer import ContextPacker  # noqa: E402
+from ai_doc_orchestrator.ingest import LocalFileIngestor  # noqa: E402
+from ai_doc_orchestrator.tools.mcp_filesystem import MCPFileSystemTool  # noqa: E402
+
+WORDS = (
+    "knapsack dynamic programming greedy capacity weight value item optimal subproblem "
+    "table memoization bound heuristic approximation polynomial complexity analysis"
+).split()
+
+
+class SlowFileSystemTool(MCPFileSystemTool):
+    """File system tool that sleeps before each read, like a slow network share."""
+
+    def __init__(self, latency: float, **kwargs):
+        super().__init__(**kwargs)
+        self.latency = latency
+
+    def read_text(self, file_path, max_bytes=None):
+        time.sleep(self.latency)
+        return super().read_text(file_path, max_bytes)
+
+    def content_hash(self, path):
+        time.sleep(self.latency)
+        return super().content_hash(path)
+
+
+def make_files(directory: Path, count: int, kb: int):
+    """Write count files of about kb kilobytes each, alternating markdown and HTML."""
+    rng = random.Random(0)
+    paths = []
+    for i in range(count):
+        paragraphs = []
+        while sum(len(p) for p in paragraphs) < kb * 1024:
+            paragraphs.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 120))))
+        if i % 2:
+            body = "".join(f"<p>{p}</p>\n" for p in paragraphs)
+            path = directory / f"attachment_{i}.html"
+            path.write_text(f"<html><body><h1>Attachment {i}</h1>\n{body}</body></html>")
+        else:
+            path = directory / f"attachment_{i}.md"
+            path.write_text(f"# Attachment {i}\n\n" + "\n\n".join(paragraphs))
+        paths.append(str(path))
+    return paths
+
+
+def sequential(fs_tool: MCPFileSystemTool, packer: ContextPacker, paths, max_bytes):
+    """The previous ingestion loop: read and chunk each file in turn."""
+    chunks = []
+    for path in paths:
+        file_data = fs_tool.read_text(path, max_bytes)
+        if not file_data.get("is_binary"):
+            pieces = [
+                (text, packer.count_tokens(text))
+                for text in packer.chunk_text(file_data["content"])
+            ]
+            chunks.extend(packer.local_file_chunks(path, pieces))
+    return chunks
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=40)
+    parser.add_argument("--kb", type=int, default=64)
+    parser.add_argument("--io-latency", type=float, default=0.02)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    max_bytes = 2_000_000
+    packer = ContextPacker()
+    fs_tool = SlowFileSystemTool(args.io_latency)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        paths = make_files(directory, args.files, args.kb)
+        cache = SQLiteCache(str(directory / "ingest.sqlite"), max_entries=10 * args.files)
+        ingestor = LocalFileIngestor(
+            fs_tool, packer, cache=cache, max_bytes=max_bytes, max_concurrency=args.concurrency
+        )
+
+        def run():
+            return asyncio.run(ingestor.ingest(paths))
+
+        seq_time, seq_chunks = timed(sequential, fs_tool, packer, paths, max_bytes)
+        cold_time, cold_chunks = timed(run)
+        warm_time, warm_chunks = timed(run)
+        for path in paths:
+            os.utime(path, None)
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        touched_time, touched_chunks = timed(run)
+        cache.close()
+
+    assert len(cold_chunks) == len(warm_chunks) == len(touched_chunks)
+    print(
+        f"{args.files} files x {args.kb} KB, {args.io_latency * 1000:.0f} ms I/O latency, "
+        f"{len(cold_chunks)} chunks (sequential: {len(seq_chunks)})"
+    )
+    for name, elapsed in (
+        ("sequential", seq_time),
+        ("cold", cold_time),
+        ("warm", warm_time),
+        ("touched", touched_time),
+    ):
+        print(f"  {name:10s} {elapsed:6.3f}s  {seq_time / elapsed:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Benchmark: markdown PDF rendering throughput over the bundled sample documents.
+
+The sample PDFs in the repository root were rendered from Gemini markdown with
+the old paragraph-per-block renderer, so their text streams still hold the
+markdown source. This script recovers that text (wrapped lines within a block
+are rejoined with spaces, so multi-line lists come back as single paragraphs),
+then compares the old renderer, which built a new stylesheet per document,
+with markdown_to_flowables.
+
+Usage:
+    python benchmarks/bench_pdf_markdown.py [--rounds N]
+"""
+
+import argparse
+import base64
+import io
+import re
+import sys
+import time
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from reportlab.lib.pagesizes import letter  # noqa: E402
+from reportlab.lib.styles import getSampleStyleSheet  # noqa: E402
+from reportlab.lib.units import inch  # noqa: E402
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer  # noqa: E402
+
+from ai_doc_orchestrator.tools.pdf_markdown import markdown_to_flowables  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+_STREAM = re.compile(rb"stream\r?\n(.*?)endstream", re.S)
+_TEXT_BLOCK = re.compile(rb"BT(.*?)ET", re.S)
+_SHOWN_TEXT = re.compile(rb"\(((?:\\.|[^\\)])*)\)\s*Tj")
+_ESCAPE = re.compile(rb"\\([0-7]{1,3}|.)")
+
+
+def _unescape(text: bytes) -> str:
+    """Decode a PDF literal string."""
+    def replace(match):
+        value = match.group(1)
+        if value[:1].isdigit():
+            return bytes([int(value, 8)])
+        return {b"n": b"\n", b"r": b"\r", b"t": b"\t"}.get(value, value)
+
+    return _ESCAPE.sub(replace, text).decode("latin-1")
+
+
+def extract_source(pdf_path: Path) -> str:
+    """Recover the text blocks of a ReportLab PDF as markdown paragraphs."""
+    blocks = []
+    for stream in _STREAM.finditer(pdf_path.read_bytes()):
+        try:
+            # ReportLab writes content streams as ASCII85-encoded Flate data
+            data = zlib.decompress(base64.a85decode(stream.group(1).strip(), adobe=True))
+        except ValueError:
+            continue
+        for block in _TEXT_BLOCK.finditer(data):
+            lines = [_unescape(text) for text in _SHOWN_TEXT.findall(block.group(1))]
+            if lines:
+                blocks.append(" ".join(lines))
+    # The first block is the title added by the renderer
+    return "\n\n".join(blocks[1:])
+
+
+def legacy_flowables(content: str, title: str):
+    """Flowables as built by the previous renderer (stylesheet built per document)."""
+    story = []
+    styles = getSampleStyleSheet()
+    story.append(Paragraph(title, styles["Heading1"]))
+    story.append(Spacer(1, 0.2 * inch))
+    for para in content.split("\n\n"):
+        if para.strip():
+            story.append(Paragraph(para.strip().replace("\n", "<br/>"), styles["Normal"]))
+            story.append(Spacer(1, 0.1 * inch))
+    return story
+
+
+def build(story) -> int:
+    """Lay out a story into an in-memory PDF and return its size."""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer, pagesize=letter, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=18
+    )
+    doc.build(story)
+    return buffer.tell()
+
+
+def measure(make_story, documents, rounds: int):
+    """Time story construction and full layout over all documents."""
+    flowable_time = build_time = 0.0
+    for _ in range(rounds):
+        for title, content in documents:
+            start = time.perf_counter()
+            story = make_story(content, title)
+            flowable_time += time.perf_counter() - start
+            start = time.perf_counter()
+            build(story)
+            build_time += time.perf_counter() - start
+    return flowable_time, build_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    documents = []
+    for pdf_path in sorted(ROOT.glob("*.pdf")):
+        title = pdf_path.stem.replace("_", " ")
+        documents.append((title, extract_source(pdf_path)))
+    if not documents:
+        sys.exit("No sample PDFs found in the repository root")
+
+    total_chars = sum(len(content) for _, content in documents)
+    renders = len(documents) * args.rounds
+    print(f"{len(documents)} documents ({total_chars} characters), {args.rounds} rounds")
+
+    for name, make_story in (("legacy", legacy_flowables), ("markdown", markdown_to_flowables)):
+        try:
+            flowable_time, build_time = measure(make_story, documents, args.rounds)
+        except ValueError as e:
+            print(f"  {name:9s} failed: {e}")
+            continue
+        total = flowable_time + build_time
+        print(
+            f"  {name:9s} flowables {flowable_time * 1000 / renders:6.1f} ms/doc, "
+            f"layout {build_time * 1000 / renders:6.1f} ms/doc, {renders / total:5.1f} docs/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark: rendering several PDFs concurrently in threads vs. the process pool.
+
+ReportLab layout is pure Python and holds the GIL, so rendering N documents on
+threads takes about as long as rendering them one after another. On the process
+pool, wall time should fall with the number of workers (up to the CPU count).
+
+Usage:
+    python benchmarks/bench_pdf_rendering.py [--documents N] [--paragraphs N] [--workers N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ai_doc_orchestrator.concurrency import shutdown_process_executor  # noqa: E402
+from ai_doc_orchestrator.tools.pdf_generator import PDFGeneratorTool  # noqa: E402
+
+
+def make_content(paragraphs: int) -> str:
+    """Build a long document of distinct paragraphs."""
+    return "\n\n".join(
+        f"Paragraph {i}. " + " ".join(f"word{(i * 7 + j) % 97}" for j in range(120))
+        for i in range(paragraphs)
+    )
+
+
+async def render_all(tool: PDFGeneratorTool, content: str, documents: int) -> float:
+    """Render documents concurrently and return the wall time."""
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        tool.agenerate_pdf(content, f"doc_{i}", title=f"Document {i}")
+        for i in range(documents)
+    ))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=8)
+    parser.add_argument("--paragraphs", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    os.environ["AI_DOC_PROCESS_WORKERS"] = str(args.workers)
+    content = make_content(args.paragraphs)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        threaded = PDFGeneratorTool(output_dir=output_dir, use_processes=False)
+        pooled = PDFGeneratorTool(output_dir=output_dir, use_processes=True)
+
+        # Warm up the pool so worker start-up is not counted
+        asyncio.run(render_all(pooled, content, args.workers))
+
+        thread_time = asyncio.run(render_all(threaded, content, args.documents))
+        process_time = asyncio.run(render_all(pooled, content, args.documents))
+        shutdown_process_executor()
+
+    print(f"{args.documents} documents x {args.paragraphs} paragraphs, {args.workers} worker(s)")
+    print(f"  threads:      {thread_time:.2f}s")
+    print(f"  process pool: {process_time:.2f}s")
+    print(f"  speedup:      {thread_time / process_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark: ResearchAgent search fan-out against a stub Tavily client.
+
+Each query gets a different injected latency. With concurrent fan-out, Phase 1
+wall time should be close to max(query latency) rather than the sum.
+
+Usage:
+    python benchmarks/bench_research_fanout.py [--queries N] [--latency SECONDS]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from ai_doc_orchestrator import llm_client  # noqa: E402
+from ai_doc_orchestrator.agents.research import ResearchAgent  # noqa: E402
+from ai_doc_orchestrator.models import AgentMessage  # noqa: E402
+from ai_doc_orchestrator.tools.search import SearchTool  # noqa: E402
+
+
+class StubTavilyClient:
+    """Tavily client stub that sleeps for a per-query latency."""
+
+    def __init__(self, latencies):
+        self.latencies = latencies
+
+    def search(self, query, max_results=5, **kwargs):
+        time.sleep(self.latencies[query])
+        return {
+            "results": [
+                {"title": query, "url": f"https://example.com/{query}",
+                 "content": f"Content for {query}", "score": 0.5}
+            ]
+        }
+
+
+class FakeModel:
+    """Fake GenerativeModel that returns a fixed list of queries."""
+
+    queries = []
+
+    def __init__(self, model_name: str, **kwargs):
+        self.model_name = model_name
+
+    async def generate_content_async(self, prompt, generation_config=None, **kwargs):
+        return SimpleNamespace(text="\n".join(self.queries))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.3)
+    args = parser.parse_args()
+
+    queries = [f"query-{i}" for i in range(args.queries)]
+    latencies = {q: args.latency * (1 + i / args.queries) for i, q in enumerate(queries)}
+    FakeModel.queries = queries
+    llm_client.genai = SimpleNamespace(configure=lambda **kwargs: None, GenerativeModel=FakeModel)
+    llm_client._ClientManager = None
+
+    search_tool = SearchTool(api_key="fake-key")
+    search_tool.client = StubTavilyClient(latencies)
+    agent = ResearchAgent(gemini_api_key="fake-key")
+    agent.set_search_tool(search_tool)
+
+    message = AgentMessage(
+        from_agent="Benchmark", to_agent="ResearchAgent", phase="research",
+        data={"topic": "fan-out", "format": "text"},
+    )
+    start = time.perf_counter()
+    result = asyncio.run(agent.process(message))
+    elapsed = time.perf_counter() - start
+
+    order = [s["title"] for s in result["raw_data"]["sources"]]
+    print(f"sum(latency): {sum(latencies.values()):.2f}s")
+    print(f"max(latency): {max(latencies.values()):.2f}s")
+    print(f"wall time:    {elapsed:.2f}s")
+    print(f"merged order preserved: {order == queries}")
+
+
+if __name__ == "__main__":
+    main()
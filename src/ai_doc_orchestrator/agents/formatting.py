@@ -3,6 +3,8 @@
 from typing import Any, Dict, Optional
 
 from ai_doc_orchestrator.base_agent import BaseAgent
+from ai_doc_orchestrator.concurrency import run_blocking
+from ai_doc_orchestrator.llm_client import ModelRegistry
 from ai_doc_orchestrator.models import AgentMessage, Draft, FinalOutput, OutputFormat
 from ai_doc_orchestrator.tools.google_docs import GoogleDocsTool
 from ai_doc_orchestrator.tools.pdf_generator import PDFGeneratorTool
@@ -11,9 +13,14 @@ from ai_doc_orchestrator.tools.pdf_generator import PDFGeneratorTool
 class FormattingAgent(BaseAgent):
     """Agent responsible for formatting approved drafts into final outputs."""
 
-    def __init__(self, gemini_api_key=None, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        gemini_api_key=None,
+        model: str = "gemini-2.5-flash",
+        model_registry: Optional[ModelRegistry] = None,
+    ):
         """Initialize the Formatting Agent."""
-        super().__init__("FormattingAgent", gemini_api_key, model)
+        super().__init__("FormattingAgent", gemini_api_key, model, model_registry)
         self.google_docs_tool: Optional[GoogleDocsTool] = None
         self.pdf_tool: Optional[PDFGeneratorTool] = None
 
@@ -59,7 +66,8 @@ class FormattingAgent(BaseAgent):
             if not self.google_docs_tool:
                 raise ValueError("Google Docs tool not set. Call set_google_docs_tool() first.")
             
-            result = self.google_docs_tool.create_document(
+            result = await run_blocking(
+                self.google_docs_tool.create_document,
                 title=topic or "Document",
                 content=draft.content,
             )
@@ -79,7 +87,7 @@ class FormattingAgent(BaseAgent):
             
             # Generate filename from topic
             filename = topic.lower().replace(" ", "_").replace("/", "_")[:50]
-            result = self.pdf_tool.generate_pdf(
+            result = await self.pdf_tool.agenerate_pdf(
                 content=draft.content,
                 filename=filename,
                 title=topic,
@@ -1,24 +1,86 @@
 """Quality Check Agent - Phase 3: Iteration."""
 
-from typing import Any, Dict
+import re
+from typing import Any, Dict, List, Optional, Set
 
 from ai_doc_orchestrator.base_agent import BaseAgent
-from ai_doc_orchestrator.models import AgentMessage, Draft, QCFeedback
+from ai_doc_orchestrator.draft_linter import DraftLinter
+from ai_doc_orchestrator.llm_client import ModelRegistry
+from ai_doc_orchestrator.models import AgentMessage, Draft, QCFeedback, QCIssue
+from ai_doc_orchestrator.sections import format_sections, split_sections
+
+# Issue lines may start with the anchor of the section they refer to, e.g. "[introduction]"
+_ISSUE_ANCHOR_PATTERN = re.compile(r"^\[([^\]]+)\]\s*:?\s*(.*)$")
+
+# Dimensions scored in structured verdicts (1-10 each)
+QC_DIMENSIONS = ["clarity", "completeness", "accuracy", "structure", "relevance"]
+
+# JSON schema for structured QC verdicts (mirrors QCFeedback)
+QC_VERDICT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "approved": {"type": "boolean"},
+        "scores": {
+            "type": "object",
+            "properties": {dimension: {"type": "number"} for dimension in QC_DIMENSIONS},
+            "required": QC_DIMENSIONS,
+        },
+        "overall_score": {"type": "number"},
+        "issues": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "section": {"type": "string"},
+                    "description": {"type": "string"},
+                },
+                "required": ["description"],
+            },
+        },
+        "feedback": {"type": "string"},
+    },
+    "required": ["approved", "scores", "overall_score", "issues", "feedback"],
+}
 
 
 class QCAgent(BaseAgent):
     """Agent responsible for quality checking drafts."""
 
-    def __init__(self, gemini_api_key=None, model: str = "gemini-2.5-flash"):
-        """Initialize the QC Agent."""
-        super().__init__("QCAgent", gemini_api_key, model)
+    def __init__(
+        self,
+        gemini_api_key=None,
+        model: str = "gemini-2.5-flash",
+        model_registry: Optional[ModelRegistry] = None,
+        structured_output: bool = True,
+        linter: Optional[DraftLinter] = None,
+    ):
+        """Initialize the QC Agent.
+
+        Args:
+            gemini_api_key: Google Gemini API key
+            model: Model to use for LLM calls
+            model_registry: Shared model registry (a private one is created if None)
+            structured_output: Request a schema-validated JSON verdict with scores
+                (falls back to the free-text verdict format if parsing fails)
+            linter: Draft linter run before the LLM review (defaults to DraftLinter())
+        """
+        super().__init__("QCAgent", gemini_api_key, model, model_registry)
         self.max_iterations = 3
+        self.structured_output = structured_output
+        self.linter = linter or DraftLinter()
 
     async def process(self, message: AgentMessage) -> Dict[str, Any]:
         """Process draft and provide quality check feedback.
 
+        Drafts that fail the linter are rejected without an LLM call. Sections
+        listed in the message's changed_sections, and sections whose anchors are
+        not in previous_sections (added by the rewrite), are reviewed in full;
+        other sections were approved in an earlier round and are shown by heading
+        only.
+
         Args:
-            message: Message containing draft
+            message: Message containing draft and optional changed_sections and
+                previous_sections (anchors of the previous draft)
 
         Returns:
             Dictionary with QC feedback
@@ -27,6 +89,50 @@ class QCAgent(BaseAgent):
         draft = Draft(**draft_dict)
         topic = message.data.get("topic", "")
         format_type = message.data.get("format", "")
+        changed_sections = message.data.get("changed_sections")
+        previous_sections = message.data.get("previous_sections")
+
+        sections = draft.sections or split_sections(draft.content)
+        anchors = {section.anchor for section in sections}
+        if changed_sections and previous_sections is not None:
+            changed_sections = set(changed_sections) | (anchors - set(previous_sections))
+
+        # Mechanical problems are reported without paying for an LLM review
+        lint_issues = self.linter.lint(draft.content, topic, sections)
+        if lint_issues:
+            issues = [
+                f"[{issue.section}] {issue.description}" if issue.section else issue.description
+                for issue in lint_issues
+            ]
+            print(f"Draft version {draft.version} failed {len(lint_issues)} lint check(s)")
+            approved = draft.version >= self.max_iterations
+            qc_feedback = QCFeedback(
+                approved=approved,
+                feedback=None if approved else "Draft failed automated checks:\n"
+                + "\n".join(f"- {issue}" for issue in issues),
+                issues=issues,
+                section_issues=[] if approved else lint_issues,
+                reviewer="linter",
+            )
+            return {
+                "phase": "qc",
+                "qc_feedback": qc_feedback.dict(),
+                "status": "completed",
+            }
+        if changed_sections:
+            reviewed = [section for section in sections if section.anchor in changed_sections]
+            unchanged = "\n".join(
+                f"- [{section.anchor}] {section.heading or '(introduction)'}"
+                for section in sections
+                if section.anchor not in changed_sections
+            )
+            draft_text = f"""Revised Sections:
+{format_sections(reviewed)}
+
+Unchanged Sections (already reviewed):
+{unchanged or "- none"}"""
+        else:
+            draft_text = format_sections(sections) if sections else draft.content
 
         # Quality check prompt
         system_prompt = """You are a quality assurance expert for document review. Evaluate documents 
@@ -38,8 +144,137 @@ Target Format: {format_type}
 Draft Version: {draft.version}
 
 Draft Content:
-{draft.content}
+{draft_text}
+"""
+
+        verdict = None
+        if self.structured_output:
+            verdict = await self._structured_verdict(system_prompt, user_prompt, anchors)
+            if verdict is None:
+                print("Structured QC verdict could not be parsed, falling back to text verdict")
+        if verdict is None:
+            verdict = await self._text_verdict(system_prompt, user_prompt, anchors)
+        approved = verdict["approved"]
+        feedback = verdict["feedback"]
+
+        # Check iteration limit
+        if draft.version >= self.max_iterations:
+            approved = True
+            feedback = "Maximum iterations reached. Approving current draft."
+
+        qc_feedback = QCFeedback(
+            approved=approved,
+            feedback=feedback if not approved else None,
+            issues=verdict["issues"],
+            section_issues=verdict["section_issues"] if not approved else [],
+            scores=verdict["scores"],
+            overall_score=verdict["overall_score"],
+        )
+
+        return {
+            "phase": "qc",
+            "qc_feedback": qc_feedback.dict(),
+            "status": "completed",
+        }
+
+    async def _structured_verdict(
+        self, system_prompt: str, user_prompt: str, anchors: Set[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Get a scored verdict from one JSON-mode call.
+
+        Args:
+            system_prompt: QC system prompt
+            user_prompt: Prompt with the topic and draft
+            anchors: Anchors of the draft's sections
 
+        Returns:
+            Verdict dictionary, or None if the response could not be parsed
+        """
+        dimensions = ", ".join(QC_DIMENSIONS)
+        prompt = f"""{user_prompt}
+Evaluate this draft and return a JSON object with:
+- "scores": a score from 1 to 10 for each of {dimensions}
+- "overall_score": overall quality from 1 to 10
+- "approved": whether the draft is ready for final formatting
+- "issues": specific issues to address, each with a "description" and the "section" anchor 
+  from the [section: ...] marker it applies to (empty for document-wide issues)
+- "feedback": constructive feedback for improvement"""
+
+        try:
+            response_text = await self._acall_llm(
+                system_prompt,
+                prompt,
+                temperature=0.3,
+                extra_config={
+                    "response_mime_type": "application/json",
+                    "response_schema": QC_VERDICT_SCHEMA,
+                },
+                step="review",
+            )
+        except Exception as e:
+            print(f"Structured QC call failed: {e}")
+            return None
+
+        data = self._parse_json(response_text)
+        if data is None or not isinstance(data.get("approved"), bool):
+            return None
+
+        scores: Dict[str, float] = {}
+        raw_scores = data.get("scores")
+        if isinstance(raw_scores, dict):
+            for dimension, value in raw_scores.items():
+                try:
+                    scores[str(dimension)] = float(value)
+                except (TypeError, ValueError):
+                    continue
+        try:
+            overall_score: Optional[float] = float(data.get("overall_score"))
+        except (TypeError, ValueError):
+            overall_score = sum(scores.values()) / len(scores) if scores else None
+
+        issues: List[str] = []
+        section_issues: List[QCIssue] = []
+        raw_issues = data.get("issues")
+        for item in raw_issues if isinstance(raw_issues, list) else []:
+            if isinstance(item, dict):
+                description = str(item.get("description", "")).strip()
+                section = str(item.get("section") or "").strip().strip("[]")
+            else:
+                description, section = str(item).strip(), ""
+            if not description:
+                continue
+            if section in anchors:
+                issues.append(f"[{section}] {description}")
+                section_issues.append(QCIssue(section=section, description=description))
+            else:
+                issues.append(description)
+                section_issues.append(QCIssue(description=description))
+
+        feedback = data.get("feedback")
+        return {
+            "approved": data["approved"],
+            "feedback": (feedback.strip() if isinstance(feedback, str) else "")
+            or "\n".join(f"- {issue}" for issue in issues),
+            "issues": issues,
+            "section_issues": section_issues,
+            "scores": scores,
+            "overall_score": overall_score,
+        }
+
+    async def _text_verdict(
+        self, system_prompt: str, user_prompt: str, anchors: Set[str]
+    ) -> Dict[str, Any]:
+        """Get a verdict in the free-text APPROVED/ISSUES/FEEDBACK format.
+
+        Args:
+            system_prompt: QC system prompt
+            user_prompt: Prompt with the topic and draft
+            anchors: Anchors of the draft's sections
+
+        Returns:
+            Verdict dictionary (without scores)
+        """
+        prompt = f"""{user_prompt}
 Evaluate this draft and determine:
 1. Is it approved for final formatting? (yes/no)
 2. If not approved, what specific issues need to be addressed?
@@ -48,11 +283,12 @@ Evaluate this draft and determine:
 Format your response as:
 APPROVED: yes/no
 ISSUES:
-- [list specific issues]
+- [section-anchor] issue description (use the anchor from the [section: ...] marker; 
+  omit the anchor for document-wide issues)
 FEEDBACK:
 [detailed feedback]"""
 
-        qc_response = self._call_llm(system_prompt, user_prompt, temperature=0.3)
+        qc_response = await self._acall_llm(system_prompt, prompt, temperature=0.3, step="review")
 
         # Parse the response
         approved = "APPROVED: yes" in qc_response.lower() or "approved: yes" in qc_response.lower()
@@ -63,6 +299,17 @@ FEEDBACK:
             issues_section = qc_response.split("ISSUES:")[1].split("FEEDBACK:")[0]
             issues = [i.strip().lstrip("- ") for i in issues_section.split("\n") if i.strip()]
 
+        # Tie issues to sections where the reviewer named a known anchor
+        section_issues = []
+        for issue in issues:
+            match = _ISSUE_ANCHOR_PATTERN.match(issue)
+            if match and match.group(1).strip() in anchors:
+                section_issues.append(
+                    QCIssue(section=match.group(1).strip(), description=match.group(2))
+                )
+            else:
+                section_issues.append(QCIssue(description=issue))
+
         # Extract feedback
         feedback = ""
         if "FEEDBACK:" in qc_response:
@@ -70,20 +317,11 @@ FEEDBACK:
         elif not approved:
             feedback = qc_response
 
-        # Check iteration limit
-        if draft.version >= self.max_iterations:
-            approved = True
-            feedback = "Maximum iterations reached. Approving current draft."
-
-        qc_feedback = QCFeedback(
-            approved=approved,
-            feedback=feedback if not approved else None,
-            issues=issues,
-        )
-
         return {
-            "phase": "qc",
-            "qc_feedback": qc_feedback.dict(),
-            "status": "completed",
+            "approved": approved,
+            "feedback": feedback,
+            "issues": issues,
+            "section_issues": section_issues,
+            "scores": {},
+            "overall_score": None,
         }
-
@@ -1,19 +1,48 @@
 """Research Agent - Phase 1: Information Gathering."""
 
-from typing import Any, Dict
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from ai_doc_orchestrator.base_agent import BaseAgent
-from ai_doc_orchestrator.models import AgentMessage, RawData
+from ai_doc_orchestrator.concurrency import run_blocking
+from ai_doc_orchestrator.dedup import SourceDeduplicator
+from ai_doc_orchestrator.llm_client import ModelRegistry
+from ai_doc_orchestrator.models import AgentMessage, PipelineEvent, RawData
 from ai_doc_orchestrator.tools.search import SearchTool
 
 
 class ResearchAgent(BaseAgent):
     """Agent responsible for gathering raw data through web search."""
 
-    def __init__(self, gemini_api_key=None, model: str = "gemini-2.5-flash"):
-        """Initialize the Research Agent."""
-        super().__init__("ResearchAgent", gemini_api_key, model)
+    def __init__(
+        self,
+        gemini_api_key=None,
+        model: str = "gemini-2.5-flash",
+        model_registry: Optional[ModelRegistry] = None,
+        max_concurrent_searches: int = 5,
+        search_timeout: Optional[float] = 30.0,
+        results_per_query: int = 3,
+        near_duplicate_distance: Optional[int] = 10,
+    ):
+        """Initialize the Research Agent.
+
+        Args:
+            gemini_api_key: Google Gemini API key
+            model: Model to use for LLM calls
+            model_registry: Shared model registry (a private one is created if None)
+            max_concurrent_searches: Maximum number of search queries in flight at once
+            search_timeout: Per-query timeout in seconds (None disables the timeout)
+            results_per_query: Maximum results requested per search query
+            near_duplicate_distance: Largest SimHash distance at which two results count
+                as copies of the same content (None keeps near-duplicates; repeated
+                URLs are always removed)
+        """
+        super().__init__("ResearchAgent", gemini_api_key, model, model_registry)
         self.search_tool: SearchTool = None
+        self.max_concurrent_searches = max(1, max_concurrent_searches)
+        self.search_timeout = search_timeout
+        self.results_per_query = results_per_query
+        self.near_duplicate_distance = near_duplicate_distance
 
     def set_search_tool(self, search_tool: SearchTool):
         """Set the search tool to use.
@@ -33,6 +62,27 @@ class ResearchAgent(BaseAgent):
         Returns:
             Dictionary with raw data collected
         """
+        result: Dict[str, Any] = {}
+        async for event in self.stream(message):
+            if event.type == "result":
+                result = event.data
+        return result
+
+    async def stream(self, message: AgentMessage) -> AsyncIterator[PipelineEvent]:
+        """Run the research, yielding each query's results as soon as they arrive.
+
+        Args:
+            message: Message containing topic and format
+
+        Repeated URLs and near-duplicate content are removed before results are
+        yielded, so each source reaches the summary stage once. The result event
+        deduplicates all results again in query order, so its sources do not
+        depend on which search finished first.
+
+        Yields:
+            One 'sources' event per query (data: query, sources) in completion order,
+            then one 'result' event whose data is the same dictionary process() returns
+        """
         topic = message.data.get("topic", "")
         format_type = message.data.get("format", "")
 
@@ -44,27 +94,84 @@ class ResearchAgent(BaseAgent):
         to gather comprehensive information. Return only a list of 3-5 search queries, one per line."""
         user_prompt = f"Topic: {topic}\n\nGenerate search queries:"
 
-        queries_text = self._call_llm(system_prompt, user_prompt, temperature=0.7)
+        queries_text = await self._acall_llm(
+            system_prompt, user_prompt, temperature=0.7, step="queries"
+        )
         queries = [q.strip() for q in queries_text.split("\n") if q.strip()][:5]
 
-        # Perform searches
-        all_results = []
-        for query in queries:
-            try:
-                results = self.search_tool.search(query, max_results=3)
-                all_results.extend(results)
-            except Exception as e:
-                print(f"Error searching for '{query}': {e}")
+        # Perform searches concurrently; results are merged in query order
+        semaphore = asyncio.Semaphore(self.max_concurrent_searches)
+
+        async def search(index: int, query: str):
+            return index, await self._search_query(query, semaphore)
+
+        tasks = [asyncio.ensure_future(search(i, query)) for i, query in enumerate(queries)]
+        per_query: List[List[Dict[str, Any]]] = [[] for _ in queries]
+        streamed = SourceDeduplicator(self.near_duplicate_distance)
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, results = await next_done
+                per_query[index] = results
+                yield PipelineEvent(
+                    type="sources",
+                    phase="research",
+                    data={"query": queries[index], "sources": streamed.dedupe(results)},
+                )
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        # Deduplicate again in query order so the result does not depend on timing
+        deduplicator = SourceDeduplicator(self.near_duplicate_distance)
+        all_results = deduplicator.dedupe(
+            [result for results in per_query for result in results]
+        )
+        dedup_report = deduplicator.report()
+        if dedup_report["removed"]:
+            print(
+                f"Removed {dedup_report['duplicate_urls']} repeated URL(s) and "
+                f"{dedup_report['near_duplicates']} near-duplicate source(s)"
+            )
 
         # Create RawData object
         raw_data = RawData(
             sources=all_results,
             search_queries=queries,
+            metadata={"dedup": dedup_report},
         )
 
-        return {
-            "phase": "research",
-            "raw_data": raw_data.dict(),
-            "status": "completed",
-        }
+        yield PipelineEvent(
+            type="result",
+            phase="research",
+            data={
+                "phase": "research",
+                "raw_data": raw_data.dict(),
+                "status": "completed",
+            },
+        )
+
+    async def _search_query(
+        self, query: str, semaphore: asyncio.Semaphore
+    ) -> List[Dict[str, Any]]:
+        """Run a single search query under the concurrency cap and timeout.
+
+        Args:
+            query: Search query
+            semaphore: Semaphore bounding concurrent searches
 
+        Returns:
+            List of search results (empty if the search failed or timed out)
+        """
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    run_blocking(
+                        self.search_tool.search, query, max_results=self.results_per_query
+                    ),
+                    timeout=self.search_timeout,
+                )
+            except asyncio.TimeoutError:
+                print(f"Search for '{query}' timed out after {self.search_timeout}s")
+            except Exception as e:
+                print(f"Error searching for '{query}': {e}")
+        return []
@@ -1,19 +1,80 @@
 """Summary Agent - Phase 2: Processing."""
 
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from ai_doc_orchestrator.base_agent import BaseAgent
-from ai_doc_orchestrator.models import AgentMessage, RawData, StructuredNotes
+from ai_doc_orchestrator.cache import SQLiteCache
+from ai_doc_orchestrator.context_packer import (
+    ContextChunk,
+    ContextPacker,
+    format_chunks,
+    group_chunks,
+)
+from ai_doc_orchestrator.ingest import LocalFileIngestor
+from ai_doc_orchestrator.llm_client import ModelRegistry
+from ai_doc_orchestrator.models import AgentMessage, PipelineEvent, RawData, StructuredNotes
+from ai_doc_orchestrator.rate_limit import estimate_tokens
 from ai_doc_orchestrator.tools.mcp_filesystem import MCPFileSystemTool
 
+# JSON schema for single-call structured summaries (mirrors StructuredNotes)
+SUMMARY_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "key_points": {"type": "array", "items": {"type": "string"}},
+        "insights": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["summary", "key_points", "insights"],
+}
+
 
 class SummaryAgent(BaseAgent):
     """Agent responsible for summarizing raw data into structured notes."""
 
-    def __init__(self, gemini_api_key=None, model: str = "gemini-2.5-flash"):
-        """Initialize the Summary Agent."""
-        super().__init__("SummaryAgent", gemini_api_key, model)
+    def __init__(
+        self,
+        gemini_api_key=None,
+        model: str = "gemini-2.5-flash",
+        model_registry: Optional[ModelRegistry] = None,
+        context_packer: Optional[ContextPacker] = None,
+        map_reduce_threshold: Optional[int] = 24000,
+        map_chunk_tokens: int = 8000,
+        map_concurrency: int = 4,
+        reduce_fan_in: int = 4,
+        structured_output: bool = True,
+        local_file_max_bytes: Optional[int] = 2_000_000,
+        ingest_concurrency: int = 8,
+    ):
+        """Initialize the Summary Agent.
+
+        Args:
+            gemini_api_key: Google Gemini API key
+            model: Model to use for LLM calls
+            model_registry: Shared model registry (a private one is created if None)
+            context_packer: Packer that fits source content into the prompt's token budget
+            map_reduce_threshold: Input size in tokens above which map-reduce summarization
+                is used instead of packing (None disables map-reduce)
+            map_chunk_tokens: Maximum tokens of source content per map call
+            map_concurrency: Maximum number of map/reduce calls in flight at once
+            reduce_fan_in: Number of partial summaries combined per reduce call
+            structured_output: Get the summary, key points and insights from one JSON-mode
+                call (falls back to separate summary and key point calls if parsing fails)
+            local_file_max_bytes: Bytes read from each local file; the rest is ignored
+                (None reads whole files)
+            ingest_concurrency: Maximum number of local files read at once
+        """
+        super().__init__("SummaryAgent", gemini_api_key, model, model_registry)
         self.fs_tool: Optional[MCPFileSystemTool] = None
+        self.context_packer = context_packer or ContextPacker()
+        self.map_reduce_threshold = map_reduce_threshold
+        self.map_chunk_tokens = map_chunk_tokens
+        self.map_concurrency = max(1, map_concurrency)
+        self.reduce_fan_in = max(2, reduce_fan_in)
+        self.structured_output = structured_output
+        self.local_file_max_bytes = local_file_max_bytes
+        self.ingest_concurrency = ingest_concurrency
+        self.ingest_cache: Optional[SQLiteCache] = None
 
     def set_filesystem_tool(self, fs_tool: MCPFileSystemTool):
         """Set the file system tool to use.
@@ -24,6 +85,14 @@ class SummaryAgent(BaseAgent):
         self.fs_tool = fs_tool
         self.register_tool("read_file", fs_tool)
 
+    def set_ingest_cache(self, cache: Optional[SQLiteCache]):
+        """Set the persistent cache of normalized and chunked local files.
+
+        Args:
+            cache: SQLiteCache instance (None disables caching)
+        """
+        self.ingest_cache = cache
+
     async def process(self, message: AgentMessage) -> Dict[str, Any]:
         """Process raw data and create structured notes.
 
@@ -35,45 +104,291 @@ class SummaryAgent(BaseAgent):
         """
         raw_data_dict = message.data.get("raw_data", {})
         raw_data = RawData(**raw_data_dict)
+        topic = message.data.get("topic", "")
+
+        local_chunks = await self._ingest_local_files(message.data.get("local_files", []))
+        chunks = self._dedupe(
+            self.context_packer.build_chunks(raw_data.sources) + local_chunks, set()
+        )
+        return await self._summarize(topic, chunks, raw_data)
+
+    async def process_pipelined(
+        self, message: AgentMessage, events: "asyncio.Queue[Optional[PipelineEvent]]"
+    ) -> Dict[str, Any]:
+        """Create structured notes while research results are still arriving.
+
+        Consumes ResearchAgent.stream() events from a queue: 'sources' events are
+        chunked and deduplicated as they arrive, and once the input is large enough
+        for map-reduce, full chunk groups are summarized immediately. If map-reduce
+        has not started when the result event arrives, the chunks are rebuilt from
+        its query-ordered sources. Local files
+        are read concurrently. The final summary is written when None is received.
+
+        Args:
+            message: Message containing topic and local_files (no raw_data)
+            events: Queue of research events, closed with None
+
+        Returns:
+            Dictionary with structured notes (same shape as process())
+        """
+        topic = message.data.get("topic", "")
+        local_files_task = asyncio.ensure_future(
+            self._ingest_local_files(message.data.get("local_files", []))
+        )
+
+        raw_data = RawData()
+        chunks: List[ContextChunk] = []
+        seen: set = set()
+        map_stage: Optional[_MapStage] = None
+
+        def add(new_chunks: List[ContextChunk]):
+            nonlocal map_stage
+            fresh = self._dedupe(new_chunks, seen)
+            chunks.extend(fresh)
+            if map_stage is None:
+                if self._needs_map_reduce(sum(chunk.tokens for chunk in chunks)):
+                    map_stage = self._map_stage(topic)
+                    map_stage.add(chunks)
+            else:
+                map_stage.add(fresh)
+
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                if event.type == "sources":
+                    add(self.context_packer.build_chunks(event.data["sources"]))
+                elif event.type == "result":
+                    raw_data = RawData(**event.data["raw_data"])
+                    if map_stage is None:
+                        # Nothing summarized yet: rebuild from the timing-independent
+                        # result so the prompt (and its cache key) is the same every run
+                        chunks.clear()
+                        seen.clear()
+                        add(self.context_packer.build_chunks(raw_data.sources))
+            add(await local_files_task)
+        except BaseException:
+            local_files_task.cancel()
+            if map_stage is not None:
+                map_stage.cancel()
+            raise
+
+        return await self._summarize(topic, chunks, raw_data, map_stage)
+
+    async def _ingest_local_files(self, file_paths: List[str]) -> List[ContextChunk]:
+        """Read and chunk local files concurrently, reusing cached ingestions.
+
+        Files are streamed up to local_file_max_bytes, so memory use does not grow
+        with file size.
+
+        Args:
+            file_paths: Local file paths
+
+        Returns:
+            Chunks of the files in order (unreadable and binary files are skipped)
+        """
+        if not self.fs_tool or not file_paths:
+            return []
+        ingestor = LocalFileIngestor(
+            self.fs_tool,
+            self.context_packer,
+            cache=self.ingest_cache,
+            max_bytes=self.local_file_max_bytes,
+            max_concurrency=self.ingest_concurrency,
+        )
+        return await ingestor.ingest(file_paths)
+
+    @staticmethod
+    def _dedupe(chunks: List[ContextChunk], seen: set) -> List[ContextChunk]:
+        """Drop chunks whose text (ignoring case and whitespace) was already seen.
+
+        Args:
+            chunks: Candidate chunks
+            seen: Keys of chunks kept so far; updated in place
+
+        Returns:
+            Chunks not seen before, in order
+        """
+        fresh = []
+        for chunk in chunks:
+            key = " ".join(chunk.text.lower().split())
+            if key not in seen:
+                seen.add(key)
+                fresh.append(chunk)
+        return fresh
+
+    def _needs_map_reduce(self, input_tokens: int) -> bool:
+        """Check whether input of this size is condensed with map-reduce."""
+        return self.map_reduce_threshold is not None and input_tokens > self.map_reduce_threshold
+
+    async def _summarize(
+        self,
+        topic: str,
+        chunks: List[ContextChunk],
+        raw_data: RawData,
+        map_stage: Optional["_MapStage"] = None,
+    ) -> Dict[str, Any]:
+        """Create structured notes from source chunks.
+
+        Args:
+            topic: Document topic
+            chunks: Deduplicated source and local file chunks
+            raw_data: Raw research data the chunks came from
+            map_stage: Map stage already summarizing the chunks, if any
+
+        Returns:
+            Dictionary with structured notes
+        """
+        # Collect source references
+        sources_list = [
+            source.get("url", "") for source in raw_data.sources if source.get("content")
+        ]
+
+        input_tokens = sum(chunk.tokens for chunk in chunks)
+        summary_metadata: Dict[str, Any] = {}
+        if "dedup" in raw_data.metadata:
+            summary_metadata["dedup"] = raw_data.metadata["dedup"]
+
+        if map_stage is None and self._needs_map_reduce(input_tokens):
+            map_stage = self._map_stage(topic)
+            map_stage.add(chunks)
+
+        if map_stage is not None:
+            # Too much input for one prompt: condense it with map-reduce first
+            partials = await map_stage.finish()
+            research_content, summary_metadata["map_reduce"] = await self._reduce(
+                topic, partials, input_tokens
+            )
+        else:
+            # Fit the most relevant content into the prompt's token budget
+            packed = self.context_packer.pack_chunks(topic, chunks)
+            research_content = packed["content"]
+            packing_report = packed["report"]
+            summary_metadata["context_packing"] = packing_report
+            if packing_report["dropped_chunks"]:
+                print(
+                    f"Context packing dropped {len(packing_report['dropped_chunks'])} of "
+                    f"{packing_report['chunks_total']} chunks to fit "
+                    f"{packing_report['token_budget']} tokens"
+                )
+
+        summary_text = ""
+        key_points: List[str] = []
+        insights: List[str] = []
+        if self.structured_output:
+            parsed = await self._structured_summary(research_content)
+            if parsed is not None:
+                summary_text = parsed["summary"]
+                key_points = parsed["key_points"]
+                insights = parsed["insights"]
+                summary_metadata["summary_mode"] = "structured"
+            else:
+                print("Structured summary could not be parsed, falling back to two calls")
+
+        if not summary_text:
+            summary_text, key_points = await self._two_call_summary(research_content)
+            summary_metadata["summary_mode"] = "two_call"
+
+        # Create StructuredNotes
+        structured_notes = StructuredNotes(
+            summary=summary_text,
+            key_points=key_points,
+            insights=insights,
+            sources=sources_list,
+            metadata={
+                "num_sources": len(sources_list),
+                "search_queries": raw_data.search_queries,
+                **summary_metadata,
+            },
+        )
 
-        # Collect all content from sources
-        all_content = []
-        sources_list = []
-        for source in raw_data.sources:
-            content = source.get("content", "")
-            title = source.get("title", "")
-            url = source.get("url", "")
-            if content:
-                all_content.append(f"Source: {title}\nURL: {url}\n\n{content}\n")
-                sources_list.append(url)
-
-        combined_content = "\n---\n\n".join(all_content)
-
-        # Check if there are any local file references to include
-        local_content = ""
-        if self.fs_tool and message.data.get("local_files"):
-            for file_path in message.data.get("local_files", []):
-                try:
-                    file_data = self.fs_tool.read_file(file_path)
-                    if not file_data.get("is_binary"):
-                        local_content += f"\n\nLocal File: {file_path}\n{file_data['content']}\n"
-                except Exception as e:
-                    print(f"Error reading file {file_path}: {e}")
+        return {
+            "phase": "summary",
+            "structured_notes": structured_notes.dict(),
+            "status": "completed",
+        }
+
+    async def _structured_summary(self, research_content: str) -> Optional[Dict[str, Any]]:
+        """Create the summary, key points and insights with one JSON-mode call.
+
+        Args:
+            research_content: Packed or condensed research content
 
+        Returns:
+            Dictionary with summary, key_points and insights, or None if the
+            response could not be parsed
+        """
+        system_prompt = """You are a summarization expert. Analyze the provided research content 
+        and return a JSON object with a comprehensive summary paragraph ("summary"), the key 
+        points ("key_points", one short statement each) and important insights and findings 
+        ("insights")."""
+        user_prompt = f"""Research Content:
+{research_content}"""
+
+        try:
+            response_text = await self._acall_llm(
+                system_prompt,
+                user_prompt,
+                temperature=0.5,
+                extra_config={
+                    "response_mime_type": "application/json",
+                    "response_schema": SUMMARY_SCHEMA,
+                },
+                step="summary",
+            )
+        except Exception as e:
+            print(f"Structured summary call failed: {e}")
+            return None
+        return self._parse_structured_summary(response_text)
+
+    @classmethod
+    def _parse_structured_summary(cls, text: str) -> Optional[Dict[str, Any]]:
+        """Parse a structured summary response.
+
+        Args:
+            text: Model response text
+
+        Returns:
+            Dictionary with summary, key_points and insights, or None if invalid
+        """
+        data = cls._parse_json(text)
+        if data is None:
+            return None
+        summary = data.get("summary")
+        if not isinstance(summary, str) or not summary.strip():
+            return None
+
+        return {
+            "summary": summary.strip(),
+            "key_points": cls._as_text_list(data.get("key_points")),
+            "insights": cls._as_text_list(data.get("insights")),
+        }
+
+    async def _two_call_summary(self, research_content: str) -> Tuple[str, List[str]]:
+        """Create the summary, then extract key points from it with a second call.
+
+        Args:
+            research_content: Packed or condensed research content
+
+        Returns:
+            Tuple of summary text and key points
+        """
         # Create structured summary
         system_prompt = """You are a summarization expert. Analyze the provided research content and create 
         a comprehensive structured summary. Extract key points and organize the information clearly. 
         Return a well-structured summary with main points and insights."""
         user_prompt = f"""Research Content:
-{combined_content}
-{local_content}
+{research_content}
 
 Create a structured summary with:
 1. A comprehensive summary paragraph
 2. Key points (as a bulleted list)
 3. Important insights and findings"""
 
-        summary_text = self._call_llm(system_prompt, user_prompt, temperature=0.5)
+        summary_text = await self._acall_llm(
+            system_prompt, user_prompt, temperature=0.5, step="summary"
+        )
 
         # Extract key points using LLM
         key_points_prompt = f"""From the following summary, extract the key points as a simple list, 
@@ -82,27 +397,145 @@ Create a structured summary with:
 {summary_text}
 
 Key points:"""
-        key_points_text = self._call_llm(
+        key_points_text = await self._acall_llm(
             "Extract key points from text. Return only the points, one per line.",
             key_points_prompt,
             temperature=0.3,
+            step="key_points",
         )
         key_points = [kp.strip() for kp in key_points_text.split("\n") if kp.strip()]
 
-        # Create StructuredNotes
-        structured_notes = StructuredNotes(
-            summary=summary_text,
-            key_points=key_points,
-            sources=sources_list,
-            metadata={
-                "num_sources": len(sources_list),
-                "search_queries": raw_data.search_queries,
-            },
-        )
+        return summary_text, key_points
 
-        return {
-            "phase": "summary",
-            "structured_notes": structured_notes.dict(),
-            "status": "completed",
+    def _map_stage(self, topic: str) -> "_MapStage":
+        """Create a map stage that summarizes chunk groups for a topic.
+
+        Args:
+            topic: Document topic
+
+        Returns:
+            _MapStage instance
+        """
+        semaphore = asyncio.Semaphore(self.map_concurrency)
+        map_prompt = """You are a research assistant. Summarize the following research excerpts, 
+        keeping every fact, figure, definition and notable claim relevant to the topic. Mention the 
+        source URL or file for each point. Be concise but do not drop information."""
+
+        async def summarize(group: List[ContextChunk]) -> str:
+            async with semaphore:
+                return await self._acall_llm(
+                    map_prompt,
+                    f"Topic: {topic}\n\n{format_chunks(group)}",
+                    temperature=0.3,
+                    step="map",
+                )
+
+        return _MapStage(summarize, self.map_chunk_tokens)
+
+    async def _reduce(
+        self, topic: str, partials: List[str], input_tokens: int
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Merge partial summaries in a tree until they fit the context budget.
+
+        Partial summaries are merged reduce_fan_in at a time, concurrently.
+
+        Args:
+            topic: Document topic
+            partials: Map summaries in source order
+            input_tokens: Size of the original input, for the report
+
+        Returns:
+            Tuple of the condensed research content and a report for metadata
+        """
+        semaphore = asyncio.Semaphore(self.map_concurrency)
+        reduce_prompt = """You are a research assistant. Merge the following partial summaries into 
+        one consolidated summary. Remove duplicated points, keep all distinct facts and their 
+        sources."""
+
+        async def merge(batch: List[str]) -> str:
+            if len(batch) == 1:
+                return batch[0]
+            async with semaphore:
+                return await self._acall_llm(
+                    reduce_prompt,
+                    f"Topic: {topic}\n\n" + "\n\n---\n\n".join(batch),
+                    temperature=0.3,
+                    step="reduce",
+                )
+
+        map_calls = len(partials)
+        reduce_levels = 0
+        budget = self.context_packer.token_budget
+        while len(partials) > 1 and sum(estimate_tokens(p) for p in partials) > budget:
+            batches = [
+                partials[i:i + self.reduce_fan_in]
+                for i in range(0, len(partials), self.reduce_fan_in)
+            ]
+            partials = list(await asyncio.gather(*[merge(batch) for batch in batches]))
+            reduce_levels += 1
+
+        content = "\n\n---\n\n".join(
+            f"Partial Summary {i + 1}:\n{partial}" for i, partial in enumerate(partials)
+        )
+        report = {
+            "input_tokens": input_tokens,
+            "map_calls": map_calls,
+            "reduce_levels": reduce_levels,
+            "partial_summaries": len(partials),
+            "condensed_tokens": estimate_tokens(content),
         }
+        print(
+            f"Map-reduce summarization: {map_calls} map call(s), "
+            f"{reduce_levels} reduce level(s)"
+        )
+        return content, report
+
+
+class _MapStage:
+    """Map step of map-reduce summarization that starts on chunk groups as soon as they fill."""
+
+    def __init__(
+        self, summarize: Callable[[List[ContextChunk]], Awaitable[str]], group_tokens: int
+    ):
+        """Initialize the stage.
+
+        Args:
+            summarize: Coroutine function summarizing one chunk group
+            group_tokens: Maximum tokens per chunk group
+        """
+        self.summarize = summarize
+        self.group_tokens = group_tokens
+        self.pending: List[ContextChunk] = []
+        self.tasks: List[asyncio.Future] = []
+
+    def add(self, chunks: List[ContextChunk]):
+        """Add chunks and start summarizing every group that is full.
+
+        Args:
+            chunks: New chunks, in order
+        """
+        self.pending.extend(chunks)
+        groups = group_chunks(self.pending, self.group_tokens)
+        for group in groups[:-1]:
+            self.tasks.append(asyncio.ensure_future(self.summarize(group)))
+        self.pending = groups[-1] if groups else []
+
+    async def finish(self) -> List[str]:
+        """Summarize the last, partly filled group and wait for all summaries.
+
+        Returns:
+            Partial summaries in chunk order
+        """
+        if self.pending:
+            self.tasks.append(asyncio.ensure_future(self.summarize(self.pending)))
+            self.pending = []
+        try:
+            return list(await asyncio.gather(*self.tasks))
+        except BaseException:
+            self.cancel()
+            raise
 
+    def cancel(self):
+        """Cancel summaries still in flight."""
+        for task in self.tasks:
+            task.cancel()
@@ -1,27 +1,79 @@
 """Writer Agent - Phase 3: Creation."""
 
-from typing import Any, Dict
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from ai_doc_orchestrator.base_agent import BaseAgent
-from ai_doc_orchestrator.models import AgentMessage, Draft, StructuredNotes
+from ai_doc_orchestrator.llm_client import ModelRegistry
+from ai_doc_orchestrator.models import (
+    AgentMessage,
+    Draft,
+    DraftSection,
+    PipelineEvent,
+    QCIssue,
+    StructuredNotes,
+)
+from ai_doc_orchestrator.sections import join_sections, split_sections
 
 
 class WriterAgent(BaseAgent):
     """Agent responsible for writing drafts from structured notes."""
 
-    def __init__(self, gemini_api_key=None, model: str = "gemini-2.5-flash"):
-        """Initialize the Writer Agent."""
-        super().__init__("WriterAgent", gemini_api_key, model)
+    def __init__(
+        self,
+        gemini_api_key=None,
+        model: str = "gemini-2.5-flash",
+        model_registry: Optional[ModelRegistry] = None,
+        incremental_revision: bool = True,
+    ):
+        """Initialize the Writer Agent.
+
+        Args:
+            gemini_api_key: Google Gemini API key
+            model: Model to use for LLM calls
+            model_registry: Shared model registry (a private one is created if None)
+            incremental_revision: On revisions, regenerate only the sections QC flagged
+                and reuse the rest of the previous draft
+        """
+        super().__init__("WriterAgent", gemini_api_key, model, model_registry)
+        self.incremental_revision = incremental_revision
 
     async def process(self, message: AgentMessage) -> Dict[str, Any]:
         """Process structured notes and create a draft.
 
+        The draft is generated in one call, so it keeps the full retry and model
+        fallback policy (nobody sees partial text that a retry would contradict).
+
         Args:
             message: Message containing structured notes and optional feedback
 
         Returns:
             Dictionary with draft content
         """
+        result: Dict[str, Any] = {}
+        async for event in self.stream(message, stream_chunks=False):
+            if event.type == "result":
+                result = event.data
+        return result
+
+    async def stream(
+        self, message: AgentMessage, stream_chunks: bool = True
+    ) -> AsyncIterator[PipelineEvent]:
+        """Create a draft, yielding text chunks as the model produces them.
+
+        When the message carries the previous draft and QC issues tied to its
+        sections, only those sections are regenerated (see incremental_revision).
+
+        Args:
+            message: Message containing structured notes and optional feedback,
+                previous_draft, section_issues and temperature
+            stream_chunks: Stream the draft call; a failure after the first chunk
+                cannot be retried, so pass False when nobody displays the chunks
+
+        Yields:
+            'chunk' events with partial text, then one 'result' event whose data
+            is the same dictionary process() returns
+        """
         structured_notes_dict = message.data.get("structured_notes", {})
         structured_notes = StructuredNotes(**structured_notes_dict)
         topic = message.data.get("topic", "")
@@ -29,6 +81,7 @@ class WriterAgent(BaseAgent):
         feedback = message.data.get("feedback", "")
         version = message.data.get("version", 1)
         blog_instructions = message.data.get("blog_instructions", "")
+        temperature = message.data.get("temperature", 0.7)
 
         # Build the writing prompt
         if blog_instructions:
@@ -54,29 +107,166 @@ Key Points:
 Sources: {', '.join(structured_notes.sources[:5])}
 """
 
+        if structured_notes.insights:
+            insights = "\n".join(f"- {insight}" for insight in structured_notes.insights)
+            user_prompt += f"\nInsights:\n{insights}\n"
+
         if blog_instructions:
             user_prompt += f"\n\n{blog_instructions}"
+
+        previous_draft = message.data.get("previous_draft")
+        section_issues = [QCIssue(**issue) for issue in message.data.get("section_issues", [])]
+        if self.incremental_revision and previous_draft and section_issues:
+            sections = [
+                DraftSection(**section) for section in previous_draft.get("sections", [])
+            ] or split_sections(previous_draft.get("content", ""))
+            anchors = {section.anchor for section in sections}
+            # Document-wide issues can touch any section, so they need a full revision
+            if all(issue.section in anchors for issue in section_issues):
+                metadata = {
+                    "topic": topic,
+                    "format": format_type,
+                    "num_key_points": len(structured_notes.key_points),
+                }
+                async for event in self._revise_sections(
+                    system_prompt, user_prompt, sections, section_issues, version, metadata
+                ):
+                    yield event
+                return
         
         if feedback:
             user_prompt += f"\n\nPrevious Feedback (for revision):\n{feedback}\n\nPlease revise the draft addressing this feedback."
 
-        # Generate the draft
-        draft_content = self._call_llm(system_prompt, user_prompt, temperature=0.7)
+        # Generate the draft, streaming chunks to the caller if it displays them
+        if stream_chunks:
+            chunks = []
+            async for text in self._astream_llm(
+                system_prompt, user_prompt, temperature=temperature, step="draft"
+            ):
+                chunks.append(text)
+                yield PipelineEvent(type="chunk", phase="writing", data={"text": text})
+            draft_content = "".join(chunks)
+        else:
+            draft_content = await self._acall_llm(
+                system_prompt, user_prompt, temperature=temperature, step="draft"
+            )
 
         # Create Draft object
         draft = Draft(
             content=draft_content,
+            sections=split_sections(draft_content),
             version=version,
             metadata={
                 "topic": topic,
                 "format": format_type,
                 "num_key_points": len(structured_notes.key_points),
+                "revision_mode": "full",
+                "temperature": temperature,
+            },
+        )
+
+        yield PipelineEvent(
+            type="result",
+            phase="writing",
+            data={
+                "phase": "writing",
+                "draft": draft.dict(),
+                "status": "completed",
             },
         )
 
-        return {
-            "phase": "writing",
-            "draft": draft.dict(),
-            "status": "completed",
-        }
+    async def _revise_sections(
+        self,
+        system_prompt: str,
+        notes_prompt: str,
+        sections: List[DraftSection],
+        issues: List[QCIssue],
+        version: int,
+        metadata: Dict[str, Any],
+    ) -> AsyncIterator[PipelineEvent]:
+        """Regenerate only the flagged sections of a draft and reuse the others.
+
+        Flagged sections are rewritten concurrently. Each call sees the notes, the
+        document outline and the section's own text, never the unchanged sections.
+
+        Args:
+            system_prompt: Writer system prompt
+            notes_prompt: Prompt describing the topic and structured notes
+            sections: Sections of the previous draft
+            issues: QC issues, each tied to one of the sections
+            version: Version number of the new draft
+            metadata: Base draft metadata
+
+        Yields:
+            One 'chunk' event with the revised draft text, then a 'result' event
+        """
+        flagged: Dict[str, List[str]] = {}
+        for issue in issues:
+            flagged.setdefault(issue.section, []).append(issue.description)
 
+        outline = "\n".join(
+            f"- [{section.anchor}] {section.heading or '(introduction)'}" for section in sections
+        )
+
+        async def revise(section: DraftSection) -> DraftSection:
+            section_issues = "\n".join(f"- {issue}" for issue in flagged[section.anchor])
+            prompt = f"""{notes_prompt}
+
+Document Outline:
+{outline}
+
+Section To Revise [{section.anchor}]:
+{section.content}
+
+Issues In This Section:
+{section_issues}
+
+Rewrite only this section, addressing the issues. Keep its heading line unchanged and
+return only the revised section text."""
+
+            text = await self._acall_llm(
+                system_prompt, prompt, temperature=0.7, step="revise_section"
+            )
+            text = text.strip()
+            heading_line = section.content.splitlines()[0] if section.heading else ""
+            if heading_line and not text.startswith(heading_line):
+                text = f"{heading_line}\n\n{text}"
+            return DraftSection(anchor=section.anchor, heading=section.heading, content=text)
+
+        targets = [section for section in sections if section.anchor in flagged]
+        revised = dict(zip(
+            [section.anchor for section in targets],
+            await asyncio.gather(*[revise(section) for section in targets]),
+        ))
+        draft_content = join_sections(
+            [revised.get(section.anchor, section) for section in sections]
+        )
+        # Re-split so anchors match the revised text (a rewrite may add headings)
+        new_sections = split_sections(draft_content)
+        print(
+            f"Revised {len(targets)} of {len(sections)} section(s); "
+            f"reused {len(sections) - len(targets)} unchanged"
+        )
+
+        yield PipelineEvent(type="chunk", phase="writing", data={"text": draft_content})
+
+        draft = Draft(
+            content=draft_content,
+            sections=new_sections,
+            version=version,
+            metadata={
+                **metadata,
+                "revision_mode": "sections",
+                "revised_sections": [section.anchor for section in targets],
+                "reused_sections": len(sections) - len(targets),
+            },
+        )
+        yield PipelineEvent(
+            type="result",
+            phase="writing",
+            data={
+                "phase": "writing",
+                "draft": draft.dict(),
+                "status": "completed",
+            },
+        )
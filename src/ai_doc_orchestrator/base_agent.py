@@ -1,14 +1,25 @@
 """Base agent class for all agents in the system."""
 
+import asyncio
+import json
+import os
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-
-try:
-    import google.generativeai as genai
-except ImportError:
-    genai = None
+from contextlib import nullcontext
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
+from ai_doc_orchestrator.concurrency import run_blocking
+from ai_doc_orchestrator.llm_cache import LLMResponseCache
+from ai_doc_orchestrator.llm_client import ModelRegistry
+from ai_doc_orchestrator.model_router import ModelRouter
 from ai_doc_orchestrator.models import AgentMessage
+from ai_doc_orchestrator.rate_limit import RateLimitGovernor, estimate_tokens
+from ai_doc_orchestrator.retry import RetryPolicy
+from ai_doc_orchestrator.run_context import current_run
+
+T = TypeVar("T")
 
 
 class BaseAgent(ABC):
@@ -19,33 +30,33 @@ class BaseAgent(ABC):
         name: str,
         gemini_api_key: Optional[str] = None,
         model: str = "gemini-2.5-flash",
+        model_registry: Optional[ModelRegistry] = None,
     ):
         """Initialize the agent.
 
         Args:
             name: Agent name
-            gemini_api_key: Google Gemini API key (creates new client if None)
-            model: Model to use for LLM calls (default: gemini-pro)
+            gemini_api_key: Google Gemini API key (defaults to GOOGLE_GEMINI_API_KEY env var)
+            model: Model to use for LLM calls (default: gemini-2.5-flash)
+            model_registry: Shared model registry (a private one is created if None)
         """
-        if genai is None:
-            raise ImportError(
-                "google-generativeai is required. Install with: pip install google-generativeai"
-            )
-        
         self.name = name
         self.model = model
-        
-        # Configure Gemini API
-        if gemini_api_key:
-            genai.configure(api_key=gemini_api_key)
-        else:
-            import os
-            api_key = os.getenv("GOOGLE_GEMINI_API_KEY")
+
+        if model_registry is None:
+            api_key = gemini_api_key or os.getenv("GOOGLE_GEMINI_API_KEY")
             if not api_key:
                 raise ValueError("Google Gemini API key is required. Set GOOGLE_GEMINI_API_KEY env var or pass gemini_api_key parameter.")
-            genai.configure(api_key=api_key)
-        
+            model_registry = ModelRegistry(api_key)
+        self.model_registry = model_registry
+        self.gemini_api_key = gemini_api_key
+
         self.tools: Dict[str, Any] = {}
+        self.response_cache: Optional[LLMResponseCache] = None
+        self.cache_responses = False
+        self.governor: Optional[RateLimitGovernor] = None
+        self.retry_policy = RetryPolicy()
+        self.model_router: Optional[ModelRouter] = None
 
     def register_tool(self, name: str, tool: Any):
         """Register a tool for this agent to use.
@@ -56,6 +67,41 @@ class BaseAgent(ABC):
         """
         self.tools[name] = tool
 
+    def set_response_cache(self, cache: Optional[LLMResponseCache], enabled: bool = True):
+        """Set the LLM response cache for this agent.
+
+        Args:
+            cache: LLMResponseCache instance (None removes the cache)
+            enabled: Whether calls use the cache by default; individual calls can
+                override this with the use_cache argument
+        """
+        self.response_cache = cache
+        self.cache_responses = enabled and cache is not None
+
+    def set_governor(self, governor: Optional[RateLimitGovernor]):
+        """Set the rate limit governor that LLM calls wait on.
+
+        Args:
+            governor: RateLimitGovernor instance (None disables rate limiting)
+        """
+        self.governor = governor
+
+    def set_retry_policy(self, policy: Optional[RetryPolicy]):
+        """Set the retry policy for this agent's LLM calls.
+
+        Args:
+            policy: RetryPolicy instance (None disables retries)
+        """
+        self.retry_policy = policy or RetryPolicy.disabled()
+
+    def set_model_router(self, router: Optional[ModelRouter]):
+        """Set the router that picks the model for each LLM call.
+
+        Args:
+            router: ModelRouter instance (None uses self.model for every call)
+        """
+        self.model_router = router
+
     def send_message(
         self, to_agent: str, phase: str, data: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None
     ) -> AgentMessage:
@@ -90,39 +136,371 @@ class BaseAgent(ABC):
         """
         pass
 
-    def _call_llm(
+    def _get_model(self, model_name: Optional[str] = None) -> Any:
+        """Get the shared Gemini model instance for this agent.
+
+        Args:
+            model_name: Model to get (defaults to self.model)
+
+        Returns:
+            GenerativeModel instance
+        """
+        return self.model_registry.get_model(model_name or self.model, api_key=self.gemini_api_key)
+
+    def _models_for(self, step: Optional[str]) -> List[str]:
+        """Get the models to try for a step: the routed model, then its fallbacks.
+
+        Args:
+            step: Step name (None for the agent's general calls)
+
+        Returns:
+            Model names in the order they are tried
+        """
+        if self.model_router is None:
+            return [self.model]
+        return self.model_router.candidates(self.name, step, default=self.model)
+
+    def _report_model(self, step: Optional[str], model_name: str, failed: Optional[str] = None):
+        """Record the model that served a step in the current run's statistics.
+
+        Args:
+            step: Step name
+            model_name: Model that produced the response
+            failed: Model that failed before falling back to model_name, if any
+        """
+        run = current_run()
+        if run is not None:
+            run.record_model(f"{self.name}.{step or 'llm'}", model_name, fallback_from=failed)
+
+    def _report_fallback(self, step: Optional[str], failed: str, next_model: str, exc: Exception):
+        """Log that a model failed and the next candidate will be tried."""
+        print(
+            f"Model {failed} failed for {self.name}.{step or 'llm'}: {exc}. "
+            f"Falling back to {next_model}"
+        )
+
+    async def _awith_fallback(
+        self, step: Optional[str], func: Callable[[str], Awaitable[T]]
+    ) -> T:
+        """Await func with each candidate model until one succeeds.
+
+        Args:
+            step: Step name used for routing
+            func: Coroutine function taking a model name
+
+        Returns:
+            The first successful result
+        """
+        models = self._models_for(step)
+        for index, model_name in enumerate(models):
+            try:
+                result = await func(model_name)
+            except Exception as e:
+                if index == len(models) - 1:
+                    raise
+                self._report_fallback(step, model_name, models[index + 1], e)
+                continue
+            self._report_model(step, model_name, models[index - 1] if index else None)
+            return result
+
+    def _cache_key(
+        self,
+        model_name: str,
+        full_prompt: str,
+        generation_config: Dict[str, Any],
+        use_cache: Optional[bool],
+    ) -> Optional[str]:
+        """Get the response cache key for a call, or None if caching is off.
+
+        Responses are stored under the model that produced them, so a fallback
+        model's answer is never served for a later call to the routed model.
+
+        Args:
+            model_name: Model that is looked up or that produced the response
+            full_prompt: Complete prompt sent to the model
+            generation_config: Generation config sent with the call
+            use_cache: Per-call override (None uses the agent default)
+
+        Returns:
+            Cache key or None
+        """
+        enabled = self.cache_responses if use_cache is None else use_cache
+        if not enabled or self.response_cache is None:
+            return None
+        return LLMResponseCache.make_key(
+            model_name, full_prompt, generation_config.get("temperature"), generation_config
+        )
+
+    def _llm_limit(self, full_prompt: str) -> Any:
+        """Get an async context manager that holds Gemini rate limit capacity for a call.
+
+        Args:
+            full_prompt: Complete prompt (used to estimate token usage)
+
+        Returns:
+            Async context manager (a no-op if no governor is set)
+        """
+        if self.governor is None:
+            return nullcontext()
+        return self.governor.limiter("gemini").limit(estimate_tokens(full_prompt))
+
+    @staticmethod
+    def _parse_json(text: str) -> Optional[Dict[str, Any]]:
+        """Parse a JSON object from a model response.
+
+        Tolerates code fences and text around the object.
+
+        Args:
+            text: Model response text
+
+        Returns:
+            Parsed object, or None if the text holds no valid JSON object
+        """
+        text = re.sub(r"^\s*```(?:json)?\s*|\s*```\s*$", "", text or "")
+        try:
+            data = json.loads(text)
+        except ValueError:
+            start, end = text.find("{"), text.rfind("}")
+            if start == -1 or end <= start:
+                return None
+            try:
+                data = json.loads(text[start:end + 1])
+            except ValueError:
+                return None
+        return data if isinstance(data, dict) else None
+
+    @staticmethod
+    def _as_text_list(value: Any) -> List[str]:
+        """Normalize a JSON field that should be a list of strings.
+
+        Accepts newline-separated strings and strips bullet markers.
+
+        Args:
+            value: Parsed JSON value
+
+        Returns:
+            List of non-empty strings
+        """
+        if isinstance(value, str):
+            value = value.split("\n")
+        if not isinstance(value, list):
+            return []
+        items = [str(item).strip().lstrip("-*• ").strip() for item in value]
+        return [item for item in items if item]
+
+    async def _acall_llm(
         self,
         system_prompt: str,
         user_prompt: str,
         temperature: float = 0.7,
+        use_cache: Optional[bool] = None,
+        extra_config: Optional[Dict[str, Any]] = None,
+        step: Optional[str] = None,
     ) -> str:
-        """Call the LLM with given prompts.
+        """Call the LLM without blocking the event loop.
+
+        Uses the SDK's async generate path when the model provides one, and
+        falls back to running the blocking call on the shared bounded executor.
 
         Args:
             system_prompt: System prompt
             user_prompt: User prompt
             temperature: Temperature for generation
+            use_cache: Whether to use the response cache (None uses the agent default)
+            extra_config: Additional generation config entries, e.g. response_mime_type
+                and response_schema for structured JSON output
+            step: Step name used to route the call to a model (see ModelRouter)
 
         Returns:
             LLM response text
         """
-        # Combine system and user prompts for Gemini
-        # Gemini doesn't have separate system messages, so we combine them
         full_prompt = f"{system_prompt}\n\n{user_prompt}"
-        
-        # Create the model instance (use full model name if not already prefixed)
-        model_name = self.model if self.model.startswith("models/") else f"models/{self.model}"
-        model = genai.GenerativeModel(model_name)
-        
-        # Generate content with temperature
         generation_config = {
             "temperature": temperature,
+            **(extra_config or {}),
         }
-        
-        response = model.generate_content(
-            full_prompt,
-            generation_config=generation_config,
+
+        cache_key = self._cache_key(
+            self._models_for(step)[0], full_prompt, generation_config, use_cache
         )
-        
-        return response.text or ""
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        async def generate(model: Any) -> str:
+            generate_async = getattr(model, "generate_content_async", None)
+            # Capacity is re-acquired per attempt so backoff does not hold a slot
+            async with self._llm_limit(full_prompt):
+                if generate_async is not None:
+                    response = await generate_async(
+                        full_prompt,
+                        generation_config=generation_config,
+                    )
+                else:
+                    response = await run_blocking(
+                        model.generate_content,
+                        full_prompt,
+                        generation_config=generation_config,
+                    )
+            return response.text or ""
+
+        async def call(model_name: str) -> Tuple[str, str]:
+            return model_name, await self.retry_policy.acall(
+                generate, self._get_model(model_name), operation=f"{self.name}.llm"
+            )
+
+        answered, text = await self._awith_fallback(step, call)
+
+        if cache_key is not None:
+            self.response_cache.set(
+                self._cache_key(answered, full_prompt, generation_config, use_cache), text
+            )
+        return text
+
+    async def _astream_llm(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.7,
+        use_cache: Optional[bool] = None,
+        step: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Stream the LLM response as text chunks while it is generated.
+
+        Transient failures are retried only until the first chunk has been yielded.
+
+        Args:
+            system_prompt: System prompt
+            user_prompt: User prompt
+            temperature: Temperature for generation
+            use_cache: Whether to use the response cache (None uses the agent default)
+            step: Step name used to route the call to a model (see ModelRouter)
+
+        Yields:
+            Response text chunks
+        """
+        full_prompt = f"{system_prompt}\n\n{user_prompt}"
+        generation_config = {
+            "temperature": temperature,
+        }
+
+        cache_key = self._cache_key(
+            self._models_for(step)[0], full_prompt, generation_config, use_cache
+        )
+        if cache_key is not None:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+
+        operation = f"{self.name}.llm"
+        models = self._models_for(step)
+        index = 0
+        start = time.monotonic()
+        attempt = 1
+        while True:
+            model = self._get_model(models[index])
+            chunks = []
+            try:
+                async with self._llm_limit(full_prompt):
+                    async for text in self._stream_chunks(model, full_prompt, generation_config):
+                        chunks.append(text)
+                        yield text
+                break
+            except Exception as e:
+                # Nothing can be retried or rerouted once text has reached the caller
+                if chunks:
+                    raise
+                delay = self.retry_policy.next_delay(e, attempt, start)
+                if delay is None:
+                    if index == len(models) - 1:
+                        raise
+                    self._report_fallback(step, models[index], models[index + 1], e)
+                    index += 1
+                    start = time.monotonic()
+                    attempt = 1
+                    continue
+                self.retry_policy.report_retry(operation, e, attempt, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+        self._report_model(step, models[index], models[index - 1] if index else None)
+
+        if cache_key is not None:
+            self.response_cache.set(
+                self._cache_key(models[index], full_prompt, generation_config, use_cache),
+                "".join(chunks),
+            )
+
+    @staticmethod
+    def _chunk_text(chunk: Any) -> str:
+        """Get the text of a streamed response chunk (empty if it has none)."""
+        try:
+            return chunk.text or ""
+        except ValueError:
+            # Chunks without text parts (e.g. only safety metadata) raise on .text
+            return ""
+
+    async def _stream_chunks(
+        self, model: Any, full_prompt: str, generation_config: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Yield text chunks from a streaming generate call.
+
+        Uses the SDK's async streaming path when available; otherwise the blocking
+        stream is consumed on the shared executor and handed over through a queue.
+
+        Args:
+            model: GenerativeModel instance
+            full_prompt: Complete prompt
+            generation_config: Generation config
+
+        Yields:
+            Response text chunks
+        """
+        generate_async = getattr(model, "generate_content_async", None)
+        if generate_async is not None:
+            response = await generate_async(
+                full_prompt,
+                generation_config=generation_config,
+                stream=True,
+            )
+            async for chunk in response:
+                text = self._chunk_text(chunk)
+                if text:
+                    yield text
+            return
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        cancelled = threading.Event()
+
+        def produce():
+            try:
+                response = model.generate_content(
+                    full_prompt,
+                    generation_config=generation_config,
+                    stream=True,
+                )
+                for chunk in response:
+                    if cancelled.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, self._chunk_text(chunk))
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
 
+        producer = asyncio.ensure_future(run_blocking(produce))
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                if item:
+                    yield item
+        finally:
+            cancelled.set()
+            await asyncio.gather(producer, return_exceptions=True)
@@ -0,0 +1,133 @@
+"""Checkpoint stores for resuming pipeline runs."""
+
+import json
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class CheckpointStore(ABC):
+    """Base class for stores that persist per-phase outputs of a run."""
+
+    @abstractmethod
+    def save(self, run_id: str, key: str, data: Dict[str, Any]):
+        """Save a checkpoint.
+
+        Args:
+            run_id: Run identifier
+            key: Checkpoint key (e.g. 'research', 'draft_2')
+            data: JSON-serializable checkpoint data
+        """
+
+    @abstractmethod
+    def load(self, run_id: str, key: str) -> Optional[Dict[str, Any]]:
+        """Load a checkpoint.
+
+        Args:
+            run_id: Run identifier
+            key: Checkpoint key
+
+        Returns:
+            Checkpoint data, or None if it does not exist
+        """
+
+    @abstractmethod
+    def keys(self, run_id: str) -> List[str]:
+        """List the checkpoint keys saved for a run.
+
+        Args:
+            run_id: Run identifier
+
+        Returns:
+            List of checkpoint keys
+        """
+
+    @abstractmethod
+    def clear(self, run_id: str):
+        """Delete all checkpoints of a run.
+
+        Args:
+            run_id: Run identifier
+        """
+
+
+class InMemoryCheckpointStore(CheckpointStore):
+    """Checkpoint store kept in process memory."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self._runs: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def save(self, run_id: str, key: str, data: Dict[str, Any]):
+        with self._lock:
+            # Round-trip through JSON so stored data cannot be mutated by callers
+            self._runs.setdefault(run_id, {})[key] = json.loads(json.dumps(data))
+
+    def load(self, run_id: str, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            data = self._runs.get(run_id, {}).get(key)
+        return json.loads(json.dumps(data)) if data is not None else None
+
+    def keys(self, run_id: str) -> List[str]:
+        with self._lock:
+            return list(self._runs.get(run_id, {}))
+
+    def clear(self, run_id: str):
+        with self._lock:
+            self._runs.pop(run_id, None)
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Checkpoint store writing one JSON file per checkpoint under a directory."""
+
+    def __init__(self, directory: str):
+        """Initialize the store.
+
+        Args:
+            directory: Root directory for checkpoints (created if missing)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _safe(name: str) -> str:
+        """Make a run ID or key safe to use as a file name."""
+        return re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+
+    def _run_dir(self, run_id: str) -> Path:
+        return self.directory / self._safe(run_id)
+
+    def save(self, run_id: str, key: str, data: Dict[str, Any]):
+        run_dir = self._run_dir(run_id)
+        run_dir.mkdir(parents=True, exist_ok=True)
+        path = run_dir / f"{self._safe(key)}.json"
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, default=str)
+        # Atomic replace so a crash never leaves a truncated checkpoint
+        os.replace(tmp_path, path)
+
+    def load(self, run_id: str, key: str) -> Optional[Dict[str, Any]]:
+        path = self._run_dir(run_id) / f"{self._safe(key)}.json"
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def keys(self, run_id: str) -> List[str]:
+        run_dir = self._run_dir(run_id)
+        if not run_dir.exists():
+            return []
+        return [p.stem for p in run_dir.glob("*.json")]
+
+    def clear(self, run_id: str):
+        run_dir = self._run_dir(run_id)
+        if not run_dir.exists():
+            return
+        for path in run_dir.iterdir():
+            path.unlink()
+        run_dir.rmdir()
@@ -0,0 +1,126 @@
+"""Helpers for running blocking work without stalling the event loop."""
+
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_process_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get the shared bounded executor used for blocking SDK calls.
+
+    The pool size comes from the AI_DOC_MAX_WORKERS env var (default: 16).
+
+    Returns:
+        ThreadPoolExecutor instance
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                max_workers = int(os.getenv("AI_DOC_MAX_WORKERS", "16"))
+                _executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="ai-doc-worker"
+                )
+    return _executor
+
+
+def shutdown_executor(wait: bool = True):
+    """Shut down the shared executor (a new one is created on next use).
+
+    Args:
+        wait: Whether to wait for pending work to finish
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking callable on the shared executor.
+
+    The caller's context variables are propagated to the worker thread.
+
+    Args:
+        func: Blocking callable
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The callable's return value
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(), call)
+
+
+def get_process_executor() -> ProcessPoolExecutor:
+    """Get the shared process pool used for CPU-bound work such as PDF layout.
+
+    The pool size comes from the AI_DOC_PROCESS_WORKERS env var (default: CPU count).
+    Workers are started with forkserver (spawn where it is unavailable), never
+    fork: forking a process that runs the event loop and SDK threads can copy
+    held locks into the child.
+
+    Returns:
+        ProcessPoolExecutor instance
+    """
+    global _process_executor
+    if _process_executor is None:
+        with _executor_lock:
+            if _process_executor is None:
+                max_workers = int(os.getenv("AI_DOC_PROCESS_WORKERS", "0")) or os.cpu_count() or 1
+                method = (
+                    "forkserver"
+                    if "forkserver" in multiprocessing.get_all_start_methods()
+                    else "spawn"
+                )
+                _process_executor = ProcessPoolExecutor(
+                    max_workers=max_workers, mp_context=multiprocessing.get_context(method)
+                )
+    return _process_executor
+
+
+def shutdown_process_executor(wait: bool = True):
+    """Shut down the shared process pool (a new one is created on next use).
+
+    Args:
+        wait: Whether to wait for pending work to finish
+    """
+    global _process_executor
+    with _executor_lock:
+        if _process_executor is not None:
+            _process_executor.shutdown(wait=wait)
+            _process_executor = None
+
+
+async def run_in_process(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a CPU-bound callable on the shared process pool.
+
+    The callable and its arguments must be picklable; context variables are
+    not propagated across the process boundary.
+
+    Args:
+        func: Module-level callable
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The callable's return value
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *args, **kwargs)
+    return await loop.run_in_executor(get_process_executor(), call)
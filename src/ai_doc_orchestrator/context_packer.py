@@ -0,0 +1,278 @@
+"""Token-budgeted context packing for summarization prompts."""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ai_doc_orchestrator.rate_limit import estimate_tokens
+
+_STOPWORDS = {
+    "the", "and", "for", "with", "from", "that", "this", "into", "about", "what",
+    "how", "why", "are", "was", "its", "their", "your", "our", "you", "not",
+}
+
+
+def topic_terms(topic: str) -> List[str]:
+    """Get the significant lowercase terms of a topic.
+
+    Args:
+        topic: Topic text
+
+    Returns:
+        List of unique terms, in order of appearance
+    """
+    terms = []
+    for term in re.findall(r"[a-z0-9]+", topic.lower()):
+        if len(term) > 2 and term not in _STOPWORDS and term not in terms:
+            terms.append(term)
+    return terms
+
+
+class ContextChunk:
+    """A piece of source text considered for inclusion in a prompt."""
+
+    def __init__(self, label: str, header: str, text: str, index: int, score: float, tokens: int):
+        """Initialize the chunk.
+
+        Args:
+            label: Identifier of the originating source (URL or file path)
+            header: Header printed before the source's first included chunk
+            text: Chunk text
+            index: Position of the chunk within its source
+            score: Source score from search (0 to 1)
+            tokens: Token count of the chunk
+        """
+        self.label = label
+        self.header = header
+        self.text = text
+        self.index = index
+        self.score = score
+        self.tokens = tokens
+        self.rank = 0.0
+
+
+class ContextPacker:
+    """Select the most useful source chunks that fit in a token budget.
+
+    Chunks are ranked by a weighted mix of the search score and relevance to
+    the topic, then added greedily until the budget is full. Selected chunks
+    are emitted grouped by source in their original order.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 12000,
+        chunk_tokens: int = 800,
+        score_weight: float = 0.5,
+        relevance_weight: float = 0.5,
+        local_file_score: float = 1.0,
+        count_tokens: Optional[Callable[[str], int]] = None,
+    ):
+        """Initialize the packer.
+
+        Args:
+            token_budget: Maximum tokens of source content to include
+            chunk_tokens: Target size of each chunk in tokens
+            score_weight: Weight of the search score in the ranking
+            relevance_weight: Weight of topic relevance in the ranking
+            local_file_score: Score given to local files (they have no search score)
+            count_tokens: Token counting function (defaults to a character-based estimate)
+        """
+        self.token_budget = token_budget
+        self.chunk_tokens = max(1, chunk_tokens)
+        self.score_weight = score_weight
+        self.relevance_weight = relevance_weight
+        self.local_file_score = local_file_score
+        self.count_tokens = count_tokens or estimate_tokens
+
+    def chunk_text(self, text: str) -> List[str]:
+        """Split text into chunks of about chunk_tokens, on paragraph boundaries.
+
+        Paragraphs longer than a chunk are split on word boundaries.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            List of chunks
+        """
+        pieces: List[str] = []
+        for paragraph in re.split(r"\n\s*\n", text):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            if self.count_tokens(paragraph) <= self.chunk_tokens:
+                pieces.append(paragraph)
+                continue
+            words = paragraph.split()
+            words_per_piece = max(
+                1, len(words) * self.chunk_tokens // self.count_tokens(paragraph)
+            )
+            groups = [
+                words[start:start + words_per_piece]
+                for start in range(0, len(words), words_per_piece)
+            ]
+            # Fold a short tail into the previous group instead of keeping a sliver
+            if len(groups) > 1 and len(groups[-1]) < words_per_piece // 4:
+                groups[-2].extend(groups.pop())
+            pieces.extend(" ".join(group) for group in groups)
+
+        chunks: List[str] = []
+        current_chunk = ""
+        for piece in pieces:
+            candidate = f"{current_chunk}\n\n{piece}" if current_chunk else piece
+            if current_chunk and self.count_tokens(candidate) > self.chunk_tokens:
+                chunks.append(current_chunk)
+                current_chunk = piece
+            else:
+                current_chunk = candidate
+        if current_chunk:
+            chunks.append(current_chunk)
+        return chunks
+
+    def build_chunks(self, sources: List[Dict[str, Any]]) -> List[ContextChunk]:
+        """Split search sources into chunks.
+
+        Args:
+            sources: Search results with title, url, content and score
+
+        Returns:
+            List of chunks in source order
+        """
+        chunks: List[ContextChunk] = []
+        for source in sources:
+            content = source.get("content", "")
+            if not content:
+                continue
+            url = source.get("url", "")
+            header = f"Source: {source.get('title', '')}\nURL: {url}\n"
+            score = float(source.get("score") or 0.0)
+            for i, text in enumerate(self.chunk_text(content)):
+                chunks.append(
+                    ContextChunk(url, header, text, i, score, self.count_tokens(text))
+                )
+        return chunks
+
+    def local_file_chunks(self, path: str, pieces: List[Tuple[str, int]]) -> List[ContextChunk]:
+        """Wrap a local file's already split text in chunks.
+
+        Args:
+            path: File path shown in the chunk header
+            pieces: (text, tokens) pairs from chunk_text, in file order
+
+        Returns:
+            List of chunks
+        """
+        header = f"Local File: {path}\n"
+        return [
+            ContextChunk(path, header, text, i, self.local_file_score, tokens)
+            for i, (text, tokens) in enumerate(pieces)
+        ]
+
+    def rank(self, chunks: List[ContextChunk], topic: str):
+        """Compute the rank of each chunk in place.
+
+        Args:
+            chunks: Chunks to rank
+            topic: Document topic
+        """
+        terms = topic_terms(topic)
+        for chunk in chunks:
+            relevance = 0.0
+            if terms:
+                lowered = chunk.text.lower()
+                relevance = sum(1 for term in terms if term in lowered) / len(terms)
+            # Earlier chunks of a source tend to carry its main point
+            position_penalty = 0.02 * min(chunk.index, 10)
+            chunk.rank = (
+                self.score_weight * chunk.score
+                + self.relevance_weight * relevance
+                - position_penalty
+            )
+
+    def pack_chunks(self, topic: str, chunks: List[ContextChunk]) -> Dict[str, Any]:
+        """Pack the best of the given chunks into the token budget.
+
+        Args:
+            topic: Document topic
+            chunks: Chunks from build_chunks() or local_file_chunks()
+
+        Returns:
+            Dictionary with the packed 'content' text and a 'report'
+        """
+        self.rank(chunks, topic)
+
+        selected = set()
+        used_tokens = 0
+        for position in sorted(range(len(chunks)), key=lambda i: chunks[i].rank, reverse=True):
+            chunk = chunks[position]
+            if used_tokens + chunk.tokens <= self.token_budget:
+                selected.add(position)
+                used_tokens += chunk.tokens
+
+        dropped = [
+            {"source": chunk.label, "chunk": chunk.index, "tokens": chunk.tokens}
+            for position, chunk in enumerate(chunks)
+            if position not in selected
+        ]
+        all_labels = {chunk.label for chunk in chunks}
+        included_labels = {chunks[position].label for position in selected}
+
+        return {
+            "content": format_chunks([c for i, c in enumerate(chunks) if i in selected]),
+            "report": {
+                "token_budget": self.token_budget,
+                "input_tokens": sum(chunk.tokens for chunk in chunks),
+                "packed_tokens": used_tokens,
+                "chunks_total": len(chunks),
+                "chunks_included": len(selected),
+                "dropped_chunks": dropped,
+                "dropped_sources": sorted(all_labels - included_labels),
+            },
+        }
+
+
+def format_chunks(chunks: List[ContextChunk]) -> str:
+    """Render chunks as prompt text, with a header per consecutive source.
+
+    Args:
+        chunks: Chunks in the order they should appear
+
+    Returns:
+        Prompt text
+    """
+    sections: List[str] = []
+    current_label = None
+    for chunk in chunks:
+        if chunk.label != current_label:
+            sections.append(f"{chunk.header}\n{chunk.text}")
+            current_label = chunk.label
+        else:
+            sections[-1] += f"\n\n{chunk.text}"
+    return "\n---\n\n".join(sections)
+
+
+def group_chunks(chunks: List[ContextChunk], max_tokens: int) -> List[List[ContextChunk]]:
+    """Split chunks, in order, into consecutive groups of at most max_tokens.
+
+    A chunk larger than max_tokens forms a group of its own.
+
+    Args:
+        chunks: Chunks to group
+        max_tokens: Token limit per group
+
+    Returns:
+        List of chunk groups
+    """
+    groups: List[List[ContextChunk]] = []
+    current: List[ContextChunk] = []
+    current_tokens = 0
+    for chunk in chunks:
+        if current and current_tokens + chunk.tokens > max_tokens:
+            groups.append(current)
+            current = []
+            current_tokens = 0
+        current.append(chunk)
+        current_tokens += chunk.tokens
+    if current:
+        groups.append(current)
+    return groups
@@ -0,0 +1,179 @@
+"""URL canonicalization and near-duplicate detection for research sources."""
+
+import hashlib
+import re
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the visit and never change the page
+_TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid", "ref", "ref_src",
+    "source", "spm", "_ga", "_hsenc", "_hsmi", "yclid",
+}
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so different spellings of the same page compare equal.
+
+    Lowercases the scheme and host, treats http as https, drops 'www.', default
+    ports, fragments, tracking parameters and trailing slashes, and sorts the
+    remaining query parameters.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        Canonical URL (the stripped input if it cannot be parsed)
+    """
+    url = (url or "").strip()
+    try:
+        parts = urlsplit(url)
+        port = str(parts.port) if parts.port else ""
+    except ValueError:
+        return url
+    if not parts.netloc:
+        return url
+
+    scheme = parts.scheme.lower()
+    if scheme == "http":
+        scheme = "https"
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if port and port != _DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{port}"
+
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/")
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def simhash(text: str, shingle_size: int = 3, bits: int = 64) -> int:
+    """Compute a SimHash fingerprint of text from its word shingles.
+
+    Texts that share most of their shingles get fingerprints that differ in
+    only a few bits.
+
+    Args:
+        text: Text to fingerprint
+        shingle_size: Number of words per shingle
+        bits: Fingerprint size in bits (at most 512)
+
+    Returns:
+        Fingerprint as an integer
+    """
+    words = re.findall(r"\w+", text.lower())
+    if len(words) < shingle_size:
+        shingles = [" ".join(words)] if words else []
+    else:
+        shingles = [
+            " ".join(words[i:i + shingle_size]) for i in range(len(words) - shingle_size + 1)
+        ]
+
+    if not shingles:
+        return 0
+
+    # Count, per bit position, how many shingle hashes have the bit set
+    width = f"0{bits}b"
+    hashes = [
+        format(
+            int.from_bytes(
+                hashlib.blake2b(shingle.encode("utf-8"), digest_size=bits // 8).digest(), "big"
+            ),
+            width,
+        )
+        for shingle in shingles
+    ]
+    threshold = len(hashes) / 2
+    fingerprint = 0
+    for column in zip(*hashes):
+        fingerprint = fingerprint << 1 | (column.count("1") > threshold)
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Count the bits that differ between two fingerprints."""
+    return bin(a ^ b).count("1")
+
+
+class SourceDeduplicator:
+    """Drop repeated sources: the same canonical URL, or near-identical content."""
+
+    def __init__(
+        self, max_distance: Optional[int] = 10, shingle_size: int = 3, min_words: int = 30
+    ):
+        """Initialize the deduplicator.
+
+        Args:
+            max_distance: Largest SimHash Hamming distance (of 64 bits) treated as a
+                near-duplicate (None disables content comparison)
+            shingle_size: Words per shingle for SimHash
+            min_words: Sources with fewer words are only deduplicated by URL
+        """
+        self.max_distance = max_distance
+        self.shingle_size = shingle_size
+        self.min_words = min_words
+        self.urls: Set[str] = set()
+        self.fingerprints: List[int] = []
+        self.kept = 0
+        self.duplicate_urls = 0
+        self.near_duplicates = 0
+
+    def add(self, source: Dict[str, Any]) -> bool:
+        """Check a source against those seen so far and remember it if it is new.
+
+        Args:
+            source: Search result with url and content
+
+        Returns:
+            True if the source should be kept
+        """
+        url = canonicalize_url(source.get("url", ""))
+        if url and url in self.urls:
+            self.duplicate_urls += 1
+            return False
+
+        content = source.get("content") or ""
+        fingerprint = None
+        if self.max_distance is not None and len(content.split()) >= self.min_words:
+            fingerprint = simhash(content, self.shingle_size)
+            for seen in self.fingerprints:
+                if hamming_distance(fingerprint, seen) <= self.max_distance:
+                    self.near_duplicates += 1
+                    return False
+
+        if url:
+            self.urls.add(url)
+        if fingerprint is not None:
+            self.fingerprints.append(fingerprint)
+        self.kept += 1
+        return True
+
+    def dedupe(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Filter a list of sources, keeping the first copy of each.
+
+        Args:
+            sources: Search results in priority order
+
+        Returns:
+            Sources that are not duplicates of an earlier one
+        """
+        return [source for source in sources if self.add(source)]
+
+    def report(self) -> Dict[str, int]:
+        """Get duplicate counts for metadata.
+
+        Returns:
+            Dictionary with kept, duplicate_urls, near_duplicates and removed counts
+        """
+        return {
+            "kept": self.kept,
+            "duplicate_urls": self.duplicate_urls,
+            "near_duplicates": self.near_duplicates,
+            "removed": self.duplicate_urls + self.near_duplicates,
+        }
@@ -0,0 +1,148 @@
+"""Deterministic draft checks that run before the LLM quality review."""
+
+import re
+from typing import List, Optional
+
+from ai_doc_orchestrator.context_packer import topic_terms
+from ai_doc_orchestrator.models import DraftSection, QCIssue
+from ai_doc_orchestrator.sections import split_sections
+
+# Markdown headings of any level
+_HEADING_PATTERN = re.compile(r"^\s{0,3}(#{1,6})\s+(.+?)\s*#*\s*$")
+
+# Headings that count as a closing section
+_CONCLUSION_PATTERN = re.compile(
+    r"\b(conclusion|conclusions|summary|final thoughts|wrap[- ]up|takeaways|closing)\b", re.I
+)
+
+
+class DraftLinter:
+    """Rule-based draft linter.
+
+    Each rule produces a QCIssue with precise feedback; a draft with any issue
+    is rejected without an LLM review.
+    """
+
+    def __init__(
+        self,
+        min_words: int = 150,
+        min_headings: int = 2,
+        require_conclusion: bool = False,
+        require_topic: bool = True,
+        min_duplicate_words: int = 8,
+    ):
+        """Initialize the linter.
+
+        Args:
+            min_words: Minimum number of words in the draft (0 disables the rule)
+            min_headings: Minimum number of markdown headings of any level (0 disables
+                the rule)
+            require_conclusion: Require a conclusion/summary heading (off by default,
+                since not every format has one)
+            require_topic: Require at least one significant topic term in the draft
+            min_duplicate_words: Paragraphs of at least this many words must not repeat
+        """
+        self.min_words = min_words
+        self.min_headings = min_headings
+        self.require_conclusion = require_conclusion
+        self.require_topic = require_topic
+        self.min_duplicate_words = min_duplicate_words
+
+    def lint(
+        self, content: str, topic: str = "", sections: Optional[List[DraftSection]] = None
+    ) -> List[QCIssue]:
+        """Check a draft against all rules.
+
+        Args:
+            content: Draft text
+            topic: Document topic
+            sections: Draft sections (split from content if not given)
+
+        Returns:
+            List of issues (empty if the draft passes)
+        """
+        sections = sections if sections is not None else split_sections(content)
+        issues: List[QCIssue] = []
+
+        word_count = len(re.findall(r"\w+", content))
+        if word_count < self.min_words:
+            issues.append(QCIssue(
+                description=(
+                    f"The draft is too short ({word_count} words; at least "
+                    f"{self.min_words} expected). Expand each section with detail from the notes."
+                )
+            ))
+
+        headings = _headings(content)
+        if len(headings) < self.min_headings:
+            issues.append(QCIssue(
+                description=(
+                    f"The draft has {len(headings)} markdown heading(s); at least "
+                    f"{self.min_headings} expected. Organize it into sections with "
+                    "'#'/'##' headings."
+                )
+            ))
+
+        if self.require_conclusion and headings and not any(
+            _CONCLUSION_PATTERN.search(heading) for heading in headings
+        ):
+            issues.append(QCIssue(
+                description=(
+                    "The draft has no conclusion. Add a closing section (e.g. '## Conclusion')."
+                )
+            ))
+
+        if self.require_topic and topic:
+            terms = topic_terms(topic)
+            words = set(re.findall(r"[a-z0-9]+", content.lower()))
+            if terms and not any(term in words for term in terms):
+                issues.append(QCIssue(
+                    description=f"The draft never mentions the topic '{topic}'."
+                ))
+
+        issues.extend(self._duplicate_paragraphs(sections))
+        return issues
+
+    def _duplicate_paragraphs(self, sections: List[DraftSection]) -> List[QCIssue]:
+        """Find paragraphs that repeat earlier ones (ignoring case and whitespace).
+
+        Args:
+            sections: Draft sections
+
+        Returns:
+            One issue per repeated paragraph, tied to the section it repeats in
+        """
+        issues: List[QCIssue] = []
+        seen = {}
+        for section in sections:
+            for paragraph in re.split(r"\n\s*\n", section.content):
+                words = re.findall(r"\w+", paragraph.lower())
+                if len(words) < self.min_duplicate_words:
+                    continue
+                key = " ".join(words)
+                if key in seen:
+                    preview = " ".join(paragraph.split()[:8])
+                    issues.append(QCIssue(
+                        section=section.anchor,
+                        description=(
+                            f"Paragraph starting '{preview}...' repeats text from section "
+                            f"'{seen[key]}'. Remove or rewrite the duplicate."
+                        ),
+                    ))
+                else:
+                    seen[key] = section.anchor
+        return issues
+
+
+def _headings(content: str) -> List[str]:
+    """Return the text of every markdown heading outside fenced code blocks."""
+    headings: List[str] = []
+    in_code_block = False
+    for line in content.splitlines():
+        if line.lstrip().startswith("```"):
+            in_code_block = not in_code_block
+            continue
+        match = None if in_code_block else _HEADING_PATTERN.match(line)
+        if match:
+            headings.append(match.group(2))
+    return headings
@@ -0,0 +1,164 @@
+"""Concurrent, cached ingestion of local files into context chunks."""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from ai_doc_orchestrator.cache import SQLiteCache
+from ai_doc_orchestrator.concurrency import run_blocking
+from ai_doc_orchestrator.context_packer import ContextChunk, ContextPacker
+from ai_doc_orchestrator.tools.mcp_filesystem import MCPFileSystemTool
+
+# Bump when the stored entry format or text normalization changes
+INGEST_CACHE_VERSION = 2
+
+
+class LocalFileIngestor:
+    """Read, normalize and chunk local files in a thread pool.
+
+    With a cache, each file's normalized text and chunks are stored under its
+    content hash and the extractor (name and version) that read it, and its
+    path, mtime and size map to those. An unchanged file is not even opened; a
+    copy or a re-saved upload with new metadata is hashed but not re-read or
+    re-chunked. Binary files are not cached, so they are picked up once an
+    extractor for their format is registered.
+    """
+
+    def __init__(
+        self,
+        fs_tool: MCPFileSystemTool,
+        context_packer: ContextPacker,
+        cache: Optional[SQLiteCache] = None,
+        max_bytes: Optional[int] = None,
+        max_concurrency: int = 8,
+    ):
+        """Initialize the ingestor.
+
+        Args:
+            fs_tool: File system tool used to read and extract files
+            context_packer: Packer whose chunking settings split the text
+            cache: Persistent cache of normalized text and chunks (None disables it)
+            max_bytes: Bytes read from each file (None reads whole files)
+            max_concurrency: Maximum number of files read at once
+        """
+        self.fs_tool = fs_tool
+        self.context_packer = context_packer
+        self.cache = cache
+        self.max_bytes = max_bytes
+        self.max_concurrency = max(1, max_concurrency)
+
+    async def ingest(self, file_paths: List[str]) -> List[ContextChunk]:
+        """Ingest files concurrently.
+
+        Args:
+            file_paths: Local file paths
+
+        Returns:
+            Chunks of all readable text files, in file_paths order (unreadable
+            and binary files are skipped)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def ingest_one(file_path: str) -> List[ContextChunk]:
+            async with semaphore:
+                try:
+                    return await run_blocking(self.ingest_file, file_path)
+                except Exception as e:
+                    print(f"Error reading file {file_path}: {e}")
+                    return []
+
+        results = await asyncio.gather(*(ingest_one(file_path) for file_path in file_paths))
+        return [chunk for chunks in results for chunk in chunks]
+
+    def ingest_file(self, file_path: str) -> List[ContextChunk]:
+        """Read (or load from cache) and chunk a single file.
+
+        Args:
+            file_path: Local file path
+
+        Returns:
+            The file's chunks
+        """
+        entry = self._load(file_path)
+        return self.context_packer.local_file_chunks(
+            file_path, [(text, tokens) for text, tokens in entry["chunks"]]
+        )
+
+    def _load(self, file_path: str) -> Dict[str, Any]:
+        """Get a file's cache entry, reading and chunking it on a miss."""
+        if self.cache is None:
+            return self._process(file_path)
+
+        path = self.fs_tool.resolve_path(file_path)
+        stat = path.stat()
+        stat_key = SQLiteCache.make_key(
+            "ingest-stat", str(path.resolve()), stat.st_mtime_ns, stat.st_size
+        )
+        known = self.cache.get(stat_key)
+        if known is not None:
+            entry = self.cache.get(self._content_key(known["content_hash"], known["extractor"]))
+            if entry is not None:
+                return entry
+
+        content_hash = self.fs_tool.content_hash(path)
+        extractor = self.fs_tool.extractor_for(path)
+        extractor_id = f"{extractor.name}:{extractor.version}" if extractor else None
+        content_key = self._content_key(content_hash, extractor_id)
+        entry = self.cache.get(content_key)
+        if entry is None:
+            entry = self._process(file_path)
+            if entry.get("binary"):
+                return entry
+            self.cache.set(content_key, entry)
+        self.cache.set(stat_key, {"content_hash": content_hash, "extractor": extractor_id})
+        return entry
+
+    def _content_key(self, content_hash: str, extractor_id: Optional[str]) -> str:
+        """Cache key of the entry for a file's content and extractor under the current settings."""
+        return SQLiteCache.make_key(
+            "ingest-content",
+            content_hash,
+            extractor_id,
+            INGEST_CACHE_VERSION,
+            self.max_bytes,
+            self.context_packer.chunk_tokens,
+        )
+
+    def _process(self, file_path: str) -> Dict[str, Any]:
+        """Read, normalize and chunk a file.
+
+        Returns:
+            Entry with the normalized text and its (text, tokens) chunks ('binary'
+            is set, with no text, for files that could not be read as text)
+        """
+        file_data = self.fs_tool.read_text(file_path, self.max_bytes)
+        if file_data.get("truncated"):
+            print(
+                f"Local file {file_path} is {file_data['size']} bytes; "
+                f"using the first {self.max_bytes}"
+            )
+        if file_data.get("is_binary"):
+            return {"text": "", "chunks": [], "binary": True}
+
+        text = normalize_text(file_data["content"])
+        packer = self.context_packer
+        chunks = [[piece, packer.count_tokens(piece)] for piece in packer.chunk_text(text)]
+        return {"text": text, "chunks": chunks}
+
+
+def normalize_text(text: str) -> str:
+    """Normalize line endings and whitespace while keeping paragraph breaks.
+
+    Args:
+        text: Raw file text
+
+    Returns:
+        Text with '\\n' line endings, no trailing spaces and at most one blank
+        line between paragraphs
+    """
+    lines = [line.rstrip() for line in text.replace("\r\n", "\n").replace("\r", "\n").split("\n")]
+    normalized: List[str] = []
+    for line in lines:
+        if line or (normalized and normalized[-1]):
+            normalized.append(line)
+    return "\n".join(normalized).strip()
+
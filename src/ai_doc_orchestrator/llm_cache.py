@@ -0,0 +1,128 @@
+"""Response cache for LLM calls."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from ai_doc_orchestrator.cache import SQLiteCache
+
+
+class LLMResponseCache:
+    """Two-tier cache for LLM responses.
+
+    An in-memory LRU tier is checked first, then an optional persistent
+    SQLiteCache tier. Persistent hits are promoted into memory.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        persistent: Optional[SQLiteCache] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept in memory
+            persistent: Optional persistent tier shared across processes and runs
+        """
+        self.max_entries = max(1, max_entries)
+        self.persistent = persistent
+        self.memory_hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        full_prompt: str,
+        temperature: float,
+        generation_config: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Build the cache key for an LLM call.
+
+        Args:
+            model: Model name
+            full_prompt: Complete prompt sent to the model
+            temperature: Sampling temperature
+            generation_config: Full generation config sent with the call
+
+        Returns:
+            Hex digest identifying the call
+        """
+        return SQLiteCache.make_key("llm", model, full_prompt, temperature, generation_config or {})
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return self._entries[key]
+
+        if self.persistent is not None:
+            value = self.persistent.get(key)
+            if value is not None:
+                with self._lock:
+                    self.persistent_hits += 1
+                self._remember(key, value)
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, response: str):
+        """Store a response in all tiers.
+
+        Args:
+            key: Key from make_key()
+            response: Response text
+        """
+        self._remember(key, response)
+        if self.persistent is not None:
+            self.persistent.set(key, response)
+
+    def _remember(self, key: str, response: str):
+        """Store a response in the in-memory tier."""
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Clear all tiers and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.memory_hits = 0
+            self.persistent_hits = 0
+            self.misses = 0
+        if self.persistent is not None:
+            self.persistent.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit-rate statistics.
+
+        Returns:
+            Dictionary with per-tier hits, misses, hit_rate and entries
+        """
+        with self._lock:
+            hits = self.memory_hits + self.persistent_hits
+            lookups = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "persistent_hits": self.persistent_hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+            }
@@ -0,0 +1,171 @@
+"""Shared Gemini model registry."""
+
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import google.generativeai as genai
+except ImportError:
+    genai = None
+
+try:
+    # Lets each registry configure its own clients instead of the global default
+    from google.generativeai.client import _ClientManager
+except ImportError:
+    _ClientManager = None
+
+
+def _close_client(client: Any, loop: Optional[asyncio.AbstractEventLoop] = None):
+    """Close a client's transport, ignoring errors.
+
+    Async transports return a coroutine from close(); it is run on the client's
+    loop if that loop is idle, scheduled if it is running, and discarded if it
+    is closed.
+    """
+    close = getattr(getattr(client, "transport", None), "close", None)
+    if close is None:
+        return
+    try:
+        result = close()
+        if asyncio.iscoroutine(result):
+            if loop is None or loop.is_closed():
+                result.close()
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(result, loop)
+            else:
+                loop.run_until_complete(result)
+    except Exception:
+        pass
+
+
+class _KeyedClients:
+    """Clients configured for one API key.
+
+    google-generativeai only exposes a global genai.configure(). Per-key clients
+    need its private _ClientManager and the models' _client and _async_client
+    attributes; all use of those private names is kept here. If they are not
+    available, models fall back to the global configuration.
+    """
+
+    def __init__(self, api_key: str):
+        """Initialize the clients.
+
+        Args:
+            api_key: Google Gemini API key
+        """
+        self.api_key = api_key
+        self.manager = None
+        self.async_clients: List[Tuple[asyncio.AbstractEventLoop, Any]] = []
+        if _ClientManager is not None:
+            try:
+                manager = _ClientManager()
+                manager.configure(api_key=api_key)
+                self.manager = manager
+            except Exception as e:
+                print(f"Per-key Gemini clients unavailable ({e}); using genai.configure()")
+
+    def bind(self, model: Any, loop: Optional[asyncio.AbstractEventLoop]):
+        """Attach clients for this key to a model instance.
+
+        Args:
+            model: GenerativeModel instance
+            loop: Running event loop to create an async client for (None for sync use)
+        """
+        if self.manager is None:
+            # SDK without per-client configuration: fall back to the global default
+            genai.configure(api_key=self.api_key)
+            return
+        model._client = self.manager.get_default_client("generative")
+        if loop is not None:
+            client = self.manager.make_client("generative_async")
+            model._async_client = client
+            self.async_clients.append((loop, client))
+
+    def prune(self):
+        """Release async clients whose event loop has been closed."""
+        for loop, client in [entry for entry in self.async_clients if entry[0].is_closed()]:
+            _close_client(client, loop)
+            self.async_clients.remove((loop, client))
+
+    def close(self):
+        """Close the shared sync clients and every async client created."""
+        if self.manager is not None:
+            for client in getattr(self.manager, "clients", {}).values():
+                _close_client(client)
+        for loop, client in self.async_clients:
+            _close_client(client, loop)
+        self.async_clients.clear()
+
+
+class ModelRegistry:
+    """Registry of Gemini model instances shared across agents and calls.
+
+    Models are created once per (api key, model name) and bound to clients
+    configured for that key, so registries with different keys do not affect
+    each other through genai.configure(). Async clients are tied to the event
+    loop they were created on, so models used from a running loop are cached
+    per loop.
+    """
+
+    def __init__(self, api_key: str):
+        """Initialize the registry.
+
+        Args:
+            api_key: Default Google Gemini API key for models from this registry
+        """
+        if genai is None:
+            raise ImportError(
+                "google-generativeai is required. Install with: pip install google-generativeai"
+            )
+        self.api_key = api_key
+        self._models: Dict[Tuple[str, str, Optional[int]], Tuple[Any, Any]] = {}
+        self._clients: Dict[str, _KeyedClients] = {}
+        self._lock = threading.Lock()
+
+    def get_model(self, model_name: str, api_key: Optional[str] = None) -> Any:
+        """Get the shared model instance for a model name.
+
+        Args:
+            model_name: Gemini model name (with or without the 'models/' prefix)
+            api_key: API key to use instead of the registry default
+
+        Returns:
+            GenerativeModel instance
+        """
+        api_key = api_key or self.api_key
+        if not model_name.startswith("models/"):
+            model_name = f"models/{model_name}"
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        key = (api_key, model_name, id(loop) if loop else None)
+
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is not None and entry[0] is loop:
+                return entry[1]
+
+            # Drop models and clients bound to loops that have since been closed
+            for stale_key in [k for k, (l, _) in self._models.items() if l and l.is_closed()]:
+                del self._models[stale_key]
+            for clients in self._clients.values():
+                clients.prune()
+
+            clients = self._clients.get(api_key)
+            if clients is None:
+                clients = _KeyedClients(api_key)
+                self._clients[api_key] = clients
+            model = genai.GenerativeModel(model_name)
+            clients.bind(model, loop)
+            self._models[key] = (loop, model)
+            return model
+
+    def close(self):
+        """Release all models and close the sync and async clients held by the registry."""
+        with self._lock:
+            for clients in self._clients.values():
+                clients.close()
+            self._clients.clear()
+            self._models.clear()
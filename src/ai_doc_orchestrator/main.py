@@ -1,43 +1,115 @@
 """Main entry point for the AI Document Orchestrator."""
 
+import argparse
 import asyncio
 import sys
 
-from ai_doc_orchestrator.models import OutputFormat
+from ai_doc_orchestrator.batch import load_batch_jobs, run_batch
+from ai_doc_orchestrator.models import OutputFormat, UserInput
 from ai_doc_orchestrator.orchestrator import DocumentOrchestrator
 
 
+async def main_batch(argv: list):
+    """Batch entry point: run many topics through one orchestrator.
+
+    Args:
+        argv: Command line arguments after --batch
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m ai_doc_orchestrator.main --batch",
+        description="Generate documents for every topic in a JSONL/CSV file or stdin.",
+    )
+    parser.add_argument("source", help="Path to a .jsonl or .csv file, or '-' for stdin")
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=4, help="Pipelines to run at once (default: 4)"
+    )
+    parser.add_argument(
+        "-m", "--manifest", default="batch_manifest.jsonl",
+        help="Results manifest, appended as jobs finish (default: batch_manifest.jsonl)",
+    )
+    args = parser.parse_args(argv)
+
+    jobs = load_batch_jobs(args.source)
+    print(f"\n🚀 Starting batch of {len(jobs)} document(s), concurrency {args.concurrency}")
+
+    with DocumentOrchestrator() as orchestrator:
+        results = await run_batch(
+            orchestrator, jobs, concurrency=args.concurrency, manifest_path=args.manifest
+        )
+
+    failed = sum(1 for r in results if r["status"] != "completed")
+    print(f"\n✅ Batch finished: {len(results) - failed} completed, {failed} failed")
+    print(f"  Manifest: {args.manifest}")
+    if failed:
+        sys.exit(1)
+
+
 async def main():
     """Main entry point."""
     if len(sys.argv) < 2:
-        print("Usage: python -m ai_doc_orchestrator.main <topic> [format] [local_files...]")
+        print(
+            "Usage: python -m ai_doc_orchestrator.main <topic> [format] [local_files...]"
+            " [--run-id ID]"
+        )
+        print("       python -m ai_doc_orchestrator.main --batch <jobs.jsonl|jobs.csv|-> [-c N] [-m out]")
         print("\nFormats: text, pdf, google_docs")
         print("\nExample:")
         print("  python -m ai_doc_orchestrator.main 'Machine Learning Basics' pdf")
+        print("  python -m ai_doc_orchestrator.main 'ML Basics' pdf --run-id ml-basics")
+        print("  python -m ai_doc_orchestrator.main --batch topics.jsonl -c 8")
         sys.exit(1)
 
-    topic = sys.argv[1]
-    output_format = sys.argv[2] if len(sys.argv) > 2 else "text"
-    local_files = sys.argv[3:] if len(sys.argv) > 3 else None
+    if sys.argv[1] == "--batch":
+        await main_batch(sys.argv[2:])
+        return
+
+    parser = argparse.ArgumentParser(
+        prog="python -m ai_doc_orchestrator.main",
+        description="Generate a document for one topic.",
+    )
+    parser.add_argument("topic", help="Document topic")
+    parser.add_argument("format", nargs="?", default="text", help="Output format (default: text)")
+    parser.add_argument("local_files", nargs="*", help="Local files to include in research")
+    parser.add_argument(
+        "--run-id",
+        help="Run ID; with CHECKPOINT_DIR set, re-running with the same ID resumes the run",
+    )
+    args = parser.parse_args(sys.argv[1:])
+
+    topic = args.topic
+    output_format = args.format
+    local_files = args.local_files or None
 
     try:
-        # Initialize orchestrator
-        orchestrator = DocumentOrchestrator()
+        try:
+            format_enum = OutputFormat(output_format.lower())
+        except ValueError:
+            format_enum = OutputFormat.TEXT
+        user_input = UserInput(topic=topic, format=format_enum)
 
-        # Run the workflow
-        print(f"\n🚀 Starting document generation for topic: '{topic}'")
-        print(f"📄 Output format: {output_format}\n")
+        # The context manager releases model clients, caches and the PDF process pool
+        with DocumentOrchestrator() as orchestrator:
+            print(f"\n🚀 Starting document generation for topic: '{topic}'")
+            print(f"📄 Output format: {output_format}\n")
 
-        result = await orchestrator.run(
-            topic=topic,
-            output_format=output_format,
-            local_files=local_files,
-        )
+            # Stream draft text to the terminal as the writer produces it
+            result = {}
+            async for event in orchestrator.stream(user_input, local_files, run_id=args.run_id):
+                if event.type == "draft_started":
+                    print(f"\n--- Draft v{event.data['version']} ---")
+                elif event.type == "chunk":
+                    print(event.data["text"], end="", flush=True)
+                elif event.type == "draft":
+                    print()
+                elif event.type == "output":
+                    result = event.data["final_output"]
 
         # Display results
         print("\n✅ Document generation completed!")
         print("\nResults:")
-        print(f"  Format: {result['format']}")
+        print(f"  Format: {OutputFormat(result['format']).value}")
+        if result["metadata"].get("run_id"):
+            print(f"  Run ID: {result['metadata']['run_id']}")
         
         if result.get("file_path"):
             print(f"  File: {result['file_path']}")
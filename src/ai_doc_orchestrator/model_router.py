@@ -0,0 +1,118 @@
+"""Per-agent and per-step model selection with fallbacks."""
+
+import os
+from typing import Dict, List, Optional
+
+# Steps that do little reasoning and run well on a lighter model
+CHEAP_STEPS = [
+    "ResearchAgent.queries",
+    "SummaryAgent.key_points",
+    "SummaryAgent.map",
+]
+
+
+def _parse_mapping(value: str) -> Dict[str, str]:
+    """Parse 'key=value,key=value' into a dictionary."""
+    mapping = {}
+    for item in value.split(","):
+        if "=" in item:
+            key, _, target = item.partition("=")
+            if key.strip() and target.strip():
+                mapping[key.strip()] = target.strip()
+    return mapping
+
+
+class ModelRouter:
+    """Choose the model for each LLM call.
+
+    Routes are keyed by agent name ('WriterAgent') or agent and step
+    ('SummaryAgent.key_points'); the most specific match wins, and calls
+    without a route use the default model. Fallbacks map a model to the one
+    tried when it fails after retries.
+    """
+
+    def __init__(
+        self,
+        default_model: str = "gemini-2.5-flash",
+        routes: Optional[Dict[str, str]] = None,
+        fallbacks: Optional[Dict[str, str]] = None,
+    ):
+        """Initialize the router.
+
+        Args:
+            default_model: Model for calls without a route
+            routes: Model per 'Agent' or 'Agent.step' key
+            fallbacks: Model to try when the keyed model fails
+        """
+        self.default_model = default_model
+        self.routes = dict(routes or {})
+        self.fallbacks = dict(fallbacks or {})
+
+    @classmethod
+    def from_env(
+        cls,
+        default_model: str = "gemini-2.5-flash",
+        routes: Optional[Dict[str, str]] = None,
+        fallbacks: Optional[Dict[str, str]] = None,
+    ) -> "ModelRouter":
+        """Build a router from environment variables, with explicit arguments taking precedence.
+
+        Reads FAST_MODEL (routes CHEAP_STEPS to it), MODEL_ROUTES
+        ('WriterAgent=gemini-2.5-pro,ResearchAgent.queries=gemini-2.5-flash-lite')
+        and MODEL_FALLBACKS ('gemini-2.5-pro=gemini-2.5-flash').
+
+        Args:
+            default_model: Model for calls without a route
+            routes: Routes that override the environment
+            fallbacks: Fallbacks that override the environment
+
+        Returns:
+            ModelRouter instance
+        """
+        env_routes: Dict[str, str] = {}
+        fast_model = os.getenv("FAST_MODEL")
+        if fast_model:
+            env_routes.update({step: fast_model for step in CHEAP_STEPS})
+        env_routes.update(_parse_mapping(os.getenv("MODEL_ROUTES", "")))
+        env_routes.update(routes or {})
+
+        env_fallbacks = _parse_mapping(os.getenv("MODEL_FALLBACKS", ""))
+        env_fallbacks.update(fallbacks or {})
+        return cls(default_model, env_routes, env_fallbacks)
+
+    def model_for(
+        self, agent: str, step: Optional[str] = None, default: Optional[str] = None
+    ) -> str:
+        """Get the model for an agent's step.
+
+        Args:
+            agent: Agent name
+            step: Step name within the agent (None for the agent's general calls)
+            default: Model to use when no route matches (defaults to default_model)
+
+        Returns:
+            Model name
+        """
+        if step and f"{agent}.{step}" in self.routes:
+            return self.routes[f"{agent}.{step}"]
+        if agent in self.routes:
+            return self.routes[agent]
+        return default or self.default_model
+
+    def candidates(
+        self, agent: str, step: Optional[str] = None, default: Optional[str] = None
+    ) -> List[str]:
+        """Get the routed model followed by its fallback chain.
+
+        Args:
+            agent: Agent name
+            step: Step name within the agent
+            default: Model to use when no route matches
+
+        Returns:
+            Model names to try in order (no repeats)
+        """
+        models = [self.model_for(agent, step, default)]
+        while models[-1] in self.fallbacks and self.fallbacks[models[-1]] not in models:
+            models.append(self.fallbacks[models[-1]])
+        return models
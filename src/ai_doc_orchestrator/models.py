@@ -21,6 +21,19 @@ class UserInput(BaseModel):
     format: OutputFormat = Field(..., description="Desired output format")
 
 
+class BatchJob(BaseModel):
+    """A single document request in a batch run."""
+
+    topic: str = Field(..., description="The topic to research and write about")
+    format: OutputFormat = Field(default=OutputFormat.TEXT, description="Desired output format")
+    local_files: List[str] = Field(
+        default_factory=list, description="Local file paths to include"
+    )
+    run_id: Optional[str] = Field(
+        None, description="Run identifier, reused to resume from checkpoints"
+    )
+
+
 class RawData(BaseModel):
     """Raw data collected from research."""
 
@@ -30,6 +43,9 @@ class RawData(BaseModel):
     search_queries: List[str] = Field(
         default_factory=list, description="Search queries used"
     )
+    metadata: Dict[str, Any] = Field(
+        default_factory=dict, description="Research metadata (e.g. deduplication counts)"
+    )
 
 
 class StructuredNotes(BaseModel):
@@ -37,22 +53,45 @@ class StructuredNotes(BaseModel):
 
     summary: str = Field(..., description="Main summary of the research")
     key_points: List[str] = Field(default_factory=list, description="Key points extracted")
+    insights: List[str] = Field(
+        default_factory=list, description="Important insights and findings"
+    )
     sources: List[str] = Field(default_factory=list, description="Source references")
     metadata: Dict[str, Any] = Field(
         default_factory=dict, description="Additional metadata"
     )
 
 
+class DraftSection(BaseModel):
+    """A top-level section of a draft."""
+
+    anchor: str = Field(..., description="Stable section identifier derived from the heading")
+    heading: str = Field(default="", description="Section heading (empty for the preamble)")
+    content: str = Field(..., description="Section text, including its heading line")
+
+
 class Draft(BaseModel):
     """Document draft."""
 
     content: str = Field(..., description="The draft content")
+    sections: List[DraftSection] = Field(
+        default_factory=list, description="Draft split into anchored sections"
+    )
     version: int = Field(default=1, description="Draft version number")
     metadata: Dict[str, Any] = Field(
         default_factory=dict, description="Draft metadata"
     )
 
 
+class QCIssue(BaseModel):
+    """A quality issue, optionally tied to a draft section."""
+
+    description: str = Field(..., description="What needs to be fixed")
+    section: Optional[str] = Field(
+        None, description="Anchor of the affected section (None for document-wide issues)"
+    )
+
+
 class QCFeedback(BaseModel):
     """Quality check feedback."""
 
@@ -63,6 +102,18 @@ class QCFeedback(BaseModel):
     issues: List[str] = Field(
         default_factory=list, description="List of specific issues found"
     )
+    section_issues: List[QCIssue] = Field(
+        default_factory=list, description="Issues with the sections they apply to"
+    )
+    scores: Dict[str, float] = Field(
+        default_factory=dict, description="Per-dimension quality scores (1-10)"
+    )
+    overall_score: Optional[float] = Field(
+        None, description="Overall quality score (1-10), if the verdict was scored"
+    )
+    reviewer: str = Field(
+        default="llm", description="What produced the verdict: 'llm' or 'linter'"
+    )
 
 
 class AgentMessage(BaseModel):
@@ -88,3 +139,15 @@ class FinalOutput(BaseModel):
         default_factory=dict, description="Additional output metadata"
     )
 
+
+class PipelineEvent(BaseModel):
+    """Progress event emitted while a document is being generated."""
+
+    type: str = Field(
+        ...,
+        description=(
+            "Event type: 'phase', 'draft_started', 'chunk', 'draft', 'qc', 'result' or 'output'"
+        ),
+    )
+    phase: str = Field(..., description="Phase the event belongs to")
+    data: Dict[str, Any] = Field(default_factory=dict, description="Event payload")
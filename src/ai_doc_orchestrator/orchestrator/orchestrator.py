@@ -1,7 +1,9 @@
 """Main orchestrator for coordinating all agents and phases."""
 
+import asyncio
 import os
-from typing import Any, Dict, Optional
+import uuid
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
@@ -10,12 +12,24 @@ from ai_doc_orchestrator.agents.qc import QCAgent
 from ai_doc_orchestrator.agents.research import ResearchAgent
 from ai_doc_orchestrator.agents.summary import SummaryAgent
 from ai_doc_orchestrator.agents.writer import WriterAgent
+from ai_doc_orchestrator.base_agent import BaseAgent
+from ai_doc_orchestrator.cache import SQLiteCache
+from ai_doc_orchestrator.checkpoint import CheckpointStore, FileCheckpointStore
+from ai_doc_orchestrator.concurrency import shutdown_process_executor
+from ai_doc_orchestrator.context_packer import ContextPacker
+from ai_doc_orchestrator.llm_cache import LLMResponseCache
+from ai_doc_orchestrator.llm_client import ModelRegistry
+from ai_doc_orchestrator.model_router import ModelRouter
 from ai_doc_orchestrator.models import (
     AgentMessage,
     FinalOutput,
     OutputFormat,
+    PipelineEvent,
     UserInput,
 )
+from ai_doc_orchestrator.rate_limit import RateLimitGovernor
+from ai_doc_orchestrator.retry import RetryPolicy
+from ai_doc_orchestrator.run_context import start_run
 from ai_doc_orchestrator.tools.google_docs import GoogleDocsTool
 from ai_doc_orchestrator.tools.mcp_filesystem import MCPFileSystemTool
 from ai_doc_orchestrator.tools.pdf_generator import PDFGeneratorTool
@@ -24,6 +38,13 @@ from ai_doc_orchestrator.tools.search import SearchTool
 # Load environment variables
 load_dotenv()
 
+# Agents whose LLM responses are cached when the response cache is enabled.
+# WriterAgent is left out: its drafts are meant to vary between runs.
+DEFAULT_LLM_CACHE_AGENTS = ["ResearchAgent", "SummaryAgent", "QCAgent"]
+
+# Writer temperatures for speculative drafts, used in order (cycled if more drafts are requested)
+SPECULATIVE_TEMPERATURES = [0.7, 0.9, 0.5, 1.0, 0.3]
+
 
 class DocumentOrchestrator:
     """Orchestrator that coordinates all agents through the document generation workflow."""
@@ -35,6 +56,22 @@ class DocumentOrchestrator:
         tavily_api_key: Optional[str] = None,
         google_credentials_path: Optional[str] = None,
         output_dir: Optional[str] = None,
+        search_cache_path: Optional[str] = None,
+        extraction_cache_path: Optional[str] = None,
+        ingest_cache_path: Optional[str] = None,
+        llm_cache: Optional[bool] = None,
+        llm_cache_path: Optional[str] = None,
+        llm_cache_agents: Optional[List[str]] = None,
+        governor: Optional[RateLimitGovernor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_policies: Optional[Dict[str, RetryPolicy]] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        qc_score_threshold: Optional[float] = None,
+        model_routes: Optional[Dict[str, str]] = None,
+        model_fallbacks: Optional[Dict[str, str]] = None,
+        speculative_drafts: Optional[int] = None,
+        pipelined_research: Optional[bool] = None,
+        pdf_render_processes: Optional[bool] = None,
     ):
         """Initialize the orchestrator.
 
@@ -44,6 +81,39 @@ class DocumentOrchestrator:
             tavily_api_key: Tavily API key (defaults to TAVILY_API_KEY env var)
             google_credentials_path: Path to Google service account JSON
             output_dir: Directory for output files
+            search_cache_path: Path to the SQLite search result cache
+                (defaults to SEARCH_CACHE_PATH env var; caching is off if neither is set)
+            extraction_cache_path: Path to the SQLite cache of text extracted from local
+                PDF/DOCX/HTML files (defaults to EXTRACTION_CACHE_PATH env var; caching is
+                off if neither is set)
+            ingest_cache_path: Path to the SQLite cache of normalized, chunked local files
+                (defaults to INGEST_CACHE_PATH env var; caching is off if neither is set)
+            llm_cache: Enable the LLM response cache (defaults to LLM_CACHE env var)
+            llm_cache_path: Path to the persistent LLM cache tier
+                (defaults to LLM_CACHE_PATH env var; memory-only if neither is set)
+            llm_cache_agents: Names of agents whose responses are cached
+                (defaults to DEFAULT_LLM_CACHE_AGENTS)
+            governor: Rate limit governor shared by all LLM and search calls
+                (defaults to one built from GEMINI_*/TAVILY_* env vars)
+            retry_policy: Default retry policy for LLM, search and Google Docs calls
+            retry_policies: Per-component overrides keyed by agent name
+                (e.g. 'WriterAgent'), 'search' or 'google_docs'
+            checkpoint_store: Store for per-phase outputs so failed runs can resume
+                (defaults to a FileCheckpointStore in CHECKPOINT_DIR if that env var is set)
+            qc_score_threshold: Overall QC score (1-10) at which a draft is accepted even
+                if QC did not approve it (defaults to QC_SCORE_THRESHOLD env var; unset
+                means only approved drafts are accepted)
+            model_routes: Model per agent ('WriterAgent') or step ('SummaryAgent.key_points'),
+                merged over FAST_MODEL/MODEL_ROUTES env vars; unrouted calls use model
+            model_fallbacks: Model to try when another fails after retries, merged over
+                the MODEL_FALLBACKS env var
+            speculative_drafts: Number of first drafts to write and review concurrently,
+                keeping the best-scoring one (defaults to SPECULATIVE_DRAFTS env var, then 1)
+            pipelined_research: Summarize search results as they arrive instead of after
+                all searches finish (defaults to PIPELINED_RESEARCH env var)
+            pdf_render_processes: Lay out PDFs in the shared process pool instead of a
+                thread (defaults to PDF_RENDER_PROCESSES env var; the pool is shut down
+                in close())
         """
         # Get Gemini API key (strip quotes if present)
         api_key = gemini_api_key or os.getenv("GOOGLE_GEMINI_API_KEY")
@@ -52,47 +122,204 @@ class DocumentOrchestrator:
         api_key = api_key.strip('"\'')  # Remove quotes if present
         self.model = model
 
-        # Initialize agents with Gemini API key
-        self.research_agent = ResearchAgent(gemini_api_key=api_key, model=model)
-        self.summary_agent = SummaryAgent(gemini_api_key=api_key, model=model)
-        self.writer_agent = WriterAgent(gemini_api_key=api_key, model=model)
-        self.qc_agent = QCAgent(gemini_api_key=api_key, model=model)
-        self.formatting_agent = FormattingAgent(gemini_api_key=api_key, model=model)
+        checkpoint_dir = os.getenv("CHECKPOINT_DIR")
+        if checkpoint_store is None and checkpoint_dir:
+            checkpoint_store = FileCheckpointStore(checkpoint_dir)
+        self.checkpoint_store = checkpoint_store
+
+        # Model clients are shared by all agents and released in close()
+        self.model_registry = ModelRegistry(api_key)
+
+        # Initialize agents with the shared model registry
+        agent_kwargs = {"model": model, "model_registry": self.model_registry}
+        self.research_agent = ResearchAgent(**agent_kwargs)
+        self.summary_agent = SummaryAgent(
+            context_packer=ContextPacker(
+                token_budget=int(os.getenv("SUMMARY_CONTEXT_TOKENS", "12000"))
+            ),
+            map_reduce_threshold=int(os.getenv("SUMMARY_MAP_REDUCE_TOKENS", "24000")),
+            map_concurrency=int(os.getenv("SUMMARY_MAP_CONCURRENCY", "4")),
+            structured_output=os.getenv("SUMMARY_STRUCTURED_OUTPUT", "true").lower()
+            not in ("0", "false", "no"),
+            local_file_max_bytes=int(os.getenv("LOCAL_FILE_MAX_BYTES", "2000000")) or None,
+            **agent_kwargs,
+        )
+        self.writer_agent = WriterAgent(**agent_kwargs)
+        self.qc_agent = QCAgent(
+            structured_output=os.getenv("QC_STRUCTURED_OUTPUT", "true").lower()
+            not in ("0", "false", "no"),
+            **agent_kwargs,
+        )
+        if qc_score_threshold is None and os.getenv("QC_SCORE_THRESHOLD"):
+            qc_score_threshold = float(os.getenv("QC_SCORE_THRESHOLD"))
+        self.qc_score_threshold = qc_score_threshold
+        if speculative_drafts is None:
+            speculative_drafts = int(os.getenv("SPECULATIVE_DRAFTS", "1"))
+        self.speculative_drafts = max(1, speculative_drafts)
+        if pipelined_research is None:
+            pipelined_research = os.getenv("PIPELINED_RESEARCH", "").lower() in ("1", "true", "yes")
+        self.pipelined_research = pipelined_research
+        self.formatting_agent = FormattingAgent(**agent_kwargs)
+
+        # Route cheap steps to lighter models and fall back on failures
+        self.model_router = ModelRouter.from_env(model, model_routes, model_fallbacks)
+        for agent in self.agents:
+            agent.set_model_router(self.model_router)
+
+        # All provider calls wait on one shared governor
+        self.governor = governor or RateLimitGovernor.from_env()
+        for agent in self.agents:
+            agent.set_governor(self.governor)
+
+        # Retry transient provider failures, with optional per-agent policies
+        retry_policy = retry_policy or RetryPolicy()
+        self.retry_policies = dict(retry_policies or {})
+        for agent in self.agents:
+            agent.set_retry_policy(self.retry_policies.get(agent.name, retry_policy))
+
+        # Setup the LLM response cache
+        if llm_cache is None:
+            llm_cache = os.getenv("LLM_CACHE", "").lower() in ("1", "true", "yes")
+        self.llm_cache: Optional[LLMResponseCache] = None
+        if llm_cache:
+            persistent = None
+            cache_path = llm_cache_path or os.getenv("LLM_CACHE_PATH")
+            if cache_path:
+                ttl = os.getenv("LLM_CACHE_TTL")
+                persistent = SQLiteCache(
+                    cache_path,
+                    ttl=float(ttl) if ttl else None,
+                    max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000")),
+                )
+            self.llm_cache = LLMResponseCache(
+                max_entries=int(os.getenv("LLM_CACHE_MEMORY_ENTRIES", "256")),
+                persistent=persistent,
+            )
+            cached_agents = set(llm_cache_agents or DEFAULT_LLM_CACHE_AGENTS)
+            for agent in self.agents:
+                agent.set_response_cache(self.llm_cache, enabled=agent.name in cached_agents)
 
         # Initialize tools
         tavily_key = tavily_api_key or os.getenv("TAVILY_API_KEY")
         if tavily_key:
             tavily_key = tavily_key.strip('"\'')  # Remove quotes if present
-        search_tool = SearchTool(api_key=tavily_key, provider="tavily")
+        self.search_cache: Optional[SQLiteCache] = None
+        cache_path = search_cache_path or os.getenv("SEARCH_CACHE_PATH")
+        if cache_path:
+            self.search_cache = SQLiteCache(
+                cache_path,
+                ttl=float(os.getenv("SEARCH_CACHE_TTL", "86400")),
+                max_entries=int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "5000")),
+            )
+        search_tool = SearchTool(
+            api_key=tavily_key,
+            provider="tavily",
+            cache=self.search_cache,
+            cache_bypass=os.getenv("SEARCH_CACHE_BYPASS", "").lower() in ("1", "true", "yes"),
+            governor=self.governor,
+            retry_policy=self.retry_policies.get("search", retry_policy),
+        )
         self.research_agent.set_search_tool(search_tool)
 
-        fs_tool = MCPFileSystemTool()
+        self.extraction_cache: Optional[SQLiteCache] = None
+        extraction_path = extraction_cache_path or os.getenv("EXTRACTION_CACHE_PATH")
+        if extraction_path:
+            self.extraction_cache = SQLiteCache(
+                extraction_path,
+                max_entries=int(os.getenv("EXTRACTION_CACHE_MAX_ENTRIES", "500")),
+            )
+        fs_tool = MCPFileSystemTool(extraction_cache=self.extraction_cache)
         self.summary_agent.set_filesystem_tool(fs_tool)
 
+        self.ingest_cache: Optional[SQLiteCache] = None
+        ingest_path = ingest_cache_path or os.getenv("INGEST_CACHE_PATH")
+        if ingest_path:
+            self.ingest_cache = SQLiteCache(
+                ingest_path,
+                max_entries=int(os.getenv("INGEST_CACHE_MAX_ENTRIES", "2000")),
+            )
+        self.summary_agent.set_ingest_cache(self.ingest_cache)
+
         # Setup formatting tools
         google_creds = google_credentials_path or os.getenv("GOOGLE_CREDENTIALS_PATH")
         if google_creds:
             try:
-                google_docs_tool = GoogleDocsTool(credentials_path=google_creds)
+                google_docs_tool = GoogleDocsTool(
+                    credentials_path=google_creds,
+                    retry_policy=self.retry_policies.get("google_docs", retry_policy),
+                )
                 self.formatting_agent.set_google_docs_tool(google_docs_tool)
             except Exception as e:
                 print(f"Warning: Could not initialize Google Docs tool: {e}")
 
-        pdf_tool = PDFGeneratorTool(output_dir=output_dir)
+        if pdf_render_processes is None:
+            pdf_render_processes = os.getenv("PDF_RENDER_PROCESSES", "").lower() in (
+                "1", "true", "yes"
+            )
+        self.pdf_render_processes = pdf_render_processes
+        pdf_tool = PDFGeneratorTool(output_dir=output_dir, use_processes=pdf_render_processes)
         self.formatting_agent.set_pdf_tool(pdf_tool)
 
-    async def process(self, user_input: UserInput, local_files: Optional[list] = None) -> FinalOutput:
-        """Process user input through all phases.
+    def close(self):
+        """Release model clients, close caches and shut down the PDF process pool."""
+        self.model_registry.close()
+        if self.pdf_render_processes:
+            shutdown_process_executor()
+        if self.search_cache is not None:
+            self.search_cache.close()
+        if self.extraction_cache is not None:
+            self.extraction_cache.close()
+        if self.ingest_cache is not None:
+            self.ingest_cache.close()
+        if self.llm_cache is not None and self.llm_cache.persistent is not None:
+            self.llm_cache.persistent.close()
+
+    def __enter__(self) -> "DocumentOrchestrator":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    async def __aenter__(self) -> "DocumentOrchestrator":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def agents(self) -> List[BaseAgent]:
+        """All agents managed by this orchestrator."""
+        return [
+            self.research_agent,
+            self.summary_agent,
+            self.writer_agent,
+            self.qc_agent,
+            self.formatting_agent,
+        ]
+
+    def _load_checkpoint(self, run_id: str, key: str) -> Optional[Dict[str, Any]]:
+        """Load a checkpoint if a store is configured."""
+        if self.checkpoint_store is None:
+            return None
+        return self.checkpoint_store.load(run_id, key)
+
+    def _save_checkpoint(self, run_id: str, key: str, data: Dict[str, Any]):
+        """Save a checkpoint if a store is configured."""
+        if self.checkpoint_store is not None:
+            self.checkpoint_store.save(run_id, key, data)
+
+    async def _research_and_summarize(
+        self, user_input: UserInput, local_files: Optional[list]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run research and summary as one pipeline connected by a queue.
 
         Args:
             user_input: User input with topic and format
             local_files: Optional list of local file paths to include
 
         Returns:
-            FinalOutput with the generated document
+            Tuple of raw data and structured notes
         """
-        # Phase 1: Information Gathering
-        print("Phase 1: Information Gathering...")
         research_message = AgentMessage(
             from_agent="Orchestrator",
             to_agent="ResearchAgent",
@@ -102,47 +329,82 @@ class DocumentOrchestrator:
                 "format": user_input.format.value,
             },
         )
-        research_result = await self.research_agent.process(research_message)
-        raw_data = research_result["raw_data"]
-
-        # Phase 2: Processing
-        print("Phase 2: Processing...")
         summary_message = AgentMessage(
             from_agent="ResearchAgent",
             to_agent="SummaryAgent",
             phase="summary",
             data={
-                "raw_data": raw_data,
                 "local_files": local_files or [],
+                "topic": user_input.topic,
             },
         )
-        summary_result = await self.summary_agent.process(summary_message)
-        structured_notes = summary_result["structured_notes"]
+        events: asyncio.Queue = asyncio.Queue()
+        raw_data: Dict[str, Any] = {}
 
-        # Phase 3: Creation & Iteration (The Loop)
-        print("Phase 3: Creation & Iteration...")
-        draft_version = 1
-        max_iterations = 3
-        qc_feedback_text = ""
+        async def produce():
+            try:
+                async for event in self.research_agent.stream(research_message):
+                    if event.type == "result":
+                        raw_data.update(event.data["raw_data"])
+                    await events.put(event)
+            finally:
+                await events.put(None)
 
-        while draft_version <= max_iterations:
-            # Writer creates/revises draft
+        summary_task = asyncio.ensure_future(
+            self.summary_agent.process_pipelined(summary_message, events)
+        )
+        try:
+            await produce()
+        except BaseException:
+            summary_task.cancel()
+            raise
+        summary_result = await summary_task
+        return raw_data, summary_result["structured_notes"]
+
+    def _passes_qc(self, qc_feedback: Dict[str, Any]) -> bool:
+        """Check whether a QC verdict approves the draft or meets the score threshold."""
+        overall_score = qc_feedback.get("overall_score")
+        return qc_feedback["approved"] or (
+            self.qc_score_threshold is not None
+            and overall_score is not None
+            and overall_score >= self.qc_score_threshold
+        )
+
+    async def _speculate(
+        self, user_input: UserInput, structured_notes: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Write and review several first drafts concurrently and pick the best.
+
+        Candidates use different writer temperatures. The best passing candidate
+        (highest overall score, then earliest) wins; if none pass, the best-scoring
+        one is returned so the revision loop can continue from it.
+
+        Args:
+            user_input: User input with topic and format
+            structured_notes: Structured notes from the summary phase
+
+        Returns:
+            Dictionary with the chosen draft, its qc_feedback and a report for metadata
+        """
+        temperatures = [
+            SPECULATIVE_TEMPERATURES[i % len(SPECULATIVE_TEMPERATURES)]
+            for i in range(self.speculative_drafts)
+        ]
+
+        async def candidate(temperature: float) -> Dict[str, Any]:
             writer_message = AgentMessage(
-                from_agent="SummaryAgent" if draft_version == 1 else "QCAgent",
+                from_agent="SummaryAgent",
                 to_agent="WriterAgent",
                 phase="writing",
                 data={
                     "structured_notes": structured_notes,
                     "topic": user_input.topic,
                     "format": user_input.format.value,
-                    "version": draft_version,
-                    "feedback": qc_feedback_text if draft_version > 1 else "",
+                    "version": 1,
+                    "temperature": temperature,
                 },
             )
-            writer_result = await self.writer_agent.process(writer_message)
-            draft = writer_result["draft"]
-
-            # QC checks the draft
+            draft = (await self.writer_agent.process(writer_message))["draft"]
             qc_message = AgentMessage(
                 from_agent="WriterAgent",
                 to_agent="QCAgent",
@@ -153,11 +415,289 @@ class DocumentOrchestrator:
                     "format": user_input.format.value,
                 },
             )
-            qc_result = await self.qc_agent.process(qc_message)
-            qc_feedback = qc_result["qc_feedback"]
+            qc_feedback = (await self.qc_agent.process(qc_message))["qc_feedback"]
+            return {"draft": draft, "qc_feedback": qc_feedback}
+
+        candidates = await asyncio.gather(
+            *[candidate(temperature) for temperature in temperatures],
+            return_exceptions=True,
+        )
+        scored = [
+            (i, result)
+            for i, result in enumerate(candidates)
+            if not isinstance(result, BaseException)
+        ]
+        if not scored:
+            raise candidates[0]
+
+        def rank(item):
+            index, result = item
+            qc_feedback = result["qc_feedback"]
+            score = qc_feedback.get("overall_score")
+            return (self._passes_qc(qc_feedback), score if score is not None else 0.0, -index)
+
+        selected, best = max(scored, key=rank)
+        passed = self._passes_qc(best["qc_feedback"])
+        print(
+            f"Speculative drafting: {len(scored)} of {len(temperatures)} candidate(s) reviewed, "
+            f"selected #{selected + 1} ({'passed' if passed else 'none passed'})"
+        )
+        return {
+            "draft": best["draft"],
+            "qc_feedback": best["qc_feedback"],
+            "report": {
+                "candidates": len(temperatures),
+                "temperatures": temperatures,
+                "scores": [
+                    None if isinstance(result, BaseException)
+                    else result["qc_feedback"].get("overall_score")
+                    for result in candidates
+                ],
+                "failed": [
+                    i for i, result in enumerate(candidates) if isinstance(result, BaseException)
+                ],
+                "selected": selected,
+                "passed": passed,
+            },
+        }
+
+    async def process(
+        self,
+        user_input: UserInput,
+        local_files: Optional[list] = None,
+        run_id: Optional[str] = None,
+    ) -> FinalOutput:
+        """Process user input through all phases.
+
+        With a checkpoint store configured, each phase's output is saved under
+        run_id, and calling process again with the same run_id resumes after the
+        last completed phase.
+
+        Args:
+            user_input: User input with topic and format
+            local_files: Optional list of local file paths to include
+            run_id: Run identifier for checkpointing (a new one is generated if None)
+
+        Returns:
+            FinalOutput with the generated document
+        """
+        final_output = None
+        async for event in self.stream(
+            user_input, local_files, run_id=run_id, stream_chunks=False
+        ):
+            if event.type == "output":
+                final_output = FinalOutput(**event.data["final_output"])
+        return final_output
+
+    async def stream(
+        self,
+        user_input: UserInput,
+        local_files: Optional[list] = None,
+        run_id: Optional[str] = None,
+        stream_chunks: bool = True,
+    ) -> AsyncIterator[PipelineEvent]:
+        """Process user input through all phases, yielding progress as it happens.
+
+        Events, in order of appearance:
+            phase: a phase started (data: message)
+            draft_started: the writer started a draft (data: version)
+            chunk: partial draft text from the writer (data: text, version)
+            draft: a complete draft (data: draft)
+            qc: a QC verdict (data: qc_feedback)
+            output: the final document (data: final_output); always the last event
+
+        Args:
+            user_input: User input with topic and format
+            local_files: Optional list of local file paths to include
+            run_id: Run identifier for checkpointing (a new one is generated if None)
+            stream_chunks: Stream draft text as 'chunk' events; drafts are generated in
+                one fully retryable call when False
+
+        Yields:
+            PipelineEvent instances
+        """
+        run_stats = start_run()
+        run_id = run_id or uuid.uuid4().hex
+        resumed = []
+
+        checkpointed_input = self._load_checkpoint(run_id, "input")
+        if checkpointed_input is not None and checkpointed_input != user_input.dict():
+            raise ValueError(f"Run '{run_id}' was started with different input; cannot resume it")
+        self._save_checkpoint(run_id, "input", user_input.dict())
+
+        completed_output = self._load_checkpoint(run_id, "output")
+        if completed_output is not None:
+            print(f"Run {run_id} already completed. Returning checkpointed output.")
+            yield PipelineEvent(
+                type="output", phase="output", data={"final_output": completed_output}
+            )
+            return
+
+        # Phase 1: Information Gathering
+        print("Phase 1: Information Gathering...")
+        yield PipelineEvent(
+            type="phase", phase="research", data={"message": "Phase 1: Information Gathering"}
+        )
+        raw_data = self._load_checkpoint(run_id, "research")
+        structured_notes = None
+        if raw_data is not None:
+            resumed.append("research")
+        elif self.pipelined_research:
+            # Phase 2 consumes search results while Phase 1 is still running
+            print("Phase 2: Processing (pipelined with research)...")
+            yield PipelineEvent(
+                type="phase", phase="summary", data={"message": "Phase 2: Processing"}
+            )
+            raw_data, structured_notes = await self._research_and_summarize(
+                user_input, local_files
+            )
+            self._save_checkpoint(run_id, "research", raw_data)
+            self._save_checkpoint(run_id, "summary", structured_notes)
+        else:
+            research_message = AgentMessage(
+                from_agent="Orchestrator",
+                to_agent="ResearchAgent",
+                phase="research",
+                data={
+                    "topic": user_input.topic,
+                    "format": user_input.format.value,
+                },
+            )
+            research_result = await self.research_agent.process(research_message)
+            raw_data = research_result["raw_data"]
+            self._save_checkpoint(run_id, "research", raw_data)
+
+        # Phase 2: Processing
+        if structured_notes is None:
+            print("Phase 2: Processing...")
+            yield PipelineEvent(
+                type="phase", phase="summary", data={"message": "Phase 2: Processing"}
+            )
+            structured_notes = self._load_checkpoint(run_id, "summary")
+            if structured_notes is not None:
+                resumed.append("summary")
+            else:
+                summary_message = AgentMessage(
+                    from_agent="ResearchAgent",
+                    to_agent="SummaryAgent",
+                    phase="summary",
+                    data={
+                        "raw_data": raw_data,
+                        "local_files": local_files or [],
+                        "topic": user_input.topic,
+                    },
+                )
+                summary_result = await self.summary_agent.process(summary_message)
+                structured_notes = summary_result["structured_notes"]
+                self._save_checkpoint(run_id, "summary", structured_notes)
 
-            if qc_feedback["approved"]:
-                print(f"Draft approved after {draft_version} iteration(s)")
+        # Phase 3: Creation & Iteration (The Loop)
+        print("Phase 3: Creation & Iteration...")
+        yield PipelineEvent(
+            type="phase", phase="writing", data={"message": "Phase 3: Creation & Iteration"}
+        )
+        draft_version = 1
+        max_iterations = 3
+        qc_feedback_text = ""
+        qc_feedback = None
+        draft = None
+
+        # Optionally replace the first write/review round with concurrent candidates
+        speculation = None
+        if self.speculative_drafts > 1 and self._load_checkpoint(run_id, "draft_1") is None:
+            yield PipelineEvent(
+                type="draft_started",
+                phase="writing",
+                data={"version": 1, "candidates": self.speculative_drafts},
+            )
+            speculation = await self._speculate(user_input, structured_notes)
+            self._save_checkpoint(run_id, "draft_1", speculation["draft"])
+            self._save_checkpoint(run_id, "qc_1", speculation["qc_feedback"])
+
+        while draft_version <= max_iterations:
+            # Writer creates/revises draft (speculation has just written version 1)
+            previous_draft = draft
+            if speculation is not None and draft_version == 1:
+                draft = speculation["draft"]
+            else:
+                draft = self._load_checkpoint(run_id, f"draft_{draft_version}")
+                if draft is not None:
+                    resumed.append(f"draft_{draft_version}")
+            if draft is None:
+                writer_message = AgentMessage(
+                    from_agent="SummaryAgent" if draft_version == 1 else "QCAgent",
+                    to_agent="WriterAgent",
+                    phase="writing",
+                    data={
+                        "structured_notes": structured_notes,
+                        "topic": user_input.topic,
+                        "format": user_input.format.value,
+                        "version": draft_version,
+                        "feedback": qc_feedback_text if draft_version > 1 else "",
+                        # Lets the writer regenerate only the sections QC flagged
+                        "previous_draft": previous_draft,
+                        "section_issues": (
+                            qc_feedback.get("section_issues", []) if draft_version > 1 else []
+                        ),
+                    },
+                )
+                yield PipelineEvent(
+                    type="draft_started", phase="writing", data={"version": draft_version}
+                )
+                async for event in self.writer_agent.stream(
+                    writer_message, stream_chunks=stream_chunks
+                ):
+                    if event.type == "chunk":
+                        yield PipelineEvent(
+                            type="chunk",
+                            phase="writing",
+                            data={"text": event.data["text"], "version": draft_version},
+                        )
+                    elif event.type == "result":
+                        draft = event.data["draft"]
+                self._save_checkpoint(run_id, f"draft_{draft_version}", draft)
+            yield PipelineEvent(type="draft", phase="writing", data={"draft": draft})
+
+            # QC checks the draft
+            if speculation is not None and draft_version == 1:
+                qc_feedback = speculation["qc_feedback"]
+            else:
+                qc_feedback = self._load_checkpoint(run_id, f"qc_{draft_version}")
+                if qc_feedback is not None:
+                    resumed.append(f"qc_{draft_version}")
+            if qc_feedback is None:
+                qc_message = AgentMessage(
+                    from_agent="WriterAgent",
+                    to_agent="QCAgent",
+                    phase="qc",
+                    data={
+                        "draft": draft,
+                        "topic": user_input.topic,
+                        "format": user_input.format.value,
+                        # Only revised sections need a full review
+                        "changed_sections": draft["metadata"].get("revised_sections"),
+                        # Sections a rewrite added are new and need a full review too
+                        "previous_sections": (
+                            [section["anchor"] for section in previous_draft.get("sections", [])]
+                            if previous_draft
+                            else None
+                        ),
+                    },
+                )
+                qc_result = await self.qc_agent.process(qc_message)
+                qc_feedback = qc_result["qc_feedback"]
+                self._save_checkpoint(run_id, f"qc_{draft_version}", qc_feedback)
+            yield PipelineEvent(type="qc", phase="qc", data={"qc_feedback": qc_feedback})
+
+            if self._passes_qc(qc_feedback):
+                if qc_feedback["approved"]:
+                    print(f"Draft approved after {draft_version} iteration(s)")
+                else:
+                    print(
+                        f"Draft accepted after {draft_version} iteration(s) with QC score "
+                        f"{qc_feedback['overall_score']:.1f} "
+                        f"(threshold {self.qc_score_threshold:.1f})"
+                    )
                 break
 
             print(f"Draft version {draft_version} needs improvement. Iterating...")
@@ -168,8 +708,14 @@ class DocumentOrchestrator:
         if draft_version > max_iterations:
             print(f"Maximum iterations ({max_iterations}) reached. Using current draft.")
 
+        if resumed:
+            print(f"Resumed run {run_id} from checkpoints: {', '.join(resumed)}")
+
         # Phase 4: Output
         print("Phase 4: Output...")
+        yield PipelineEvent(
+            type="phase", phase="output", data={"message": "Phase 4: Output"}
+        )
         formatting_message = AgentMessage(
             from_agent="QCAgent",
             to_agent="FormattingAgent",
@@ -182,14 +728,25 @@ class DocumentOrchestrator:
         )
         formatting_result = await self.formatting_agent.process(formatting_message)
         final_output_dict = formatting_result["final_output"]
+        final_output_dict["metadata"].update(run_stats.to_dict())
+        final_output_dict["metadata"]["run_id"] = run_id
+        final_output_dict["metadata"]["resumed_from"] = resumed
+        # Cumulative for the governor, which may be shared by concurrent runs
+        final_output_dict["metadata"]["rate_limits"] = self.governor.metrics()
+        if speculation is not None:
+            final_output_dict["metadata"]["speculative"] = speculation["report"]
+        self._save_checkpoint(run_id, "output", final_output_dict)
 
-        return FinalOutput(**final_output_dict)
+        yield PipelineEvent(
+            type="output", phase="output", data={"final_output": final_output_dict}
+        )
 
     async def run(
         self,
         topic: str,
         output_format: str = "text",
         local_files: Optional[list] = None,
+        run_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Convenience method to run the orchestrator.
 
@@ -197,6 +754,7 @@ class DocumentOrchestrator:
             topic: Topic to research and write about
             output_format: Output format ('text', 'pdf', or 'google_docs')
             local_files: Optional list of local file paths to include
+            run_id: Optional run identifier to checkpoint under or resume
 
         Returns:
             Dictionary with final output information
@@ -207,7 +765,7 @@ class DocumentOrchestrator:
             format_enum = OutputFormat.TEXT
 
         user_input = UserInput(topic=topic, format=format_enum)
-        final_output = await self.process(user_input, local_files)
+        final_output = await self.process(user_input, local_files, run_id=run_id)
 
         return final_output.dict()
 
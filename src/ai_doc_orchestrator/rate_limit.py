@@ -0,0 +1,274 @@
+"""Provider rate limiting and concurrency governance."""
+
+import asyncio
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+# How long waiters sleep before re-checking a full concurrency limit
+_CONCURRENCY_POLL_INTERVAL = 0.05
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the token count of a text (about 4 characters per token).
+
+    Args:
+        text: Input text
+
+    Returns:
+        Estimated token count
+    """
+    return max(1, len(text) // 4)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously up to a per-minute budget."""
+
+    def __init__(self, per_minute: float):
+        """Initialize the bucket (starts full).
+
+        Args:
+            per_minute: Budget replenished every minute
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.available = self.capacity
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float):
+        """Add tokens accrued since the last refill."""
+        self.available = min(self.capacity, self.available + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount tokens are available (0 if available now)."""
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.rate
+
+    def take(self, amount: float):
+        """Remove tokens from the bucket."""
+        self.available -= min(amount, self.capacity)
+
+
+class ProviderLimiter:
+    """Request, token and concurrency limits for one provider.
+
+    Callers wait for capacity instead of failing. Usable from async code via
+    limit() and from worker threads via limit_sync().
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrent: Optional[int] = None,
+    ):
+        """Initialize the limiter. A limit of None means unlimited.
+
+        Args:
+            name: Provider name
+            requests_per_minute: Request budget per minute
+            tokens_per_minute: Token budget per minute
+            max_concurrent: Maximum calls in flight at once
+        """
+        self.name = name
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_concurrent = max_concurrent
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.throttled_calls = 0
+        self.total_wait = 0.0
+        self.total_calls = 0
+        self._lock = threading.Lock()
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Acquire capacity if available.
+
+        Returns:
+            0 if capacity was acquired, otherwise seconds to wait before retrying
+        """
+        with self._lock:
+            if self.max_concurrent and self.in_flight >= self.max_concurrent:
+                return _CONCURRENCY_POLL_INTERVAL
+
+            now = time.monotonic()
+            wait = 0.0
+            if self.requests is not None:
+                self.requests.refill(now)
+                wait = max(wait, self.requests.wait_time(1))
+            if self.tokens is not None and tokens:
+                self.tokens.refill(now)
+                wait = max(wait, self.tokens.wait_time(tokens))
+            if wait > 0:
+                return wait
+
+            if self.requests is not None:
+                self.requests.take(1)
+            if self.tokens is not None and tokens:
+                self.tokens.take(tokens)
+            self.in_flight += 1
+            self.total_calls += 1
+            return 0.0
+
+    def _release(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def _enqueue(self):
+        with self._lock:
+            self.queue_depth += 1
+            self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+            self.throttled_calls += 1
+
+    def _record_wait(self, waited: float, queued: bool):
+        with self._lock:
+            self.total_wait += waited
+            if queued:
+                self.queue_depth -= 1
+
+    async def acquire(self, tokens: int = 0):
+        """Wait for capacity without blocking the event loop.
+
+        Args:
+            tokens: Estimated tokens the call will consume
+        """
+        start = time.monotonic()
+        queued = False
+        try:
+            while True:
+                wait = self._try_acquire(tokens)
+                if wait == 0:
+                    return
+                if not queued:
+                    queued = True
+                    self._enqueue()
+                await asyncio.sleep(wait)
+        finally:
+            self._record_wait(time.monotonic() - start, queued)
+
+    def acquire_sync(self, tokens: int = 0):
+        """Wait for capacity, blocking the calling thread.
+
+        Args:
+            tokens: Estimated tokens the call will consume
+        """
+        start = time.monotonic()
+        queued = False
+        try:
+            while True:
+                wait = self._try_acquire(tokens)
+                if wait == 0:
+                    return
+                if not queued:
+                    queued = True
+                    self._enqueue()
+                time.sleep(wait)
+        finally:
+            self._record_wait(time.monotonic() - start, queued)
+
+    @asynccontextmanager
+    async def limit(self, tokens: int = 0) -> AsyncIterator[None]:
+        """Async context manager holding capacity for the duration of a call."""
+        await self.acquire(tokens)
+        try:
+            yield
+        finally:
+            self._release()
+
+    @contextmanager
+    def limit_sync(self, tokens: int = 0) -> Iterator[None]:
+        """Blocking context manager holding capacity for the duration of a call."""
+        self.acquire_sync(tokens)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get limiter metrics.
+
+        Returns:
+            Dictionary with queue_depth, max_queue_depth, in_flight, total_calls,
+            throttled_calls (calls that had to wait), total_wait and avg_wait (seconds)
+        """
+        with self._lock:
+            return {
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self.max_queue_depth,
+                "in_flight": self.in_flight,
+                "total_calls": self.total_calls,
+                "throttled_calls": self.throttled_calls,
+                "total_wait": round(self.total_wait, 3),
+                "avg_wait": self.total_wait / self.total_calls if self.total_calls else 0.0,
+            }
+
+
+class RateLimitGovernor:
+    """Shared set of per-provider limiters used by all agents and tools."""
+
+    def __init__(self, limiters: Optional[Dict[str, ProviderLimiter]] = None):
+        """Initialize the governor.
+
+        Args:
+            limiters: Limiters keyed by provider name; unknown providers are unlimited
+        """
+        self._limiters: Dict[str, ProviderLimiter] = dict(limiters or {})
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "RateLimitGovernor":
+        """Build a governor from environment variables.
+
+        Reads <PROVIDER>_RPM, <PROVIDER>_TPM and <PROVIDER>_MAX_CONCURRENT for the
+        'gemini' and 'tavily' providers (e.g. GEMINI_RPM=60).
+
+        Returns:
+            RateLimitGovernor instance
+        """
+
+        def read(name: str) -> Optional[float]:
+            value = os.getenv(name)
+            return float(value) if value else None
+
+        limiters = {}
+        for provider in ("gemini", "tavily"):
+            prefix = provider.upper()
+            max_concurrent = read(f"{prefix}_MAX_CONCURRENT")
+            limiters[provider] = ProviderLimiter(
+                provider,
+                requests_per_minute=read(f"{prefix}_RPM"),
+                tokens_per_minute=read(f"{prefix}_TPM"),
+                max_concurrent=int(max_concurrent) if max_concurrent else None,
+            )
+        return cls(limiters)
+
+    def limiter(self, provider: str) -> ProviderLimiter:
+        """Get the limiter for a provider (created unlimited if not configured).
+
+        Args:
+            provider: Provider name
+
+        Returns:
+            ProviderLimiter instance
+        """
+        with self._lock:
+            if provider not in self._limiters:
+                self._limiters[provider] = ProviderLimiter(provider)
+            return self._limiters[provider]
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get metrics for every provider.
+
+        Returns:
+            Dictionary of provider name to limiter metrics
+        """
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.name: limiter.metrics() for limiter in limiters}
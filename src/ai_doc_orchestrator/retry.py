@@ -0,0 +1,202 @@
+"""Retry policies with exponential backoff and jitter for provider calls."""
+
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+from ai_doc_orchestrator.run_context import current_run
+
+try:
+    from google.api_core import exceptions as google_exceptions
+except ImportError:
+    google_exceptions = None
+
+T = TypeVar("T")
+
+# HTTP status codes treated as transient
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+def _default_retryable() -> Tuple[Type[BaseException], ...]:
+    """Build the default tuple of retryable exception classes."""
+    retryable: Tuple[Type[BaseException], ...] = (ConnectionError, TimeoutError)
+    if google_exceptions is not None:
+        retryable += (
+            google_exceptions.TooManyRequests,
+            google_exceptions.ResourceExhausted,
+            google_exceptions.InternalServerError,
+            google_exceptions.BadGateway,
+            google_exceptions.ServiceUnavailable,
+            google_exceptions.GatewayTimeout,
+            google_exceptions.DeadlineExceeded,
+        )
+    try:
+        import requests
+
+        retryable += (requests.ConnectionError, requests.Timeout)
+    except ImportError:
+        pass
+    return retryable
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    """Extract an HTTP status code from a provider exception, if it has one."""
+    for attr in ("status_code", "code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(exc, "resp", None) or getattr(exc, "response", None)
+    for attr in ("status", "status_code"):
+        value = getattr(response, attr, None)
+        if value is not None:
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+class RetryPolicy:
+    """Retry transient failures with capped exponential backoff and jitter."""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+        retryable: Optional[Tuple[Type[BaseException], ...]] = None,
+        deadline: Optional[float] = 120.0,
+    ):
+        """Initialize the policy.
+
+        Args:
+            max_attempts: Maximum number of attempts, including the first (1 disables retries)
+            initial_backoff: Delay before the first retry in seconds
+            max_backoff: Upper bound for a single delay in seconds
+            multiplier: Backoff growth factor per attempt
+            jitter: Fraction of each delay that is randomized (0 to 1)
+            retryable: Exception classes to retry (defaults to transient network/provider errors);
+                exceptions carrying a 408/429/5xx status code are also retried
+            deadline: Overall time budget in seconds across all attempts (None for no limit)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.jitter = min(max(jitter, 0.0), 1.0)
+        self.retryable = retryable if retryable is not None else _default_retryable()
+        self.deadline = deadline
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """Get a policy that never retries."""
+        return cls(max_attempts=1)
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        """Check whether an exception is transient.
+
+        Args:
+            exc: Raised exception
+
+        Returns:
+            True if the call should be retried
+        """
+        if isinstance(exc, self.retryable):
+            return True
+        return _status_code(exc) in RETRYABLE_STATUS_CODES
+
+    def backoff(self, attempt: int) -> float:
+        """Get the delay before the given retry.
+
+        Args:
+            attempt: Number of attempts made so far (1 for the first retry)
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.max_backoff, self.initial_backoff * self.multiplier ** (attempt - 1))
+        return delay * (1 - self.jitter) + random.uniform(0, delay * self.jitter)
+
+    def next_delay(self, exc: BaseException, attempt: int, start: float) -> Optional[float]:
+        """Get the delay before the next attempt.
+
+        Args:
+            exc: Exception raised by the last attempt
+            attempt: Number of attempts made so far
+            start: time.monotonic() value when the first attempt started
+
+        Returns:
+            Delay in seconds, or None if the call should not be retried
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(exc):
+            return None
+        delay = self.backoff(attempt)
+        if self.deadline is not None and time.monotonic() - start + delay > self.deadline:
+            return None
+        return delay
+
+    def call(self, func: Callable[..., T], *args: Any, operation: str = "call", **kwargs: Any) -> T:
+        """Call a blocking function, retrying transient failures.
+
+        Args:
+            func: Function to call
+            *args: Positional arguments for func
+            operation: Name used when reporting retries
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The function's return value
+        """
+        start = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                delay = self.next_delay(e, attempt, start)
+                if delay is None:
+                    raise
+                self.report_retry(operation, e, attempt, delay)
+                time.sleep(delay)
+                attempt += 1
+
+    async def acall(
+        self, func: Callable[..., Awaitable[T]], *args: Any, operation: str = "call", **kwargs: Any
+    ) -> T:
+        """Await a coroutine function, retrying transient failures.
+
+        Args:
+            func: Coroutine function to call
+            *args: Positional arguments for func
+            operation: Name used when reporting retries
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The coroutine's result
+        """
+        start = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                delay = self.next_delay(e, attempt, start)
+                if delay is None:
+                    raise
+                self.report_retry(operation, e, attempt, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    @staticmethod
+    def report_retry(operation: str, exc: BaseException, attempt: int, delay: float):
+        """Log a retry and count it in the current run's statistics."""
+        print(
+            f"Transient error in {operation} (attempt {attempt}): {exc}. "
+            f"Retrying in {delay:.1f}s"
+        )
+        run = current_run()
+        if run is not None:
+            run.record_retry(operation)
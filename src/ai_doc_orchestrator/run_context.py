@@ -0,0 +1,79 @@
+"""Per-run statistics shared by agents and tools during one pipeline run."""
+
+import threading
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+
+class RunStats:
+    """Statistics collected while processing a single document."""
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.retries: Dict[str, int] = {}
+        self.models: Dict[str, str] = {}
+        self.model_fallbacks: List[Dict[str, str]] = []
+        self._lock = threading.Lock()
+
+    def record_retry(self, operation: str):
+        """Count one retry of an operation.
+
+        Args:
+            operation: Operation name (e.g. 'WriterAgent.llm', 'search')
+        """
+        with self._lock:
+            self.retries[operation] = self.retries.get(operation, 0) + 1
+
+    def record_model(self, operation: str, model: str, fallback_from: Optional[str] = None):
+        """Record the model that served an operation.
+
+        Args:
+            operation: Operation name (e.g. 'SummaryAgent.key_points')
+            model: Model that produced the response
+            fallback_from: Model that failed before this one, if any
+        """
+        with self._lock:
+            self.models[operation] = model
+            if fallback_from:
+                self.model_fallbacks.append(
+                    {"operation": operation, "from": fallback_from, "to": model}
+                )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the statistics as output metadata.
+
+        Returns:
+            Dictionary of collected statistics
+        """
+        with self._lock:
+            return {
+                "retries": dict(self.retries),
+                "total_retries": sum(self.retries.values()),
+                "models": dict(self.models),
+                "model_fallbacks": list(self.model_fallbacks),
+            }
+
+
+_current_run: ContextVar[Optional[RunStats]] = ContextVar("current_run", default=None)
+
+
+def current_run() -> Optional[RunStats]:
+    """Get the statistics of the run in progress, if any.
+
+    Returns:
+        RunStats instance or None outside a run
+    """
+    return _current_run.get()
+
+
+def start_run() -> RunStats:
+    """Start collecting statistics for a new run in the current context.
+
+    Tasks and worker threads started from this context share the returned object.
+
+    Returns:
+        RunStats instance
+    """
+    stats = RunStats()
+    _current_run.set(stats)
+    return stats
@@ -0,0 +1,93 @@
+"""Split drafts into anchored sections so revisions can target parts of a document."""
+
+import re
+from typing import List
+
+from ai_doc_orchestrator.models import DraftSection
+
+# Markdown headings that start a new section (# and ## levels)
+_HEADING_PATTERN = re.compile(r"^(#{1,2})\s+(.+?)\s*#*\s*$")
+
+# Anchor used for text before the first heading
+PREAMBLE_ANCHOR = "preamble"
+
+
+def slugify(text: str) -> str:
+    """Turn a heading into a lowercase, hyphenated anchor.
+
+    Args:
+        text: Heading text
+
+    Returns:
+        Anchor string (never empty)
+    """
+    slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    return slug or "section"
+
+
+def split_sections(content: str) -> List[DraftSection]:
+    """Split draft content into sections at top-level markdown headings.
+
+    Each section keeps its heading line, so joining the sections restores the
+    draft. Duplicate headings get numbered anchors (e.g. 'examples-2').
+
+    Args:
+        content: Draft text
+
+    Returns:
+        List of DraftSection in document order
+    """
+    sections: List[DraftSection] = []
+    seen = {}
+    heading = ""
+    anchor = PREAMBLE_ANCHOR
+    lines: List[str] = []
+
+    def flush():
+        text = "\n".join(lines).strip("\n")
+        if text.strip():
+            sections.append(DraftSection(anchor=anchor, heading=heading, content=text))
+
+    in_code_block = False
+    for line in content.splitlines():
+        if line.lstrip().startswith("```"):
+            in_code_block = not in_code_block
+        match = None if in_code_block else _HEADING_PATTERN.match(line)
+        if match:
+            flush()
+            heading = match.group(2)
+            anchor = slugify(heading)
+            seen[anchor] = seen.get(anchor, 0) + 1
+            if seen[anchor] > 1:
+                anchor = f"{anchor}-{seen[anchor]}"
+            lines = [line]
+        else:
+            lines.append(line)
+    flush()
+    return sections
+
+
+def join_sections(sections: List[DraftSection]) -> str:
+    """Join sections back into draft text.
+
+    Args:
+        sections: Sections in document order
+
+    Returns:
+        Draft text
+    """
+    return "\n\n".join(section.content.strip("\n") for section in sections)
+
+
+def format_sections(sections: List[DraftSection]) -> str:
+    """Render sections with their anchors for prompts that reference them.
+
+    Args:
+        sections: Sections to render
+
+    Returns:
+        Text with a '[section: anchor]' marker before each section
+    """
+    return "\n\n".join(
+        f"[section: {section.anchor}]\n{section.content}" for section in sections
+    )
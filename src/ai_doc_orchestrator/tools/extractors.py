@@ -0,0 +1,266 @@
+"""Text extractors for local files that are not plain text (PDF, DOCX, HTML)."""
+
+import codecs
+import re
+import zipfile
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Iterator, List, Optional
+from xml.etree.ElementTree import iterparse
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+# WordprocessingML namespace used in word/document.xml
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Bytes inspected to choose an encoding (and to tell text from binary)
+PREFIX_BYTES = 4096
+
+# Byte order marks, longest first so UTF-32 is not mistaken for UTF-16
+_BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+# Magic numbers of common binary formats whose headers can pass as Latin-1 text
+_BINARY_SIGNATURES = (
+    b"%PDF-",
+    b"PK\x03\x04",
+    b"\x89PNG",
+    b"GIF8",
+    b"\xff\xd8\xff",
+    b"\x1f\x8b",
+    b"\x7fELF",
+)
+
+
+def detect_encoding(prefix: bytes) -> Optional[str]:
+    """Guess a file's text encoding from its first bytes.
+
+    Byte order marks win. A prefix with a binary signature, a NUL byte or many
+    control characters is binary; otherwise it is tried as UTF-8 (allowing a
+    character cut off at the end) and then as Latin-1.
+
+    Args:
+        prefix: First bytes of the file
+
+    Returns:
+        Codec name, or None if the file looks binary
+    """
+    for bom, encoding in _BOMS:
+        if prefix.startswith(bom):
+            return encoding
+    if prefix.startswith(_BINARY_SIGNATURES) or b"\x00" in prefix:
+        return None
+    control = sum(1 for byte in prefix if byte < 32 and byte not in (9, 10, 12, 13))
+    if control > len(prefix) // 10:
+        return None
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(prefix, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        # Mostly printable single-byte text (legacy Windows/ISO encodings)
+        return "latin-1"
+
+
+class TextExtractor:
+    """Base class for extractors that turn a file into text.
+
+    Subclasses set name, extensions and version (bump it when output changes so
+    cached extractions are refreshed) and implement extract().
+    """
+
+    name = "text"
+    extensions: List[str] = []
+    version = 1
+
+    def matches(self, path: Path, prefix: bytes) -> bool:
+        """Check whether this extractor handles a file.
+
+        Args:
+            path: File path
+            prefix: First bytes of the file
+
+        Returns:
+            True if the extractor should be used
+        """
+        return path.suffix.lower() in self.extensions
+
+    def extract(self, path: Path) -> Iterator[str]:
+        """Extract text lazily, one page or block at a time.
+
+        Args:
+            path: File path
+
+        Yields:
+            Text blocks in document order
+        """
+        raise NotImplementedError
+
+
+class PDFExtractor(TextExtractor):
+    """Page-by-page PDF text extraction with pypdf."""
+
+    name = "pdf"
+    extensions = [".pdf"]
+
+    def matches(self, path: Path, prefix: bytes) -> bool:
+        return super().matches(path, prefix) or prefix.startswith(b"%PDF-")
+
+    def extract(self, path: Path) -> Iterator[str]:
+        if PdfReader is None:
+            raise ImportError("pypdf is required for PDF files. Install with: pip install pypdf")
+        # Pages are parsed on access, so stopping early skips the rest of the file
+        reader = PdfReader(str(path))
+        for page in reader.pages:
+            text = (page.extract_text() or "").strip()
+            if text:
+                yield text
+
+
+class DOCXExtractor(TextExtractor):
+    """DOCX paragraph extraction from word/document.xml (no extra dependencies)."""
+
+    name = "docx"
+    extensions = [".docx"]
+
+    def extract(self, path: Path) -> Iterator[str]:
+        with zipfile.ZipFile(path) as archive, archive.open("word/document.xml") as document:
+            parts: List[str] = []
+            for _, element in iterparse(document):
+                if element.tag == f"{_W}t":
+                    parts.append(element.text or "")
+                elif element.tag == f"{_W}tab":
+                    parts.append("\t")
+                elif element.tag in (f"{_W}br", f"{_W}cr"):
+                    parts.append("\n")
+                elif element.tag == f"{_W}p":
+                    text = "".join(parts).strip()
+                    parts = []
+                    element.clear()
+                    if text:
+                        yield text
+
+
+class _HTMLTextParser(HTMLParser):
+    """Collect visible text, breaking blocks at block-level tags."""
+
+    _SKIP = {"script", "style", "noscript", "template", "svg", "head"}
+    _BLOCKS = {
+        "p", "div", "br", "li", "tr", "section", "article", "header", "footer", "blockquote",
+        "pre", "h1", "h2", "h3", "h4", "h5", "h6", "table", "ul", "ol", "hr",
+    }
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.skip_depth = 0
+        self.parts: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP:
+            self.skip_depth += 1
+        elif tag in self._BLOCKS:
+            self.parts.append("\n\n")
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag in self._BLOCKS:
+            self.parts.append("\n\n")
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+
+    def take(self) -> str:
+        """Return the text collected so far and reset the buffer."""
+        text = "".join(self.parts)
+        self.parts = []
+        return text
+
+
+class HTMLExtractor(TextExtractor):
+    """Visible-text extraction from HTML with the standard library parser."""
+
+    name = "html"
+    extensions = [".html", ".htm", ".xhtml"]
+
+    def __init__(self, chunk_size: int = 1 << 16):
+        """Initialize the extractor.
+
+        Args:
+            chunk_size: Bytes decoded and parsed per step
+        """
+        self.chunk_size = chunk_size
+
+    def extract(self, path: Path) -> Iterator[str]:
+        parser = _HTMLTextParser()
+        with open(path, "rb") as f:
+            encoding = detect_encoding(f.read(PREFIX_BYTES)) or "utf-8"
+            f.seek(0)
+            decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            pending = ""
+            while True:
+                data = f.read(self.chunk_size)
+                parser.feed(decoder.decode(data, final=not data))
+                if not data:
+                    parser.close()
+                # Yield complete blocks; keep the last one until its end is seen
+                blocks = re.split(r"\n\s*\n", pending + parser.take())
+                pending = "" if not data else blocks.pop()
+                for block in blocks:
+                    block = " ".join(block.split())
+                    if block:
+                        yield block
+                if not data:
+                    break
+
+
+class ExtractorRegistry:
+    """Ordered set of extractors; the first one that matches a file is used."""
+
+    def __init__(self, extractors: Optional[List[TextExtractor]] = None):
+        """Initialize the registry.
+
+        Args:
+            extractors: Extractors to register (defaults to PDF, DOCX and HTML)
+        """
+        self.extractors: List[TextExtractor] = []
+        for extractor in (
+            extractors if extractors is not None
+            else [PDFExtractor(), DOCXExtractor(), HTMLExtractor()]
+        ):
+            self.register(extractor)
+
+    def register(self, extractor: TextExtractor, first: bool = False):
+        """Add an extractor.
+
+        Args:
+            extractor: Extractor instance
+            first: Try it before the already registered extractors
+        """
+        if first:
+            self.extractors.insert(0, extractor)
+        else:
+            self.extractors.append(extractor)
+
+    def for_file(self, path: Path, prefix: bytes) -> Optional[TextExtractor]:
+        """Find the extractor for a file.
+
+        Args:
+            path: File path
+            prefix: First bytes of the file
+
+        Returns:
+            Matching extractor, or None if the file should be read as text
+        """
+        for extractor in self.extractors:
+            if extractor.matches(path, prefix):
+                return extractor
+        return None
@@ -3,6 +3,8 @@
 import os
 from typing import Any, Dict, Optional
 
+from ai_doc_orchestrator.retry import RetryPolicy
+
 try:
     from google.oauth2.credentials import Credentials
     from google.oauth2.service_account import Credentials as ServiceAccountCredentials
@@ -20,12 +22,14 @@ class GoogleDocsTool:
         self,
         credentials_path: Optional[str] = None,
         credentials: Optional[Any] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ):
         """Initialize the Google Docs tool.
 
         Args:
             credentials_path: Path to service account JSON file
             credentials: Pre-configured credentials object
+            retry_policy: Retry policy for API requests (defaults to RetryPolicy())
         """
         if build is None:
             raise ImportError(
@@ -55,6 +59,25 @@ class GoogleDocsTool:
                 )
 
         self.service = build("docs", "v1", credentials=self.credentials)
+        self.retry_policy = retry_policy or RetryPolicy()
+
+    def _execute(self, request: Any, idempotent: bool = False) -> Dict[str, Any]:
+        """Execute an API request, retrying transient failures of idempotent requests.
+
+        Writes (create, batchUpdate) are sent once: a timeout does not tell
+        whether the server applied them, and re-sending could create a second
+        document or insert the text twice.
+
+        Args:
+            request: Google API request object
+            idempotent: Whether the request can safely be re-sent (reads)
+
+        Returns:
+            API response
+        """
+        if not idempotent:
+            return request.execute()
+        return self.retry_policy.call(request.execute, operation="google_docs")
 
     def create_document(self, title: str, content: str) -> Dict[str, Any]:
         """Create a new Google Doc.
@@ -68,7 +91,7 @@ class GoogleDocsTool:
         """
         try:
             # Create the document
-            doc = self.service.documents().create(body={"title": title}).execute()
+            doc = self._execute(self.service.documents().create(body={"title": title}))
             document_id = doc.get("documentId")
 
             # Insert content
@@ -80,9 +103,11 @@ class GoogleDocsTool:
                     }
                 }
             ]
-            self.service.documents().batchUpdate(
-                documentId=document_id, body={"requests": requests}
-            ).execute()
+            self._execute(
+                self.service.documents().batchUpdate(
+                    documentId=document_id, body={"requests": requests}
+                )
+            )
 
             return {
                 "document_id": document_id,
@@ -104,7 +129,9 @@ class GoogleDocsTool:
         """
         try:
             # Get current document to find end index
-            doc = self.service.documents().get(documentId=document_id).execute()
+            doc = self._execute(
+                self.service.documents().get(documentId=document_id), idempotent=True
+            )
             end_index = doc.get("body", {}).get("content", [{}])[-1].get("endIndex", 1)
 
             # Clear existing content and insert new
@@ -125,9 +152,11 @@ class GoogleDocsTool:
                 },
             ]
 
-            self.service.documents().batchUpdate(
-                documentId=document_id, body={"requests": requests}
-            ).execute()
+            self._execute(
+                self.service.documents().batchUpdate(
+                    documentId=document_id, body={"requests": requests}
+                )
+            )
 
             return {
                 "document_id": document_id,
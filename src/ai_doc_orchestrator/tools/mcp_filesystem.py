@@ -1,24 +1,71 @@
 """MCP File System Read tool."""
 
-import os
+import codecs
+import hashlib
+import mmap
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
+
+from ai_doc_orchestrator.cache import SQLiteCache
+from ai_doc_orchestrator.tools.extractors import (
+    PREFIX_BYTES,
+    ExtractorRegistry,
+    TextExtractor,
+    detect_encoding,
+)
 
 
 class MCPFileSystemTool:
     """Tool for reading files from the local file system (MCP-style)."""
 
-    def __init__(self, base_path: Optional[str] = None):
+    def __init__(
+        self,
+        base_path: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        chunk_size: int = 1 << 16,
+        mmap_threshold: Optional[int] = 1 << 22,
+        extractors: Optional[ExtractorRegistry] = None,
+        extraction_cache: Optional[SQLiteCache] = None,
+    ):
         """Initialize the file system tool.
 
         Args:
             base_path: Base path for file operations (defaults to current directory)
+            max_bytes: Default byte budget for read_text/iter_text (None reads whole files)
+            chunk_size: Bytes decoded per streamed chunk
+            mmap_threshold: Files at least this large are streamed through mmap
+                (None always uses buffered reads)
+            extractors: Extractors for PDF, DOCX, HTML and other non-plain-text files
+                (defaults to ExtractorRegistry())
+            extraction_cache: Cache of extracted text keyed by file content hash
+                (None extracts on every read)
         """
         self.base_path = Path(base_path) if base_path else Path.cwd()
+        self.max_bytes = max_bytes
+        self.chunk_size = max(1, chunk_size)
+        self.mmap_threshold = mmap_threshold
+        self.extractors = extractors if extractors is not None else ExtractorRegistry()
+        self.extraction_cache = extraction_cache
+
+    def resolve_path(self, file_path: str) -> Path:
+        """Resolve a path against base_path and check that it is a file."""
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = self.base_path / path
+
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+
+        if not path.is_file():
+            raise ValueError(f"Path is not a file: {path}")
+        return path
 
     def read_file(self, file_path: str) -> Dict[str, Any]:
         """Read a file from the file system.
 
+        The whole file is loaded; use read_text or iter_text for files of
+        unknown size. Files that are not valid UTF-8 are returned as bytes.
+
         Args:
             file_path: Path to the file (relative to base_path or absolute)
 
@@ -29,29 +76,20 @@ class MCPFileSystemTool:
             FileNotFoundError: If file doesn't exist
             PermissionError: If file cannot be read
         """
-        path = Path(file_path)
-        if not path.is_absolute():
-            path = self.base_path / path
-
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
-
-        if not path.is_file():
-            raise ValueError(f"Path is not a file: {path}")
+        path = self.resolve_path(file_path)
 
+        with open(path, "rb") as f:
+            data = f.read()
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = data.decode("utf-8")
         except UnicodeDecodeError:
-            # Try binary mode for non-text files
-            with open(path, "rb") as f:
-                content = f.read()
-                return {
-                    "path": str(path),
-                    "content": content,
-                    "is_binary": True,
-                    "size": len(content),
-                }
+            # Non-text files are returned as bytes
+            return {
+                "path": str(path),
+                "content": data,
+                "is_binary": True,
+                "size": len(data),
+            }
 
         return {
             "path": str(path),
@@ -61,6 +99,209 @@ class MCPFileSystemTool:
             "encoding": "utf-8",
         }
 
+    def iter_text(
+        self,
+        file_path: str,
+        max_bytes: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Stream a text file as decoded chunks without loading it into memory.
+
+        The encoding is detected from the first PREFIX_BYTES; undecodable bytes
+        later in the file are replaced rather than failing the read. Large files
+        are read through mmap, others with buffered reads. Files handled by an
+        extractor yield their extracted pages or paragraphs instead.
+
+        Args:
+            file_path: Path to the file (relative to base_path or absolute)
+            max_bytes: Stop after this many bytes (defaults to the tool's max_bytes)
+            chunk_size: Bytes per chunk (defaults to the tool's chunk_size)
+
+        Yields:
+            Decoded text chunks (nothing for binary files without an extractor)
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            PermissionError: If file cannot be read
+        """
+        path = self.resolve_path(file_path)
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        chunk_size = chunk_size or self.chunk_size
+
+        with open(path, "rb") as f:
+            size = path.stat().st_size
+            limit = size if max_bytes is None else min(size, max_bytes)
+            prefix = f.read(PREFIX_BYTES)
+            extractor = self.extractors.for_file(path, prefix)
+            if extractor is not None:
+                yield from self._extract_blocks(path, extractor, max_bytes)
+                return
+            encoding = detect_encoding(prefix)
+            if encoding is None or limit == 0:
+                return
+            decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+            if self.mmap_threshold is not None and size >= self.mmap_threshold:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for start in range(0, limit, chunk_size):
+                        text = decoder.decode(mapped[start:min(start + chunk_size, limit)])
+                        if text:
+                            yield text
+            else:
+                f.seek(0)
+                remaining = limit
+                while remaining > 0:
+                    data = f.read(min(chunk_size, remaining))
+                    if not data:
+                        break
+                    remaining -= len(data)
+                    text = decoder.decode(data)
+                    if text:
+                        yield text
+
+            # A character cut off by the byte budget is dropped rather than replaced
+            if limit == size:
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    yield tail
+
+    def read_text(self, file_path: str, max_bytes: Optional[int] = None) -> Dict[str, Any]:
+        """Read at most max_bytes of a text file.
+
+        Memory use is bounded by the byte budget, not the file size. Files handled
+        by an extractor are converted to text (through the extraction cache if set),
+        and max_bytes then applies to the extracted text.
+
+        Args:
+            file_path: Path to the file (relative to base_path or absolute)
+            max_bytes: Byte budget (defaults to the tool's max_bytes)
+
+        Returns:
+            Dictionary with path, content, is_binary, size (bytes on disk),
+            encoding and truncated; extracted files have extractor and cached
+            instead of encoding
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            PermissionError: If file cannot be read
+        """
+        path = self.resolve_path(file_path)
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        size = path.stat().st_size
+
+        with open(path, "rb") as f:
+            prefix = f.read(PREFIX_BYTES)
+        extractor = self.extractors.for_file(path, prefix)
+        if extractor is not None:
+            return self._read_extracted(path, extractor, size, max_bytes)
+
+        encoding = detect_encoding(prefix)
+        if encoding is None:
+            return {"path": str(path), "content": "", "is_binary": True, "size": size}
+
+        content = "".join(self.iter_text(str(path), max_bytes))
+        return {
+            "path": str(path),
+            "content": content,
+            "is_binary": False,
+            "size": size,
+            "encoding": encoding,
+            "truncated": max_bytes is not None and size > max_bytes,
+        }
+
+    @staticmethod
+    def content_hash(path: Path) -> str:
+        """Hash a file's content without loading it into memory.
+
+        Args:
+            path: File path
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def extractor_for(self, path: Path) -> Optional[TextExtractor]:
+        """Find the extractor that read_text would use for a file.
+
+        Args:
+            path: Resolved file path
+
+        Returns:
+            Matching extractor, or None if the file is read as plain text
+        """
+        with open(path, "rb") as f:
+            prefix = f.read(PREFIX_BYTES)
+        return self.extractors.for_file(path, prefix)
+
+    @staticmethod
+    def _extract_blocks(
+        path: Path, extractor: TextExtractor, max_bytes: Optional[int]
+    ) -> Iterator[str]:
+        """Yield extracted blocks, separated by blank lines, up to max_bytes of UTF-8.
+
+        Extraction stops once the budget is used, so later pages are never parsed.
+        """
+        used = 0
+        for index, block in enumerate(extractor.extract(path)):
+            text = f"\n\n{block}" if index else block
+            data = text.encode("utf-8")
+            if max_bytes is not None and used + len(data) > max_bytes:
+                text = data[:max_bytes - used].decode("utf-8", "ignore")
+                if text:
+                    yield text
+                return
+            used += len(data)
+            yield text
+
+    def _read_extracted(
+        self, path: Path, extractor: TextExtractor, size: int, max_bytes: Optional[int]
+    ) -> Dict[str, Any]:
+        """Extract a file's text, reusing a cached extraction of identical content.
+
+        Args:
+            path: File path
+            extractor: Extractor for the file
+            size: File size in bytes
+            max_bytes: Budget for the extracted text
+
+        Returns:
+            Dictionary in the read_text format
+        """
+        key = None
+        cached = None
+        if self.extraction_cache is not None:
+            key = SQLiteCache.make_key(
+                "extract", extractor.name, extractor.version, self.content_hash(path), max_bytes
+            )
+            cached = self.extraction_cache.get(key)
+
+        hit = cached is not None
+        if cached is None:
+            # Extract one byte past the budget to tell a full budget from a cut-off one
+            limit = None if max_bytes is None else max_bytes + 1
+            data = "".join(self._extract_blocks(path, extractor, limit)).encode("utf-8")
+            truncated = max_bytes is not None and len(data) > max_bytes
+            if truncated:
+                data = data[:max_bytes]
+            cached = {"content": data.decode("utf-8", "ignore"), "truncated": truncated}
+            if key is not None:
+                self.extraction_cache.set(key, cached)
+
+        return {
+            "path": str(path),
+            "content": cached["content"],
+            "is_binary": False,
+            "size": size,
+            "extractor": extractor.name,
+            "truncated": cached["truncated"],
+            "cached": hit,
+        }
+
     def list_files(self, directory: str = ".", pattern: Optional[str] = None) -> List[str]:
         """List files in a directory.
 
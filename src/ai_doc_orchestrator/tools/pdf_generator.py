@@ -4,25 +4,60 @@ import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from ai_doc_orchestrator.concurrency import run_blocking, run_in_process
+from ai_doc_orchestrator.tools.pdf_markdown import markdown_to_flowables
+
 try:
     from reportlab.lib.pagesizes import letter
-    from reportlab.lib.styles import getSampleStyleSheet
-    from reportlab.lib.units import inch
-    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+    from reportlab.platypus import SimpleDocTemplate
 except ImportError:
     letter = None
-    getSampleStyleSheet = None
     SimpleDocTemplate = None
 
 
+def render_pdf(content: str, file_path: str, title: Optional[str] = None) -> int:
+    """Lay out content and write it to a PDF file.
+
+    Module-level so it can run in a worker process: only the content, path and
+    title cross the process boundary.
+
+    Args:
+        content: Markdown content to convert to PDF
+        file_path: Path of the PDF file to write
+        title: Optional document title
+
+    Returns:
+        Size of the written file in bytes
+    """
+    doc = SimpleDocTemplate(
+        file_path,
+        pagesize=letter,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=18,
+    )
+
+    # Markdown headings, lists, tables and code become their own flowables
+    story = markdown_to_flowables(content, title)
+
+    # Build PDF
+    doc.build(story)
+    return os.path.getsize(file_path)
+
+
 class PDFGeneratorTool:
     """Tool for generating PDF files."""
 
-    def __init__(self, output_dir: Optional[str] = None):
+    def __init__(self, output_dir: Optional[str] = None, use_processes: bool = False):
         """Initialize the PDF generator.
 
         Args:
             output_dir: Directory to save PDFs (defaults to current directory)
+            use_processes: Render in the shared process pool in agenerate_pdf (the
+                layout is CPU-bound and would otherwise hold the GIL); by default it
+                renders in the thread pool. The caller owns the pool and shuts it down
+                with shutdown_process_executor()
         """
         if SimpleDocTemplate is None:
             raise ImportError(
@@ -31,6 +66,13 @@ class PDFGeneratorTool:
 
         self.output_dir = Path(output_dir) if output_dir else Path.cwd()
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.use_processes = use_processes
+
+    def _file_path(self, filename: str) -> Path:
+        """Resolve the output path for a filename, adding the .pdf extension."""
+        if not filename.endswith(".pdf"):
+            filename += ".pdf"
+        return self.output_dir / filename
 
     def generate_pdf(
         self,
@@ -48,46 +90,37 @@ class PDFGeneratorTool:
         Returns:
             Dictionary with file path and metadata
         """
-        if not filename.endswith(".pdf"):
-            filename += ".pdf"
-
-        file_path = self.output_dir / filename
-
-        # Create PDF
-        doc = SimpleDocTemplate(
-            str(file_path),
-            pagesize=letter,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=18,
-        )
-
-        # Container for the 'Flowable' objects
-        story = []
-        styles = getSampleStyleSheet()
-
-        # Add title if provided
-        if title:
-            title_style = styles["Heading1"]
-            story.append(Paragraph(title, title_style))
-            story.append(Spacer(1, 0.2 * inch))
-
-        # Split content into paragraphs and add to story
-        paragraphs = content.split("\n\n")
-        for para in paragraphs:
-            if para.strip():
-                # Clean up the paragraph text
-                para_text = para.strip().replace("\n", "<br/>")
-                story.append(Paragraph(para_text, styles["Normal"]))
-                story.append(Spacer(1, 0.1 * inch))
-
-        # Build PDF
-        doc.build(story)
+        file_path = self._file_path(filename)
+        size = render_pdf(content, str(file_path), title)
 
         return {
             "file_path": str(file_path),
-            "filename": filename,
-            "size": file_path.stat().st_size,
+            "filename": file_path.name,
+            "size": size,
         }
 
+    async def agenerate_pdf(
+        self,
+        content: str,
+        filename: str,
+        title: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Generate a PDF file without blocking the event loop.
+
+        Args:
+            content: Text content to convert to PDF
+            filename: Output filename (without .pdf extension)
+            title: Optional document title
+
+        Returns:
+            Dictionary with file path and metadata
+        """
+        file_path = self._file_path(filename)
+        runner = run_in_process if self.use_processes else run_blocking
+        size = await runner(render_pdf, content, str(file_path), title)
+
+        return {
+            "file_path": str(file_path),
+            "filename": file_path.name,
+            "size": size,
+        }
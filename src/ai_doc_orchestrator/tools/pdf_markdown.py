@@ -0,0 +1,291 @@
+"""Markdown to ReportLab flowables for PDF output."""
+
+import re
+from typing import List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import (
+        Flowable,
+        HRFlowable,
+        Paragraph,
+        Preformatted,
+        Spacer,
+        Table,
+        TableStyle,
+    )
+except ImportError:
+    getSampleStyleSheet = None
+
+# Block-level patterns, matched once per line
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_LIST_ITEM = re.compile(r"^(\s*)([-*+]|\d+[.)])\s+(.*)$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+_RULE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+_TABLE_SEPARATOR = re.compile(r"^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+_QUOTE = re.compile(r"^\s*>\s?(.*)$")
+
+# Inline patterns, applied to text that has already been escaped
+_INLINE_MARKERS = re.compile(r"[`*_\[]")
+_INLINE_CODE = re.compile(r"`([^`]+)`")
+_LINK = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+_BOLD = re.compile(r"(\*\*|__)(?=\S)(.+?)(?<=\S)\1")
+_ITALIC = re.compile(r"(?<![\w*])([*_])(?=\S)(.+?)(?<=\S)\1(?![\w*])")
+
+# Width of the text frame on a letter page with 1 inch margins
+FRAME_WIDTH = 468
+
+# Styles are built once per process and shared by every document
+if getSampleStyleSheet is not None:
+    _SAMPLE_STYLES = getSampleStyleSheet()
+    STYLES = {
+        "title": _SAMPLE_STYLES["Heading1"],
+        "body": ParagraphStyle("MDBody", parent=_SAMPLE_STYLES["Normal"], spaceAfter=7.2),
+        "quote": ParagraphStyle(
+            "MDQuote", parent=_SAMPLE_STYLES["Italic"], leftIndent=18, spaceAfter=7.2
+        ),
+        "code": ParagraphStyle(
+            "MDCode",
+            parent=_SAMPLE_STYLES["Code"],
+            backColor=colors.whitesmoke,
+            borderPadding=4,
+            spaceBefore=4,
+            spaceAfter=10,
+        ),
+        "cell": ParagraphStyle("MDCell", parent=_SAMPLE_STYLES["Normal"], fontSize=9, leading=11),
+        "header_cell": ParagraphStyle(
+            "MDHeaderCell",
+            parent=_SAMPLE_STYLES["Normal"],
+            fontName="Helvetica-Bold",
+            fontSize=9,
+            leading=11,
+        ),
+    }
+    # Markdown heading level -> style ('#' is below the document title)
+    HEADING_STYLES = {
+        1: _SAMPLE_STYLES["Heading1"],
+        2: _SAMPLE_STYLES["Heading2"],
+        3: _SAMPLE_STYLES["Heading3"],
+        4: _SAMPLE_STYLES["Heading4"],
+        5: _SAMPLE_STYLES["Heading5"],
+        6: _SAMPLE_STYLES["Heading6"],
+    }
+    # List nesting level -> style
+    LIST_STYLES = [
+        ParagraphStyle(
+            f"MDList{level}",
+            parent=_SAMPLE_STYLES["Normal"],
+            leftIndent=18 * (level + 1),
+            bulletIndent=18 * level + 6,
+            spaceAfter=2,
+        )
+        for level in range(4)
+    ]
+    TABLE_STYLE = TableStyle([
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ])
+
+
+def inline_markup(text: str) -> str:
+    """Convert inline markdown to ReportLab paragraph markup.
+
+    The text is escaped first, so stray '<' or '&' cannot break the paragraph
+    parser; code spans are left unformatted.
+
+    Args:
+        text: Markdown text of a single block
+
+    Returns:
+        Paragraph markup
+    """
+    if not _INLINE_MARKERS.search(text):
+        return escape(text)
+    parts = _INLINE_CODE.split(text)
+    markup = []
+    for i, part in enumerate(parts):
+        if i % 2:
+            markup.append(f'<font face="Courier">{escape(part)}</font>')
+            continue
+        part = escape(part)
+        part = _LINK.sub(
+            lambda m: (
+                f'<link href="{m.group(2).replace(chr(34), "%22")}" color="blue">'
+                f"{m.group(1)}</link>"
+            ),
+            part,
+        )
+        part = _BOLD.sub(r"<b>\2</b>", part)
+        part = _ITALIC.sub(r"<i>\2</i>", part)
+        markup.append(part)
+    return "".join(markup)
+
+
+def _paragraph(text: str, style, bullet: Optional[str] = None) -> "Flowable":
+    """Build a paragraph from markdown text, falling back to plain text on markup errors."""
+    try:
+        return Paragraph(inline_markup(text), style, bulletText=bullet)
+    except ValueError:
+        return Paragraph(escape(text), style, bulletText=bullet)
+
+
+def _table_row(line: str) -> List[str]:
+    """Split a markdown table row into cell texts."""
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|"):
+        line = line[:-1]
+    return [cell.strip() for cell in line.split("|")]
+
+
+def _table(rows: List[List[str]], width: float) -> "Flowable":
+    """Build a table flowable with a bold header row and equal column widths."""
+    columns = max(len(row) for row in rows)
+    data = []
+    for index, row in enumerate(rows):
+        style = STYLES["header_cell"] if index == 0 else STYLES["cell"]
+        cells = row + [""] * (columns - len(row))
+        data.append([_paragraph(cell, style) for cell in cells])
+    table = Table(data, colWidths=[width / columns] * columns, repeatRows=1, hAlign="LEFT")
+    table.setStyle(TABLE_STYLE)
+    return table
+
+
+def markdown_to_flowables(
+    content: str, title: Optional[str] = None, width: float = FRAME_WIDTH
+) -> List["Flowable"]:
+    """Convert a markdown document to flowables in a single pass over its lines.
+
+    Headings, bullet and numbered lists, fenced code, tables, block quotes and
+    horizontal rules become their own flowables; other lines are joined into
+    paragraphs. A leading heading that repeats the title is dropped.
+
+    Args:
+        content: Markdown text
+        title: Optional document title placed above the content
+        width: Width of the text frame in points (used for tables and rules)
+
+    Returns:
+        List of flowables
+    """
+    if getSampleStyleSheet is None:
+        raise ImportError("reportlab is required. Install with: pip install reportlab")
+
+    story: List[Flowable] = []
+    if title:
+        story.append(_paragraph(title, STYLES["title"]))
+        story.append(Spacer(1, 14.4))
+
+    lines = content.splitlines()
+    paragraph: List[str] = []
+    quote: List[str] = []
+    table: List[List[str]] = []
+    code: Optional[List[str]] = None
+    # Current list item as (level, bullet, text lines)
+    item: Optional[Tuple[int, str, List[str]]] = None
+    list_indents: List[int] = []
+    first_block = True
+
+    def flush():
+        nonlocal item
+        if paragraph:
+            story.append(_paragraph(" ".join(paragraph), STYLES["body"]))
+            paragraph.clear()
+        if quote:
+            story.append(_paragraph(" ".join(quote), STYLES["quote"]))
+            quote.clear()
+        if table:
+            story.append(_table(table, width))
+            story.append(Spacer(1, 7.2))
+            table.clear()
+        if item is not None:
+            level, bullet, text = item
+            story.append(_paragraph(" ".join(text), LIST_STYLES[level], bullet=bullet))
+            item = None
+
+    for line in lines:
+        if code is not None:
+            if _FENCE.match(line):
+                story.append(Preformatted("\n".join(code), STYLES["code"]))
+                code = None
+            else:
+                code.append(line)
+            continue
+
+        stripped = line.strip()
+        if not stripped:
+            flush()
+            continue
+
+        if _FENCE.match(line):
+            flush()
+            list_indents.clear()
+            code = []
+            continue
+
+        heading = _HEADING.match(stripped)
+        if heading:
+            flush()
+            list_indents.clear()
+            text = heading.group(2)
+            if not (first_block and title and text.strip().lower() == title.strip().lower()):
+                story.append(_paragraph(text, HEADING_STYLES[len(heading.group(1))]))
+            first_block = False
+            continue
+        first_block = False
+
+        if stripped.startswith("|"):
+            if _TABLE_SEPARATOR.match(stripped):
+                continue
+            if not table:
+                flush()
+            table.append(_table_row(stripped))
+            continue
+
+        if _RULE.match(line):
+            flush()
+            list_indents.clear()
+            story.append(HRFlowable(
+                width="100%", thickness=0.5, color=colors.grey, spaceBefore=4, spaceAfter=8
+            ))
+            continue
+
+        list_item = _LIST_ITEM.match(line)
+        if list_item:
+            flush()
+            indent = len(list_item.group(1).expandtabs(4))
+            while list_indents and indent < list_indents[-1]:
+                list_indents.pop()
+            if not list_indents or indent > list_indents[-1]:
+                list_indents.append(indent)
+            level = min(len(list_indents), len(LIST_STYLES)) - 1
+            marker = list_item.group(2)
+            bullet = marker if marker[0].isdigit() else "•"
+            item = (level, bullet, [list_item.group(3)])
+            continue
+
+        quoted = _QUOTE.match(line)
+        if quoted:
+            if not quote:
+                flush()
+            quote.append(quoted.group(1))
+            continue
+
+        if item is not None and line[:1].isspace():
+            # Indented continuation of the current list item
+            item[2].append(stripped)
+            continue
+
+        if item is not None or quote or table:
+            flush()
+        list_indents.clear()
+        paragraph.append(stripped)
+
+    if code is not None:
+        story.append(Preformatted("\n".join(code), STYLES["code"]))
+    flush()
+    return story
@@ -1,8 +1,14 @@
 """Search tool using Tavily or Google Search."""
 
 import os
+import re
+from contextlib import nullcontext
 from typing import Any, Dict, List, Optional
 
+from ai_doc_orchestrator.cache import SQLiteCache
+from ai_doc_orchestrator.rate_limit import RateLimitGovernor
+from ai_doc_orchestrator.retry import RetryPolicy
+
 try:
     from tavily import TavilyClient
 except ImportError:
@@ -12,14 +18,30 @@ except ImportError:
 class SearchTool:
     """Tool for searching the web using Tavily or Google Search."""
 
-    def __init__(self, api_key: Optional[str] = None, provider: str = "tavily"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        provider: str = "tavily",
+        cache: Optional[SQLiteCache] = None,
+        cache_bypass: bool = False,
+        governor: Optional[RateLimitGovernor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
         """Initialize the search tool.
 
         Args:
             api_key: API key for the search provider
             provider: Either 'tavily' or 'google'
+            cache: Optional persistent cache for search results
+            cache_bypass: Skip cache reads (fresh results are still written to the cache)
+            governor: Optional rate limit governor that provider calls wait on
+            retry_policy: Retry policy for provider calls (defaults to RetryPolicy())
         """
         self.provider = provider
+        self.cache = cache
+        self.cache_bypass = cache_bypass
+        self.governor = governor
+        self.retry_policy = retry_policy or RetryPolicy()
         self.api_key = api_key or os.getenv("TAVILY_API_KEY") or os.getenv("GOOGLE_API_KEY")
 
         if provider == "tavily":
@@ -39,29 +61,89 @@ class SearchTool:
         else:
             raise ValueError(f"Unknown provider: {provider}")
 
-    def search(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+    def search(
+        self,
+        query: str,
+        max_results: int = 5,
+        search_depth: str = "advanced",
+        use_cache: bool = True,
+    ) -> List[Dict[str, Any]]:
         """Search for information.
 
         Args:
             query: Search query
             max_results: Maximum number of results to return
+            search_depth: Provider search depth ('basic' or 'advanced')
+            use_cache: Whether to read from the result cache (if one is configured)
 
         Returns:
             List of search results with content and metadata
         """
-        if self.provider == "tavily":
-            return self._search_tavily(query, max_results)
-        elif self.provider == "google":
-            return self._search_google(query, max_results)
-        else:
-            raise ValueError(f"Unknown provider: {self.provider}")
+        cache_key = None
+        if self.cache is not None:
+            cache_key = SQLiteCache.make_key(
+                self.provider, self._normalize_query(query), max_results, search_depth
+            )
+            if use_cache and not self.cache_bypass:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+        results = self.retry_policy.call(
+            self._search_provider, query, max_results, search_depth, operation="search"
+        )
+
+        if cache_key is not None:
+            self.cache.set(cache_key, results)
+        return results
+
+    def _search_provider(
+        self, query: str, max_results: int, search_depth: str
+    ) -> List[Dict[str, Any]]:
+        """Run one provider search under the rate limit governor.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results
+            search_depth: Provider search depth
+
+        Returns:
+            List of search results
+        """
+        limit = (
+            self.governor.limiter(self.provider).limit_sync()
+            if self.governor is not None
+            else nullcontext()
+        )
+        with limit:
+            if self.provider == "tavily":
+                return self._search_tavily(query, max_results, search_depth)
+            elif self.provider == "google":
+                return self._search_google(query, max_results)
+            else:
+                raise ValueError(f"Unknown provider: {self.provider}")
+
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Normalize a query for cache keying (case and whitespace insensitive).
+
+        Args:
+            query: Search query
+
+        Returns:
+            Normalized query
+        """
+        return re.sub(r"\s+", " ", query).strip().lower()
 
-    def _search_tavily(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+    def _search_tavily(
+        self, query: str, max_results: int, search_depth: str = "advanced"
+    ) -> List[Dict[str, Any]]:
         """Search using Tavily.
 
         Args:
             query: Search query
             max_results: Maximum number of results
+            search_depth: Tavily search depth
 
         Returns:
             List of search results
@@ -69,7 +151,7 @@ class SearchTool:
         response = self.client.search(
             query=query,
             max_results=max_results,
-            search_depth="advanced",
+            search_depth=search_depth,
         )
 
         results = []
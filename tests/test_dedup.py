@@ -0,0 +1,116 @@
+"""Tests for URL canonicalization and near-duplicate source detection."""
+
+import random
+
+import pytest
+
+from ai_doc_orchestrator.dedup import (
+    SourceDeduplicator,
+    canonicalize_url,
+    hamming_distance,
+    simhash,
+)
+
+VOCABULARY = (
+    "knapsack items weight value capacity greedy dynamic programming table optimal "
+    "bound subset choose fit bag total maximize"
+).split()
+_rng = random.Random(1)
+ARTICLE_WORDS = [_rng.choice(VOCABULARY) for _ in range(120)]
+ARTICLE = " ".join(ARTICLE_WORDS)
+
+
+def source(url, content=ARTICLE):
+    return {"url": url, "content": content}
+
+
+@pytest.mark.parametrize("variant", [
+    "https://example.com/guide?utm_source=news&utm_medium=email",
+    "https://example.com/guide?fbclid=abc123",
+    "https://example.com/guide/",
+    "HTTPS://EXAMPLE.COM/guide",
+    "http://www.example.com/guide",
+    "https://example.com:443/guide#section-2",
+    "https://example.com//guide",
+])
+def test_url_variants_share_a_canonical_form(variant):
+    assert canonicalize_url(variant) == canonicalize_url("https://example.com/guide")
+
+
+def test_query_parameters_are_sorted_and_kept():
+    assert canonicalize_url("https://example.com/search?b=2&a=1&gclid=x") == (
+        "https://example.com/search?a=1&b=2"
+    )
+
+
+def test_path_case_and_non_default_ports_are_significant():
+    assert canonicalize_url("https://example.com/Guide") != canonicalize_url(
+        "https://example.com/guide"
+    )
+    assert canonicalize_url("https://example.com:8443/guide") == "https://example.com:8443/guide"
+
+
+def test_unparseable_url_is_returned_stripped():
+    assert canonicalize_url("  not a url  ") == "not a url"
+
+
+def test_repeated_url_is_dropped():
+    deduplicator = SourceDeduplicator()
+
+    kept = deduplicator.dedupe([
+        source("https://example.com/guide", "first copy"),
+        source("http://www.example.com/guide/?utm_campaign=x", "second copy"),
+    ])
+
+    assert [item["content"] for item in kept] == ["first copy"]
+    assert deduplicator.report() == {
+        "kept": 1, "duplicate_urls": 1, "near_duplicates": 0, "removed": 1
+    }
+
+
+def test_near_duplicate_within_the_configured_distance_is_dropped():
+    edited = " ".join(["edited"] + ARTICLE_WORDS[1:])
+    distance = hamming_distance(simhash(ARTICLE), simhash(edited))
+    assert 0 < distance <= 10
+
+    at_limit = SourceDeduplicator(max_distance=distance).dedupe(
+        [source("https://a.example/1"), source("https://b.example/2", edited)]
+    )
+    below_limit = SourceDeduplicator(max_distance=distance - 1).dedupe(
+        [source("https://a.example/1"), source("https://b.example/2", edited)]
+    )
+
+    assert len(at_limit) == 1
+    assert len(below_limit) == 2
+
+
+def test_unrelated_content_is_kept():
+    other = " ".join(
+        f"Gradient descent step {i} moves the weights against the loss gradient "
+        f"until the training error stops improving."
+        for i in range(8)
+    )
+
+    kept = SourceDeduplicator().dedupe(
+        [source("https://a.example/1"), source("https://b.example/2", other)]
+    )
+
+    assert len(kept) == 2
+
+
+def test_content_comparison_can_be_disabled():
+    kept = SourceDeduplicator(max_distance=None).dedupe(
+        [source("https://a.example/1"), source("https://b.example/2")]
+    )
+
+    assert len(kept) == 2
+
+
+def test_short_sources_are_only_compared_by_url():
+    short = "Knapsack problems in brief."
+
+    kept = SourceDeduplicator(min_words=30).dedupe(
+        [source("https://a.example/1", short), source("https://b.example/2", short)]
+    )
+
+    assert len(kept) == 2
@@ -0,0 +1,82 @@
+"""Tests for the rule-based draft linter."""
+
+from ai_doc_orchestrator.draft_linter import DraftLinter
+
+BODY = " ".join(["Knapsack problems trade item weight against item value."] * 5)
+
+
+def make_draft(*headings: str) -> str:
+    return "\n\n".join(f"{heading}\n\n{BODY} Section {i}." for i, heading in enumerate(headings))
+
+
+def descriptions(issues):
+    return [issue.description for issue in issues]
+
+
+def test_well_formed_draft_passes():
+    linter = DraftLinter(min_words=20)
+    draft = make_draft("# Knapsack Problems", "## Dynamic Programming", "## Greedy Methods")
+
+    assert linter.lint(draft, topic="knapsack problems") == []
+
+
+def test_headings_of_every_level_count():
+    linter = DraftLinter(min_words=0, min_headings=3)
+    draft = make_draft("# Knapsack", "### Dynamic Programming", "#### Greedy Methods")
+
+    assert linter.lint(draft) == []
+
+
+def test_too_few_headings_is_reported():
+    issues = DraftLinter(min_words=0, min_headings=2).lint(make_draft("# Knapsack"))
+
+    assert len(issues) == 1
+    assert "1 markdown heading(s)" in issues[0].description
+
+
+def test_headings_inside_code_blocks_do_not_count():
+    draft = make_draft("# Knapsack") + "\n\n```\n# not a heading\n```"
+
+    issues = DraftLinter(min_words=0, min_headings=2).lint(draft)
+
+    assert "1 markdown heading(s)" in descriptions(issues)[0]
+
+
+def test_conclusion_rule_is_opt_in():
+    draft = make_draft("# Knapsack", "## Dynamic Programming")
+
+    assert DraftLinter(min_words=0).lint(draft) == []
+    issues = DraftLinter(min_words=0, require_conclusion=True).lint(draft)
+    assert any("no conclusion" in description for description in descriptions(issues))
+
+
+def test_conclusion_heading_at_any_level_satisfies_the_rule():
+    draft = make_draft("# Knapsack", "## Methods", "### Conclusion")
+
+    assert DraftLinter(min_words=0, require_conclusion=True).lint(draft) == []
+
+
+def test_short_draft_is_reported():
+    issues = DraftLinter(min_words=500, min_headings=0).lint(make_draft("# Knapsack"))
+
+    assert len(issues) == 1
+    assert "too short" in issues[0].description
+
+
+def test_missing_topic_is_reported():
+    issues = DraftLinter(min_words=0, min_headings=0).lint(
+        make_draft("# Knapsack"), topic="quantum cryptography"
+    )
+
+    assert descriptions(issues) == ["The draft never mentions the topic 'quantum cryptography'."]
+
+
+def test_duplicate_paragraph_is_tied_to_its_section():
+    paragraph = "Dynamic programming fills a table of subproblem values row by row."
+    draft = f"# Intro\n\n{paragraph}\n\n# Methods\n\n{paragraph.upper()}"
+
+    issues = DraftLinter(min_words=0, min_headings=0).lint(draft)
+
+    assert len(issues) == 1
+    assert issues[0].section == "methods"
+    assert "'intro'" in issues[0].description
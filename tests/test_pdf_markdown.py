@@ -0,0 +1,93 @@
+"""Tests for markdown to PDF flowable conversion."""
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from reportlab.platypus import HRFlowable, Paragraph, Preformatted, Spacer, Table  # noqa: E402
+
+from ai_doc_orchestrator.tools.pdf_markdown import (  # noqa: E402
+    HEADING_STYLES,
+    LIST_STYLES,
+    STYLES,
+    inline_markup,
+    markdown_to_flowables,
+)
+
+
+def test_inline_markup_bold_and_italic():
+    assert inline_markup("a **bold** and *italic* word") == "a <b>bold</b> and <i>italic</i> word"
+    assert inline_markup("__bold__ and _italic_") == "<b>bold</b> and <i>italic</i>"
+
+
+def test_inline_markup_escapes_before_formatting():
+    assert inline_markup("x < y & z") == "x &lt; y &amp; z"
+    assert inline_markup("**a < b**") == "<b>a &lt; b</b>"
+
+
+def test_inline_markup_leaves_code_spans_unformatted():
+    markup = inline_markup("run `a **b** <c>` now")
+    assert markup == 'run <font face="Courier">a **b** &lt;c&gt;</font> now'
+
+
+def test_inline_markup_ignores_underscores_inside_words():
+    assert inline_markup("snake_case_name") == "snake_case_name"
+
+
+def test_headings_use_level_styles():
+    story = markdown_to_flowables("# One\n## Two\n### Three")
+    assert [type(flowable) for flowable in story] == [Paragraph] * 3
+    assert [flowable.style for flowable in story] == [HEADING_STYLES[level] for level in (1, 2, 3)]
+    assert story[1].text == "Two"
+
+
+def test_heading_repeating_title_is_dropped():
+    story = markdown_to_flowables("# Report\n\nBody text.", title="Report")
+    assert isinstance(story[0], Paragraph) and story[0].style is STYLES["title"]
+    assert isinstance(story[1], Spacer)
+    assert [flowable.text for flowable in story[2:]] == ["Body text."]
+
+
+def test_nested_lists_use_indent_levels():
+    content = "- first\n  - nested\n    - deeper\n- second\n1. numbered"
+    story = markdown_to_flowables(content)
+    assert all(isinstance(flowable, Paragraph) for flowable in story)
+    assert [flowable.style for flowable in story] == [
+        LIST_STYLES[0], LIST_STYLES[1], LIST_STYLES[2], LIST_STYLES[0], LIST_STYLES[0]
+    ]
+    assert [flowable.bulletText for flowable in story] == ["•", "•", "•", "•", "1."]
+    assert story[1].text == "nested"
+
+
+def test_list_item_continuation_lines_are_joined():
+    story = markdown_to_flowables("- item starts\n  and continues\n\nAfter.")
+    assert [flowable.text for flowable in story] == ["item starts and continues", "After."]
+    assert story[1].style is STYLES["body"]
+
+
+def test_fenced_code_is_preformatted_without_markup():
+    content = "Before.\n\n```python\nif a < b and **c**:\n    pass\n```\nAfter."
+    story = markdown_to_flowables(content)
+    assert [type(flowable) for flowable in story] == [Paragraph, Preformatted, Paragraph]
+    code = story[1]
+    assert code.style is STYLES["code"]
+    assert [line.strip() for line in code.lines] == ["if a < b and **c**:", "pass"]
+
+
+def test_unclosed_fence_keeps_code():
+    story = markdown_to_flowables("```\nx = 1")
+    assert len(story) == 1 and isinstance(story[0], Preformatted)
+
+
+def test_paragraph_lines_are_joined_and_escaped():
+    story = markdown_to_flowables("Fish & chips\ncost < 5 **pounds**.")
+    assert len(story) == 1
+    assert story[0].text == "Fish &amp; chips cost &lt; 5 <b>pounds</b>."
+
+
+def test_table_rule_and_quote():
+    content = "| A | B |\n|---|---|\n| 1 | 2 |\n\n---\n\n> quoted *text*"
+    story = markdown_to_flowables(content)
+    assert [type(flowable) for flowable in story] == [Table, Spacer, HRFlowable, Paragraph]
+    assert story[3].style is STYLES["quote"]
+    assert story[3].text == "quoted <i>text</i>"
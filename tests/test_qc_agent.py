@@ -0,0 +1,109 @@
+"""Tests for the QC agent's review prompts and verdict parsing."""
+
+import asyncio
+
+from ai_doc_orchestrator.agents.qc import QCAgent
+from ai_doc_orchestrator.draft_linter import DraftLinter
+from ai_doc_orchestrator.models import AgentMessage
+
+APPROVED_VERDICT = (
+    '{"approved": true, "scores": {"clarity": 9, "completeness": 8, "accuracy": 9, '
+    '"structure": 8, "relevance": 9}, "overall_score": 8.6, "issues": [], "feedback": ""}'
+)
+
+
+def make_agent(responses):
+    """QC agent whose LLM returns the given responses in turn and records prompts."""
+    agent = QCAgent(gemini_api_key="test-key", linter=DraftLinter(min_words=0, min_headings=0))
+    agent.prompts = []
+    replies = iter(responses)
+
+    async def call(system_prompt, user_prompt, temperature=0.7, extra_config=None, step=None):
+        agent.prompts.append(user_prompt)
+        return next(replies)
+
+    agent._acall_llm = call
+    return agent
+
+
+def review(agent, content, version=1, **data):
+    message = AgentMessage(
+        from_agent="test",
+        to_agent="QCAgent",
+        phase="qc",
+        data={"draft": {"content": content, "version": version}, "topic": "knapsack", **data},
+    )
+    return asyncio.run(agent.process(message))["qc_feedback"]
+
+
+def test_sections_added_by_a_rewrite_are_reviewed_in_full():
+    agent = make_agent([APPROVED_VERDICT])
+    draft = "# Intro\n\nKnapsack intro.\n\n# Methods\n\nRevised methods.\n\n# Pitfalls\n\nNew text."
+
+    review(
+        agent,
+        draft,
+        version=2,
+        changed_sections=["methods"],
+        previous_sections=["intro", "methods"],
+    )
+
+    revised, unchanged = agent.prompts[0].split("Unchanged Sections (already reviewed):")
+    assert "[section: methods]" in revised
+    assert "[section: pitfalls]" in revised
+    assert "New text." in revised
+    assert "[intro]" in unchanged
+    assert "pitfalls" not in unchanged
+
+
+def test_structured_verdict_is_parsed_with_scores_and_section_issues():
+    verdict = (
+        '{"approved": false, "scores": {"clarity": 6, "completeness": 5, "accuracy": 7, '
+        '"structure": "6", "relevance": 8}, "overall_score": 6.4, '
+        '"issues": [{"section": "methods", "description": "Explain the DP table."}, '
+        '{"section": "", "description": "Tone is uneven."}], "feedback": "Needs work."}'
+    )
+    agent = make_agent([verdict])
+
+    feedback = review(agent, "# Intro\n\nKnapsack intro.\n\n# Methods\n\nSome methods.")
+
+    assert feedback["approved"] is False
+    assert feedback["reviewer"] == "llm"
+    assert feedback["overall_score"] == 6.4
+    assert feedback["scores"]["structure"] == 6.0
+    assert feedback["issues"] == ["[methods] Explain the DP table.", "Tone is uneven."]
+    assert [issue["section"] for issue in feedback["section_issues"]] == ["methods", None]
+    assert feedback["feedback"] == "Needs work."
+
+
+def test_malformed_json_falls_back_to_the_text_verdict():
+    text_verdict = (
+        "APPROVED: no\nISSUES:\n- [methods] Explain the DP table.\n- Add examples.\n"
+        "FEEDBACK:\nExpand the methods section."
+    )
+    agent = make_agent(['{"approved": tru', text_verdict])
+
+    feedback = review(agent, "# Intro\n\nKnapsack intro.\n\n# Methods\n\nSome methods.")
+
+    assert len(agent.prompts) == 2
+    assert "APPROVED: yes/no" in agent.prompts[1]
+    assert feedback["approved"] is False
+    assert feedback["overall_score"] is None
+    assert feedback["scores"] == {}
+    assert [issue["section"] for issue in feedback["section_issues"]] == ["methods", None]
+    assert feedback["feedback"] == "Expand the methods section."
+
+
+def test_text_verdict_approval():
+    agent = QCAgent(
+        gemini_api_key="test-key",
+        structured_output=False,
+        linter=DraftLinter(min_words=0, min_headings=0),
+    )
+
+    async def call(system_prompt, user_prompt, temperature=0.7, extra_config=None, step=None):
+        return "APPROVED: yes\nISSUES:\nFEEDBACK:\nLooks good."
+
+    agent._acall_llm = call
+
+    assert review(agent, "# Intro\n\nKnapsack intro.")["approved"] is True
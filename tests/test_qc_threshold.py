@@ -0,0 +1,38 @@
+"""Tests for accepting drafts by QC score."""
+
+import pytest
+
+from ai_doc_orchestrator.orchestrator import DocumentOrchestrator
+
+
+def make_orchestrator(monkeypatch, **kwargs):
+    monkeypatch.delenv("QC_SCORE_THRESHOLD", raising=False)
+    return DocumentOrchestrator(gemini_api_key="test-key", tavily_api_key="test-key", **kwargs)
+
+
+def verdict(approved, score):
+    return {"approved": approved, "overall_score": score}
+
+
+def test_threshold_is_off_by_default(monkeypatch):
+    orchestrator = make_orchestrator(monkeypatch)
+
+    assert orchestrator.qc_score_threshold is None
+    assert orchestrator._passes_qc(verdict(True, None))
+    assert not orchestrator._passes_qc(verdict(False, 9.5))
+
+
+@pytest.mark.parametrize("score, passes", [(8.0, True), (9.1, True), (7.9, False), (None, False)])
+def test_score_at_or_above_the_threshold_passes(monkeypatch, score, passes):
+    orchestrator = make_orchestrator(monkeypatch, qc_score_threshold=8.0)
+
+    assert orchestrator._passes_qc(verdict(False, score)) is passes
+    assert orchestrator._passes_qc(verdict(True, score))
+
+
+def test_threshold_can_be_set_from_the_environment(monkeypatch):
+    monkeypatch.setenv("QC_SCORE_THRESHOLD", "7.5")
+    orchestrator = DocumentOrchestrator(gemini_api_key="test-key", tavily_api_key="test-key")
+
+    assert orchestrator.qc_score_threshold == 7.5
+    assert orchestrator._passes_qc(verdict(False, 7.5))
@@ -0,0 +1,63 @@
+"""Tests for rate limiter metrics and their use in batch manifests."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from ai_doc_orchestrator.batch import run_batch
+from ai_doc_orchestrator.models import BatchJob
+from ai_doc_orchestrator.rate_limit import ProviderLimiter, RateLimitGovernor
+
+
+def test_metrics_count_throttled_calls():
+    limiter = ProviderLimiter("gemini", max_concurrent=1)
+
+    async def call():
+        async with limiter.limit():
+            await asyncio.sleep(0.02)
+
+    async def run():
+        await asyncio.gather(*[call() for _ in range(3)])
+
+    asyncio.run(run())
+    metrics = limiter.metrics()
+    assert metrics["total_calls"] == 3
+    assert metrics["throttled_calls"] == 2
+    assert metrics["max_queue_depth"] == 2
+    assert metrics["queue_depth"] == 0
+    assert metrics["in_flight"] == 0
+    assert metrics["total_wait"] > 0
+
+
+def test_unthrottled_calls_report_no_wait():
+    limiter = ProviderLimiter("tavily")
+    with limiter.limit_sync():
+        pass
+    metrics = limiter.metrics()
+    assert metrics["total_calls"] == 1
+    assert metrics["throttled_calls"] == 0
+    assert metrics["max_queue_depth"] == 0
+
+
+def test_batch_manifest_includes_rate_limits(tmp_path):
+    governor = RateLimitGovernor({"gemini": ProviderLimiter("gemini")})
+
+    class StubOrchestrator:
+        def __init__(self):
+            self.governor = governor
+
+        async def process(self, user_input, local_files=None, run_id=None):
+            async with governor.limiter("gemini").limit():
+                pass
+            return SimpleNamespace(
+                file_path=None, url=None, content="done", metadata={"run_id": "r1"}
+            )
+
+    manifest_path = tmp_path / "manifest.jsonl"
+    entries = asyncio.run(
+        run_batch(StubOrchestrator(), [BatchJob(topic="Topic")], manifest_path=str(manifest_path))
+    )
+
+    assert entries[0]["rate_limits"]["gemini"]["total_calls"] == 1
+    line = json.loads(manifest_path.read_text(encoding="utf-8").splitlines()[0])
+    assert line["rate_limits"]["gemini"]["throttled_calls"] == 0
@@ -0,0 +1,122 @@
+"""Tests for the research agent's concurrent search fan-out."""
+
+import asyncio
+import time
+
+from ai_doc_orchestrator.agents.research import ResearchAgent
+from ai_doc_orchestrator.models import AgentMessage
+
+# Per-query search latency in seconds; None makes the search fail
+LATENCIES = {
+    "slow query": 0.4,
+    "failing query": None,
+    "fast query": 0.1,
+    "medium query": 0.25,
+}
+
+# Text shared by every query's first result (a page all searches find)
+SHARED_CONTENT = "Shared overview: " + " ".join(f"overview-{i}" for i in range(40))
+
+
+class StubSearchTool:
+    """Search tool that sleeps like a remote API.
+
+    Each query returns its own source; with shared=True it first returns a copy
+    of the same page, titled after the query, at the same URL.
+    """
+
+    def __init__(self, latencies, shared=False):
+        self.latencies = latencies
+        self.shared = shared
+
+    def search(self, query, max_results=5, **kwargs):
+        latency = self.latencies[query]
+        if latency is None:
+            raise RuntimeError("search provider unavailable")
+        time.sleep(latency)
+        results = [{
+            "title": f"{query} own",
+            "url": f"https://example.com/{query.replace(' ', '-')}",
+            "content": f"Results for {query}: " + " ".join(f"{query}-{i}" for i in range(40)),
+            "score": 0.9,
+        }]
+        if self.shared:
+            results.insert(0, {
+                "title": query,
+                "url": "https://example.com/overview",
+                "content": SHARED_CONTENT,
+                "score": 0.8,
+            })
+        return results
+
+
+def make_agent(latencies=LATENCIES, shared=False) -> ResearchAgent:
+    agent = ResearchAgent(gemini_api_key="test-key", search_timeout=5.0)
+    agent.set_search_tool(StubSearchTool(latencies, shared))
+
+    async def queries(system_prompt, user_prompt, temperature=0.7, step=None):
+        return "\n".join(latencies)
+
+    agent._acall_llm = queries
+    return agent
+
+
+def message() -> AgentMessage:
+    return AgentMessage(
+        from_agent="test", to_agent="ResearchAgent", phase="research", data={"topic": "stubs"}
+    )
+
+
+def research(latencies=LATENCIES, shared=False):
+    start = time.perf_counter()
+    result = asyncio.run(make_agent(latencies, shared).process(message()))
+    return result, time.perf_counter() - start
+
+
+def test_searches_run_concurrently():
+    _, elapsed = research()
+
+    slowest = max(latency for latency in LATENCIES.values() if latency)
+    total = sum(latency for latency in LATENCIES.values() if latency)
+    assert elapsed < slowest + (total - slowest) / 2
+
+
+def test_results_keep_query_order_and_skip_failures():
+    result, _ = research()
+
+    raw_data = result["raw_data"]
+    assert raw_data["search_queries"] == list(LATENCIES)
+    assert [source["title"] for source in raw_data["sources"]] == [
+        "slow query own",
+        "fast query own",
+        "medium query own",
+    ]
+
+
+def test_duplicates_resolve_the_same_way_whatever_finishes_first():
+    first, _ = research({"q one": 0.2, "q two": 0.0}, shared=True)
+    second, _ = research({"q one": 0.0, "q two": 0.2}, shared=True)
+
+    titles = [source["title"] for source in first["raw_data"]["sources"]]
+    assert titles == ["q one", "q one own", "q two own"]
+    assert second["raw_data"]["sources"] == first["raw_data"]["sources"]
+
+
+def test_streamed_sources_arrive_in_completion_order():
+    async def collect():
+        return [event async for event in make_agent().stream(message())]
+
+    events = asyncio.run(collect())
+
+    assert [event.type for event in events] == ["sources"] * 4 + ["result"]
+    assert [event.data["query"] for event in events[:-1]] == [
+        "failing query",
+        "fast query",
+        "medium query",
+        "slow query",
+    ]
+    streamed = [source for event in events[:-1] for source in event.data["sources"]]
+    final = events[-1].data["raw_data"]["sources"]
+    assert sorted(source["url"] for source in streamed) == sorted(
+        source["url"] for source in final
+    )
@@ -0,0 +1,49 @@
+"""Tests for splitting drafts into anchored sections."""
+
+from ai_doc_orchestrator.sections import PREAMBLE_ANCHOR, join_sections, split_sections
+
+
+def test_draft_without_headings_is_one_preamble_section():
+    sections = split_sections("Just a paragraph.\n\nAnd another one.")
+
+    assert [(section.anchor, section.heading) for section in sections] == [
+        (PREAMBLE_ANCHOR, "")
+    ]
+    assert sections[0].content == "Just a paragraph.\n\nAnd another one."
+
+
+def test_empty_draft_has_no_sections():
+    assert split_sections("") == []
+
+
+def test_sections_split_at_top_level_headings_and_keep_subheadings():
+    draft = (
+        "Intro text.\n\n# Knapsack Basics\n\nBody.\n\n### Details\n\nMore.\n\n"
+        "## Greedy Methods\n\nEnd."
+    )
+
+    sections = split_sections(draft)
+
+    assert [section.anchor for section in sections] == [
+        PREAMBLE_ANCHOR, "knapsack-basics", "greedy-methods"
+    ]
+    assert "### Details" in sections[1].content
+    assert join_sections(sections) == draft
+
+
+def test_duplicate_headings_get_numbered_anchors():
+    draft = "## Examples\n\nOne.\n\n## Examples\n\nTwo.\n\n## Examples\n\nThree."
+
+    sections = split_sections(draft)
+
+    assert [section.anchor for section in sections] == ["examples", "examples-2", "examples-3"]
+    assert [section.heading for section in sections] == ["Examples"] * 3
+
+
+def test_heading_inside_fenced_code_block_does_not_split():
+    draft = "# Setup\n\n```bash\n# install the package\npip install knapsack\n```\n\nDone."
+
+    sections = split_sections(draft)
+
+    assert [section.anchor for section in sections] == ["setup"]
+    assert "# install the package" in sections[0].content